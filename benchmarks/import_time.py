@@ -0,0 +1,64 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+REPO_DIR = Path(__file__).parent.parent
+
+# Import statements timed in fresh interpreters. 'eager dependencies' is what 'import sciplot' cost before lazy imports
+IMPORT_STATEMENT_DICT = {
+    'sciplot': 'import sciplot',
+    'sciplot with style()': "import sciplot\nwith sciplot.style('no-latex', 'C'):\n    pass",
+    'eager dependencies': 'import matplotlib.pyplot, seaborn, yaml',
+}
+
+TIMER_TEMPLATE = '''import time
+t_start = time.perf_counter()
+{statement}
+print(time.perf_counter() - t_start)
+'''
+
+
+def time_import(statement, repeat_no):
+    code = TIMER_TEMPLATE.format(statement=statement)
+    duration_lst = []
+    for _ in range(repeat_no):
+        output = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=str(REPO_DIR),
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True
+        ).stdout
+        duration_lst.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(duration_lst)
+
+
+def main(repeat_no, json_output):
+    result_dict = {}
+    for name, statement in IMPORT_STATEMENT_DICT.items():
+        result_dict[name] = time_import(statement, repeat_no)
+
+    if json_output:
+        print(json.dumps(result_dict, indent=2))
+        return
+
+    print('{0:<30}{1:>12}'.format('Import', 'Median (ms)'))
+    print('-' * 42)
+    for name, duration in result_dict.items():
+        print('{0:<30}{1:>12.1f}'.format(name, duration * 1e3))
+    print('-' * 42)
+    print('Speedup of import sciplot: {0:.1f}x'.format(
+        result_dict['eager dependencies'] / result_dict['sciplot']))
+
+
+if __name__ == '__main__':
+    PARSER = argparse.ArgumentParser(description='Measure the import time of sciplot in fresh interpreters')
+    PARSER.add_argument('-n', '--repeat', type=int, default=5, help='Number of interpreters per statement')
+    PARSER.add_argument('--json', action='store_true', help='Print results as JSON')
+    ARGS = PARSER.parse_args()
+
+    main(ARGS.repeat, ARGS.json)
@@ -0,0 +1,241 @@
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import import_time
+
+REPO_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+import matplotlib  # noqa: E402
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+import sciplot  # noqa: E402
+import sciplot.main  # noqa: E402
+import sciplot.palettes  # noqa: E402
+import sciplot.samples  # noqa: E402
+
+BASELINE_FILE_PATH = Path(__file__).parent / 'baseline.json'
+
+# Locale used by all style() calls, available on every platform
+LOCALE_SETTING = 'C'
+
+# Arguments of get_color_lst() calls, covering the cached, cubehelix, Seaborn LUT and dark mode code paths
+COLOR_ARGUMENT_LST = [
+    (color_no, color_map, colorful)
+    for color_no in range(1, 11)
+    for color_map in ('cubehelix', 'rocket', 'mako', 'viridis')
+    for colorful in (False, True)
+]
+
+SAMPLE_PLOT_DICT = {
+    'line': sciplot.samples.line_plot,
+    'histogram': sciplot.samples.histogram_plot,
+}
+
+
+def time_func(func, repeat_no, call_no=1, warmup_no=1):
+    # Fastest time of one call, out of repeat_no timed runs of call_no calls each. The minimum is the least affected by
+    # other load on the machine
+    for _ in range(warmup_no):
+        func()
+
+    duration_lst = []
+    for _ in range(repeat_no):
+        time_start = time.perf_counter()
+        for _ in range(call_no):
+            func()
+        duration_lst.append((time.perf_counter() - time_start) / call_no)
+    return min(duration_lst)
+
+
+# Benchmarks are functions that take the number of timed runs and return the duration of one call in seconds, so that
+# only the benchmarks selected by name are run
+
+
+def get_import_benchmark_dict():
+    return {'import sciplot': lambda repeat_no: import_time.time_import('import sciplot', repeat_no)}
+
+
+def get_style_benchmark_dict():
+    benchmark_dict = {}
+    for theme in sciplot.get_theme_priority_lst():
+        def enter_exit(theme=theme):
+            with sciplot.style(theme, LOCALE_SETTING):
+                pass
+
+        def enter_exit_cold(enter_exit=enter_exit):
+            sciplot.clear_theme_cache()
+            enter_exit()
+
+        benchmark_dict['style ' + theme] = lambda repeat_no, func=enter_exit: time_func(func, repeat_no, call_no=20)
+        benchmark_dict['style ' + theme + ' (cold)'] = (
+            lambda repeat_no, func=enter_exit_cold: time_func(func, repeat_no, call_no=20))
+
+    # Exported themes, which skip the resolution of parameter files
+    for file_type in ('mplstyle', 'pickle'):
+        def time_exported_cold(repeat_no, file_type=file_type):
+            with tempfile.TemporaryDirectory() as theme_directory:
+                theme_file_path = sciplot.export_theme('default', Path(theme_directory) / ('default.' + file_type))
+
+                def enter_exit_exported_cold():
+                    sciplot.clear_theme_cache()
+                    with sciplot.style(theme_file_path, LOCALE_SETTING):
+                        pass
+
+                return time_func(enter_exit_exported_cold, repeat_no, call_no=20)
+
+        benchmark_dict['style default (' + file_type + ', cold)'] = time_exported_cold
+
+    return benchmark_dict
+
+
+def get_color_lst_benchmark_dict():
+    def get_color_lsts():
+        for color_argument in COLOR_ARGUMENT_LST:
+            sciplot.get_color_lst(*color_argument)
+
+    def get_color_lsts_cold():
+        sciplot.main._get_color_tpl.cache_clear()
+        sciplot.palettes._get_palette_tpl.cache_clear()
+        get_color_lsts()
+
+    # Time per call of get_color_lst()
+    return {
+        'get_color_lst': lambda repeat_no: time_func(get_color_lsts, repeat_no, call_no=20) / len(COLOR_ARGUMENT_LST),
+        'get_color_lst (cold)': (
+            lambda repeat_no: time_func(get_color_lsts_cold, repeat_no, call_no=20) / len(COLOR_ARGUMENT_LST)),
+    }
+
+
+def get_render_benchmark_dict(usetex):
+    benchmark_dict = {}
+    for plot_name, plot_func in SAMPLE_PLOT_DICT.items():
+        def time_render_save(repeat_no, plot_name=plot_name, plot_func=plot_func):
+            with tempfile.TemporaryDirectory() as save_directory:
+                def render_save():
+                    with sciplot.style('default', LOCALE_SETTING, latex='on' if usetex else 'off'):
+                        fig = plot_func()
+                        sciplot.save_time_stamped_figure(plot_name, save_directory, fig=fig)
+                        plt.close(fig)
+
+                return time_func(render_save, repeat_no)
+
+        benchmark_dict['render ' + plot_name + (' (usetex)' if usetex else ' (mathtext)')] = time_render_save
+
+    return benchmark_dict
+
+
+def run_benchmarks(repeat_no, name_filter=None):
+    benchmark_dict = {}
+    benchmark_dict.update(get_import_benchmark_dict())
+    benchmark_dict.update(get_style_benchmark_dict())
+    benchmark_dict.update(get_color_lst_benchmark_dict())
+    benchmark_dict.update(get_render_benchmark_dict(usetex=False))
+    benchmark_dict.update(get_render_benchmark_dict(usetex=True))
+
+    # Benchmarks are filtered by name before any of them is run
+    if name_filter is not None:
+        benchmark_dict = {name: benchmark for name, benchmark in benchmark_dict.items() if name_filter in name}
+
+    result_dict = {}
+    for name, benchmark in benchmark_dict.items():
+        if name.endswith('(usetex)') and not sciplot.is_tex_available():
+            print('Skipping ' + name + ', LaTeX is not installed', file=sys.stderr)
+            continue
+        result_dict[name] = benchmark(repeat_no)
+
+    return {
+        'python': platform.python_version(),
+        'matplotlib': matplotlib.__version__,
+        'platform': platform.platform(),
+        'results': result_dict,
+    }
+
+
+def compare(result_dict, baseline_dict, tolerance):
+    # Returns the names of benchmarks that are slower than their baseline by more than the tolerance
+    regression_lst = []
+    print('{0:<36}{1:>14}{2:>14}{3:>10}'.format('Benchmark', 'Baseline (µs)', 'Current (µs)', 'Ratio'))
+    print('-' * 74)
+    for name, duration in result_dict.items():
+        if name not in baseline_dict:
+            print('{0:<36}{1:>14}{2:>14.1f}{3:>10}'.format(name, '-', duration * 1e6, 'new'))
+            continue
+
+        ratio = duration / baseline_dict[name]
+        flag = ''
+        if ratio > 1 + tolerance:
+            flag = '  REGRESSION'
+            regression_lst.append(name)
+        print('{0:<36}{1:>14.1f}{2:>14.1f}{3:>10.2f}{4}'.format(
+            name, baseline_dict[name] * 1e6, duration * 1e6, ratio, flag))
+    print('-' * 74)
+
+    return regression_lst
+
+
+def main(repeat_no, json_output, output_file_path, baseline_file_path, tolerance, update_baseline, name_filter):
+    benchmark_dict = run_benchmarks(repeat_no, name_filter)
+
+    if output_file_path is not None:
+        Path(output_file_path).write_text(json.dumps(benchmark_dict, indent=2) + '\n')
+    if json_output:
+        print(json.dumps(benchmark_dict, indent=2))
+
+    if update_baseline:
+        # With a filter, only the selected benchmarks of an existing baseline are replaced
+        if name_filter is not None and Path(baseline_file_path).is_file():
+            result_dict = json.loads(Path(baseline_file_path).read_text())['results']
+            result_dict.update(benchmark_dict['results'])
+            benchmark_dict = dict(benchmark_dict, results=result_dict)
+        Path(baseline_file_path).write_text(json.dumps(benchmark_dict, indent=2) + '\n')
+        print('Baseline written to ' + str(baseline_file_path), file=sys.stderr)
+        return 0
+
+    if not Path(baseline_file_path).is_file():
+        print('No baseline at ' + str(baseline_file_path) + ', run with --update-baseline', file=sys.stderr)
+        return 0
+
+    baseline_benchmark_dict = json.loads(Path(baseline_file_path).read_text())
+    # Timings are absolute, so a baseline is only comparable on the machine and versions it was recorded with
+    for key in ('python', 'matplotlib', 'platform'):
+        if baseline_benchmark_dict.get(key) != benchmark_dict[key]:
+            print('Warning: baseline recorded with ' + key + ' ' + str(baseline_benchmark_dict.get(key)) + ', not ' +
+                  benchmark_dict[key] + '. Record a local baseline with --update-baseline', file=sys.stderr)
+    regression_lst = compare(benchmark_dict['results'], baseline_benchmark_dict['results'], tolerance)
+    if regression_lst:
+        print(str(len(regression_lst)) + ' benchmark(s) regressed by more than ' + str(int(tolerance * 100)) + ' %: ' +
+              ', '.join(regression_lst), file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    PARSER = argparse.ArgumentParser(description='Benchmark sciplot and compare the results against a baseline')
+    PARSER.add_argument('-n', '--repeat', type=int, default=5, help='Number of timed runs per benchmark')
+    PARSER.add_argument('--json', action='store_true', help='Print results as JSON')
+    PARSER.add_argument('-o', '--output', default=None, help='Write results as JSON to this file')
+    PARSER.add_argument('--baseline', default=str(BASELINE_FILE_PATH), help='Baseline JSON file to compare against')
+    PARSER.add_argument('--tolerance', type=float, default=0.5,
+                        help='Allowed relative slowdown before a benchmark counts as a regression')
+    PARSER.add_argument('--update-baseline', action='store_true', help='Store the results as the new baseline')
+    PARSER.add_argument('-k', '--filter', default=None, help='Only keep benchmarks whose name contains this string')
+    ARGS = PARSER.parse_args()
+
+    sys.exit(main(
+        ARGS.repeat,
+        ARGS.json,
+        ARGS.output,
+        ARGS.baseline,
+        ARGS.tolerance,
+        ARGS.update_baseline,
+        ARGS.filter
+    ))
@@ -1 +1,13 @@
 from sciplot.main import *  # noqa F401
+from sciplot.batch import RenderJob, RenderResult, render_many  # noqa F401
+from sciplot.decimation import decimate, plot_decimated  # noqa F401
+from sciplot.histogram import histogram_counts, plot_histogram  # noqa F401
+from sciplot.live import LivePlot  # noqa F401
+from sciplot.saving import (  # noqa F401
+    FigureWriter,
+    save_time_stamped_figure_async,
+    save_time_stamped_figure_background
+)
+from sciplot.template import FigureTemplate  # noqa F401
+from sciplot.tex import get_tex_cache_dir, use_tex_cache, warm_tex_cache  # noqa F401
+from sciplot.text_cache import TextExtentCacheInfo, clear_text_extent_cache, get_text_extent_cache_info  # noqa F401
@@ -0,0 +1,40 @@
+import importlib
+import threading
+
+
+# Module proxy that defers the actual import until an attribute is first accessed
+class LazyModule:
+    def __init__(
+            self,
+            module_name: str
+    ):
+        self._module_name = module_name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._module_name)
+        return self._module
+
+    def __getattr__(
+            self,
+            name: str
+    ):
+        module = self._load()
+        try:
+            return getattr(module, name)
+        except AttributeError:
+            # Submodules, e.g. matplotlib.style, are imported on first access as well
+            try:
+                return importlib.import_module(self._module_name + '.' + name)
+            except ImportError:
+                raise AttributeError(
+                    "module '" + self._module_name + "' has no attribute '" + name + "'") from None
+
+    def __repr__(self) -> str:
+        if self._module is None:
+            return "<lazy module '" + self._module_name + "'>"
+        return repr(self._module)
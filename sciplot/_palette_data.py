@@ -0,0 +1,125 @@
+# Colormap and palette data from Seaborn (BSD-3-Clause license, Copyright (c) 2012-2023 Michael L. Waskom)
+
+# 256-entry lookup tables of Seaborn's perceptually uniform colormaps, as concatenated 8-bit RGB hex values
+SEABORN_LUT_HEX_DICT = {
+    'rocket': (
+        '03051a04051a05061b06071c07071d08081e0a091f0b09200d0a210e0b22100b23110c24130d25140e26160e27170f28180f291a102a'
+        '1b112b1d112c1e122d20122e2113302213312414322514332715342815352a16362b16372d17382e173930173a31183b33183c34193d'
+        '35193e37193f381a403a1a413c1a423d1a423f1b43401b44421b45431c46451c47461c48481c48491d494b1d4a4c1d4b4e1d4b501d4c'
+        '511e4d531e4d541e4e561e4f581e4f591e505b1e515c1e515e1f52601f52611f53631f53641f54661f54681f55691f556b1f566d1f56'
+        '6e1f57701f57711f57731f58751f58761f58781f597a1f597b1f597d1f5a7f1e5a811e5a821e5a841e5a861e5b871e5b891e5b8b1d5b'
+        '8c1d5b8e1d5b901d5b921c5b931c5b951c5b971c5b981b5b9a1b5b9c1b5b9e1a5b9f1a5ba11a5ba3195ba4195ba6195aa8185aaa185a'
+        'ab185aad1759af1759b01759b21758b41658b51657b71657b91657ba1656bc1656bd1655bf1654c11754c21753c41753c51852c71951'
+        'c81951ca1a50cb1b4fcd1c4ece1d4ecf1e4dd11f4cd2204cd3214bd5224ad62449d72549d82748d92847db2946dc2b46dd2c45de2e44'
+        'df2f44e03143e13342e23442e33641e43841e53940e63b40e73d3fe83f3fe8403ee9423eea443eeb463eeb483eec4a3eec4c3eed4e3e'
+        'ed503eee523fee543fef5640ef5840ef5a41f05c42f05e42f06043f16244f16445f16646f26747f26948f26b49f26d4bf26f4cf3714d'
+        'f3734ef37450f37651f37852f47a54f47c55f47d57f47f58f4815af4835bf4845df4865ef58860f58a61f58b63f58d64f58f66f59067'
+        'f59269f5946bf5966cf5976ef59970f69b71f69c73f69e75f6a077f6a178f6a37af6a47cf6a67ef6a880f6a981f6ab83f6ad85f6ae87'
+        'f6b089f6b18bf6b38df6b48ff6b691f6b893f6b995f6bb97f6bc99f6be9bf6bf9df6c19ff7c2a2f7c4a4f7c6a6f7c7a8f7c9aaf7caac'
+        'f7ccaff7cdb1f7cfb3f7d0b5f8d1b8f8d3baf8d4bcf8d6bef8d7c0f8d9c3f8dac5f8dcc7f9ddc9f9dfcbf9e0cdf9e2d0f9e3d2f9e5d4'
+        'fae6d6fae8d8fae9dafaebdd'
+    ),
+    'mako': (
+        '0b04050d04060e05080f060910060a11070c12080d13090f140910150a12160b13170c15180d16190e181a0e191b0f1a1c101c1d111d'
+        '1e111f1f122020132221142322142523152624162825172926172b27182d28192e291930291a312a1b332b1c352c1c362d1d382e1e39'
+        '2e1e3b2f1f3d30203e31214031214232224333234534244734254835254a35264c36274d37284f372851382953382a54392b563a2c58'
+        '3a2c593b2d5b3b2e5d3b2f5f3c30603c31623d31643d32663e33673e34693e356b3f366d3f366f3f3770403872403974403a76403b78'
+        '403c79413d7b413e7d413e7f413f8041408241418441428541438741448840468a40478b40488d40498e3f4a8f3f4b903f4c923e4d93'
+        '3e4f943e50953d51953d52963c53973c55983b56983b57993b589a3a599a3a5b9b3a5c9b395d9c395e9c385f9c38619d38629d38639d'
+        '37649e37659e37669e37689f36699f366a9f366b9f366ca0366da0366fa03670a03671a03572a13573a13574a13575a13576a23578a2'
+        '3579a2357aa2357ba3357ca3357da3357ea4347fa43480a43482a43483a53484a53485a53486a53487a63488a63489a6348ba6348ca7'
+        '348da7348ea7348fa73490a83491a83492a83493a83495a93496a93497a93498a93499aa349aaa359baa359caa359eaa359fab35a0ab'
+        '35a1ab36a2ab36a3ab36a4ab37a5ac37a6ac37a8ac38a9ac38aaac39abac39acac3aadac3aaead3bafad3cb1ad3cb2ad3db3ad3eb4ad'
+        '3fb5ad3fb6ad40b7ad41b8ad42b9ad43baad44bcad45bdad46bead47bfad48c0ad49c1ad4bc2ad4cc3ad4dc4ad4fc5ad50c6ad52c7ad'
+        '53c9ad55caad57cbad59ccad5bcdad5ecdad60ceac62cfac65d0ad68d1ad6ad2ad6dd3ad70d4ad73d4ad76d5ae79d6ae7cd6af7fd7af'
+        '82d8b085d9b188d9b18bdab28edbb391dbb494dcb596ddb599ddb69cdeb79edfb8a1dfb9a4e0bba6e1bca9e1bdabe2beaee3c0b0e4c1'
+        'b2e4c2b5e5c4b7e6c5b9e6c7bbe7c8bee8cac0e9ccc2e9cdc4eacfc6ebd1c8ecd2caedd4ccedd6ceeed7d0efd9d2f0dbd4f1dcd6f1de'
+        'd8f2e0daf3e1dcf4e3def5e5'
+    ),
+    'flare': (
+        'edb081edaf80edae7fedad7fedac7eedab7eecaa7deca97ceca87ceca77beca67beca57aeca479eca379eca278eca178eca077ec9f76'
+        'eb9e76eb9d75eb9c75eb9b74eb9a73eb9973eb9972eb9872eb9771ea9671ea9570ea946fea936fea926eea916eea906dea8f6cea8e6c'
+        'e98d6be98c6be98b6ae98a6ae98969e98868e98768e98667e88567e88466e88366e88265e88165e88064e87f64e77e63e77d63e77c63'
+        'e77b62e77a62e67961e67861e67760e67660e67560e5745fe5735fe5725fe5715ee5705ee46f5ee46e5ee46d5de46c5de36b5de36a5d'
+        'e3695de3685ce2675ce2665ce2655ce1645ce1635ce1625ce0615ce0605ce05f5cdf5f5cdf5e5cde5d5cde5c5cde5b5cdd5a5cdd595c'
+        'dc585cdc575cdb565ddb565dda555dda545dd9535dd9525ed8525ed7515ed7505ed64f5fd64f5fd54e5fd44d60d44c60d34c60d24b60'
+        'd24a61d14a61d04962d04962cf4862ce4763cd4763cc4663cc4664cb4564ca4564c94465c84465c84365c74366c64366c54266c44267'
+        'c34167c24167c14168c14068c04068bf4069be3f69bd3f69bc3f69bb3f6aba3e6ab93e6ab83e6bb73d6bb63d6bb53d6bb43d6bb33c6c'
+        'b23c6cb13c6cb13c6cb03b6daf3b6dae3b6dad3b6dac3a6dab3a6daa3a6ea93a6ea8396ea7396ea6396ea5396ea4386fa3386fa2386f'
+        'a1386fa1376fa0376f9f376f9e37709d36709c36709b36709a3670993570983570973570963570953470943470943471933471923371'
+        '9133719033718f33718e32718d32718c32718b32718a3171893171883171873171873171863071853071843071833070822f70812f70'
+        '802f707f2f707e2f707d2e707c2e707b2e707a2e70792e6f782e6f772d6f762d6f752d6f752d6f742d6e732c6e722c6e712c6e702c6e'
+        '6f2c6d6e2c6d6d2b6d6c2b6d6b2b6c6a2b6c692b6c682a6c672a6b662a6b652a6b642a6a642a6a63296a62296a6129696029695f2969'
+        '5e28685d28685c28685b28675a27675927675827665827665727665626665526655426655326655225645125645025644f24634f2463'
+        '4e24634d24634c23624b2362'
+    ),
+    'crest': (
+        'a5cd90a4cc90a3cc91a2cb91a0cb919fca919eca919dc9919cc8919bc8919ac79199c79198c69196c69195c59194c59193c49192c491'
+        '91c39190c3918fc2918ec2918dc1918bc1918ac09189bf9188bf9187be9186be9185bd9184bd9182bc9181bc9180bb917fbb917eba91'
+        '7dba917cb9917bb99179b89178b89177b79176b79175b69074b69073b59072b49071b49070b3906fb3906eb2906db2906cb1906bb190'
+        '6ab09069b09068af9067ae9066ae9065ad9064ad9063ac9062ac9062ab9061aa9060aa905fa9905ea9905da8905ca8905ba7905ba690'
+        '5aa69059a59058a59057a49057a49056a39055a29054a29053a19053a19052a090519f90509f90509e904f9e904e9d904e9d904d9c90'
+        '4c9b904b9b904b9a8f4a9a8f49998f49988f48988f47978f47978f46968f45958f45958f44948f43948f43938f42928f41928f41918f'
+        '40918f40908e3f8f8e3e8f8e3e8e8e3d8e8e3c8d8e3c8c8e3b8c8e3a8b8e3a8b8e398a8e388a8e38898e37888e37888d36878d35878d'
+        '35868d34858d33858d33848d32848d31838d31828d30828d2f818d2f818d2e808d2d808c2d7f8c2c7e8c2c7e8c2b7d8c2a7d8c2a7c8c'
+        '297b8c287b8c287a8c277a8c27798c26788c25788c25778c24778b24768b23758b23758b22748b22748b21738b21728b20728b20718b'
+        '20718b1f708b1f6f8a1e6f8a1e6e8a1e6d8a1e6d8a1d6c8a1d6c8a1d6b8a1d6a8a1d6a8a1c69891c68891c68891c67891c66891c6689'
+        '1c65891c64881c64881c63881d63881d62881d61881d61871d60871d5f871d5f871e5e871e5d861e5d861e5c861e5b861f5b861f5a85'
+        '1f59851f5985205885205784205784205684215584215583215483225383225283225282225182235082235081234f81244e81244e80'
+        '244d80254c80254c7f254b7f254a7f26497e26497e26487e27477d27477d27467c27457c28457c28447b28437b28427a29427a29417a'
+        '2940792940792a3f782a3e782a3d782a3d772a3c772a3b762b3b762b3a762b39752b38752b38752b37742b36742c35742c35732c3473'
+        '2c33732c32722c31722c3172'
+    ),
+    'vlag': (
+        '2369bd266abd296cbc2c6dbc2f6ebc316fbc3470bc3671bc3972bc3b73bc3d74bc3f75bc4276bc4477bc4678bc4879bc4a7bbc4c7cbc'
+        '4e7dbc507ebc517fbc5380bc5581bc5782bc5983bd5b84bd5c85bd5e86bd6087bd6288bd6489be658abe678bbe698cbe6a8dbf6c8ebf'
+        '6e90bf6f91bf7192c07393c07594c07695c17896c17997c17b98c27d99c27e9ac2809bc3829cc3839dc4859ec487a0c488a1c58aa2c5'
+        '8ba3c68da4c68fa5c790a6c792a7c893a8c895a9c897abc998acc99aadca9baecb9dafcb9fb0cca0b1cca2b2cda3b4cda5b5cea7b6ce'
+        'a8b7cfaab8d0abb9d0adbbd1afbcd1b0bdd2b2bed3b3bfd3b5c0d4b7c2d5b8c3d5bac4d6bbc5d7bdc6d7bfc8d8c0c9d9c2cadac3cbda'
+        'c5cddbc7cedcc8cfddcad0ddcbd1decdd3dfcfd4e0d0d5e0d2d7e1d4d8e2d5d9e3d7dae4d9dce5dadde5dcdee6dde0e7dfe1e8e1e2e9'
+        'e2e3eae4e5ebe6e6ece7e7ece9e9edebeaeeecebefeeedf0efeef1f1eff2f2f0f2f3f1f3f5f2f4f6f3f4f7f4f4f8f4f5f9f5f5f9f5f5'
+        'faf5f5faf5f5faf5f4faf5f4faf4f3faf3f3faf3f2faf2f1faf0eff9efeef9eeedf8edebf7ebeaf7eae8f6e8e7f5e7e5f5e5e4f4e3e2'
+        'f3e2e0f2e0dff2dfddf1dddbf0dbdaefdad8efd8d6eed7d5edd5d3ecd3d2ecd2d0ebd0ceeacfcdeacdcbe9cbc9e8cac8e7c8c6e7c7c5'
+        'e6c5c3e5c3c1e5c2c0e4c0bee3bfbde3bdbbe2bcb9e1bab8e1b9b6e0b7b5dfb5b3dfb4b2deb2b0deb1aeddafaddcaeabdcacaadbaba8'
+        'daa9a7daa8a5d9a6a4d9a5a2d8a3a0d7a29fd7a09dd69f9cd59d9ad59c99d49a97d49896d39794d29593d29491d19290d1918ed08f8d'
+        'cf8e8bcf8c8ace8b88cd8987cd8885cc8784cc8582cb8481ca827fca817ec97f7dc87e7bc87c7ac77b78c77977c67875c57674c57572'
+        'c47371c3726fc3706ec26f6dc16d6bc16c6ac06a68c06967bf6765be6664be6463bd6361bc6160bc605ebb5e5dba5d5cb95b5ab95a59'
+        'b85857b75756b75555b65453b55252b55151b44f4fb34d4eb24c4cb24a4bb1494ab04748af4647af4446ae4244ad4143ac3f42ac3e40'
+        'ab3c3faa3a3ea9393ca9373b'
+    ),
+    'icefire': (
+        'bde7dbbae5dab7e3d9b4e1d9b2dfd8afddd7acdbd7a9d9d6a7d7d5a4d5d5a1d3d49ed1d39bcfd398cdd295cbd293cad190c8d18dc6d0'
+        '8ac4d087c2cf84c1cf81bfcf7ebdce7bbbce78b9ce75b8ce72b6ce6eb4cd6bb2cd68b0cd65afcd63adcd60abcd5da9cd5aa7cd58a5cd'
+        '55a3cd53a2cd50a0cd4e9ecd4c9ccd499ace4798ce4596ce4394ce4192ce3f90ce3e8ecf3c8ccf3a89cf3987cf3885d03783d03781d0'
+        '377fd0377cd0377ad03878cf3975cf3a73ce3b71cd3d6ecc3e6ccb3f69c94167c74265c54363c34560c1465ebe475cbc475ab94858b6'
+        '4956b34954b04952ad4a50a94a4fa5494da1494c9e494a9a48499647479247468e46458a45438644428243417f42407b413e773f3d74'
+        '3e3c703d3b6d3c3a693b386639376338365f37355c363459343356333153323050312f4d302e4a2e2d482d2c452c2b422b2a402a293d'
+        '29283b28273927263626253425253224243024232e23222d22222b222129212028212026202025201f241f1f231f1f211f1e211f1e20'
+        '1f1e1f1f1e1e1f1e1e201e1e211e1e221e1e231e1e251e1f261e1f271e1f291e202a1e202c1e212d1f212f1f22311f23332023352024'
+        '3720253921263b21273d22283f222841232943232a46242b48242c4a252e4d252f4f26305227315427325728335a28345c29355f2936'
+        '622937642a38672a396a2b3a6d2b3b702b3c722c3d752c3e782c3f7b2d407e2d40812d41842d42872d428a2e438d2e43902e44932e44'
+        '962e44992e449c2f459f2f44a22f44a52f44a83044ab3043ae3143b13242b33341b63441b93540bb363fbe373ec0393dc33a3cc53c3c'
+        'c73d3bc93f3acc4139ce4338d04537d24737d34936d54b35d74e35d95034da5334dc5534de5733df5a33e15c33e25f33e36233e56433'
+        'e66734e76a34e86d35e96f36ea7238eb753aec783bed7b3eed7e40ee8142ef8445ef8748f0894bf18c4ef18f51f29255f29558f3985b'
+        'f39a5ff49d63f5a066f5a36af6a56df6a871f7ab75f7ae79f8b07cf8b380f9b684fab887fabb8bfbbe8ffbc192fcc396fcc69afdc99e'
+        'fdcca1fecea5fed1a9ffd4ac'
+    ),
+}
+
+# Seaborn's variants of the Matplotlib default color cycle
+SEABORN_PALETTE_DICT = {
+    'deep': ['#4C72B0', '#DD8452', '#55A868', '#C44E52', '#8172B3', '#937860', '#DA8BC3', '#8C8C8C', '#CCB974', '#64B5CD'],
+    'deep6': ['#4C72B0', '#55A868', '#C44E52', '#8172B3', '#CCB974', '#64B5CD'],
+    'muted': ['#4878D0', '#EE854A', '#6ACC64', '#D65F5F', '#956CB4', '#8C613C', '#DC7EC0', '#797979', '#D5BB67', '#82C6E2'],
+    'muted6': ['#4878D0', '#6ACC64', '#D65F5F', '#956CB4', '#D5BB67', '#82C6E2'],
+    'pastel': ['#A1C9F4', '#FFB482', '#8DE5A1', '#FF9F9B', '#D0BBFF', '#DEBB9B', '#FAB0E4', '#CFCFCF', '#FFFEA3', '#B9F2F0'],
+    'pastel6': ['#A1C9F4', '#8DE5A1', '#FF9F9B', '#D0BBFF', '#FFFEA3', '#B9F2F0'],
+    'bright': ['#023EFF', '#FF7C00', '#1AC938', '#E8000B', '#8B2BE2', '#9F4800', '#F14CC1', '#A3A3A3', '#FFC400', '#00D7FF'],
+    'bright6': ['#023EFF', '#1AC938', '#E8000B', '#8B2BE2', '#FFC400', '#00D7FF'],
+    'dark': ['#001C7F', '#B1400D', '#12711C', '#8C0800', '#591E71', '#592F0D', '#A23582', '#3C3C3C', '#B8850A', '#006374'],
+    'dark6': ['#001C7F', '#12711C', '#8C0800', '#591E71', '#B8850A', '#006374'],
+    'colorblind': [
+        '#0173B2', '#DE8F05', '#029E73', '#D55E00', '#CC78BC', '#CA9161', '#FBAFE4', '#949494', '#ECE133', '#56B4E9'
+    ],
+    'colorblind6': ['#0173B2', '#029E73', '#D55E00', '#CC78BC', '#ECE133', '#56B4E9'],
+}
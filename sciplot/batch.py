@@ -0,0 +1,134 @@
+import locale
+import os
+import time
+import traceback
+from typing import Callable, List, NamedTuple, Optional, Sequence, Union
+from sciplot._lazy import LazyModule
+from sciplot.locales import get_locale_entry
+from sciplot.main import (
+    _apply_latex_option,
+    _check_latex_option,
+    _compile_theme,
+    _dark_mode_var,
+    _set_rc_params,
+    save_time_stamped_figure
+)
+from sciplot.tex import use_tex_cache
+from sciplot.tex_fallback import enable_tex_fallback
+from sciplot.text_cache import enable_text_extent_cache
+
+futures = LazyModule('concurrent.futures')
+matplotlib = LazyModule('matplotlib')
+plt = LazyModule('matplotlib.pyplot')
+
+# rcParams of the compiled theme in a render worker, restored after jobs that change them
+_worker_rc_params = None
+
+
+# Plot callable and output file of a figure rendered by render_many(). The callable must be picklable, i.e. defined at
+# module level, and should return the figure to save (the current pyplot figure is saved if it returns None)
+class RenderJob(NamedTuple):
+    plot_func: Callable
+    plot_file_name: str
+    save_directory: str = ''
+    file_type: str = 'png'
+    args: tuple = ()
+    kwargs: Optional[dict] = None
+
+
+# Outcome of a render job. On failure, plot_file_path is None and error holds the formatted traceback
+class RenderResult(NamedTuple):
+    plot_file_name: str
+    plot_file_path: Optional[str]
+    duration: float
+    error: Optional[str]
+
+
+def _init_render_worker(
+        rc_params: dict,
+        theme_dark_mode: bool,
+        locale_setting: str,
+        tex_fallback: bool
+):
+    global _worker_rc_params
+
+    # Apply the theme compiled by render_many() once per worker process, with a non-interactive backend, a shared LaTeX
+    # cache and text extents shared between jobs. Without LaTeX, text is translated to mathtext as in style()
+    matplotlib.use('Agg')
+    use_tex_cache()
+    locale.setlocale(locale.LC_NUMERIC, locale_setting)
+    _set_rc_params(rc_params)
+    _dark_mode_var.set(theme_dark_mode)
+    if tex_fallback:
+        enable_tex_fallback()
+    enable_text_extent_cache()
+
+    _worker_rc_params = dict(matplotlib.rcParams)
+
+
+def _check_locale_setting(
+        locale_setting: str
+):
+    # The locale must also be installed on the system, not only known to sciplot
+    get_locale_entry(locale_setting)
+    previous_locale_setting = locale.setlocale(locale.LC_NUMERIC)
+    try:
+        locale.setlocale(locale.LC_NUMERIC, locale_setting)
+    finally:
+        locale.setlocale(locale.LC_NUMERIC, previous_locale_setting)
+
+
+def _render_job(
+        job: RenderJob
+) -> RenderResult:
+    time_start = time.perf_counter()
+    plot_file_path = None
+    error = None
+    try:
+        fig = job.plot_func(*job.args, **(job.kwargs or {}))
+        plot_file_path = save_time_stamped_figure(
+            job.plot_file_name,
+            save_directory=job.save_directory,
+            file_type=job.file_type,
+            fig=fig
+        )
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        # Release all figures of the job to keep the worker's memory bounded
+        plt.close('all')
+        if dict(matplotlib.rcParams) != _worker_rc_params:
+            _set_rc_params(_worker_rc_params)
+
+    return RenderResult(job.plot_file_name, plot_file_path, time.perf_counter() - time_start, error)
+
+
+def render_many(
+        jobs: Sequence[RenderJob],
+        theme: Union[str, List[str]] = 'default',
+        locale_setting: str = 'sv_SE',
+        workers: int = None,
+        latex: str = 'on'  # 'on', 'auto' or 'off', as in style()
+) -> List[RenderResult]:
+    _check_latex_option(latex)
+    jobs = [job if isinstance(job, RenderJob) else RenderJob(*job) for job in jobs]
+    if not jobs:
+        return []
+
+    # Fail before starting worker processes, whose initialization errors would break the pool for all jobs
+    _check_locale_setting(locale_setting)
+    rc_params, theme_dark_mode = _compile_theme(theme)
+    rc_params, tex_fallback = _apply_latex_option(rc_params, latex)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Send jobs in chunks to reduce inter-process overhead, while keeping all workers busy
+    chunk_size = max(1, len(jobs) // (workers * 4))
+
+    with futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(rc_params, theme_dark_mode, locale_setting, tex_fallback)
+    ) as executor:
+        return list(executor.map(_render_job, jobs, chunksize=chunk_size))
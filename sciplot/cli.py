@@ -0,0 +1,439 @@
+import argparse
+import csv
+import hashlib
+import json
+import locale
+import os
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+from sciplot._lazy import LazyModule
+from sciplot.batch import RenderJob, RenderResult, render_many
+from sciplot.decimation import plot_decimated
+from sciplot.histogram import plot_histogram
+from sciplot.locales import get_locale_entry
+from sciplot.main import SciplotException, _apply_latex_option, _compile_theme, set_legend, set_size_cm
+from sciplot.matrix import main as matrix_main
+
+matplotlib = LazyModule('matplotlib')
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
+plt = LazyModule('matplotlib.pyplot')
+yaml = LazyModule('yaml')
+
+# Format version of incremental state files
+_STATE_VERSION = 1
+
+# Fields of a manifest job and their defaults. Jobs without 'name' or 'data' are invalid
+_JOB_DEFAULT_DICT = {
+    'name': None,
+    'data': None,  # .npy, .csv or .parquet file, or a list of files
+    'plot': 'line',  # 'line', 'scatter' or 'histogram'
+    'theme': 'default',
+    'locale': 'sv_SE',
+    'latex': 'on',  # 'on', 'auto' or 'off', as in style()
+    'size': None,  # width and height in cm, the theme's figure size by default
+    'formats': 'png',
+    'output_dir': '',  # relative to the manifest
+    'title': None,
+    'x_label': None,
+    'y_label': None,
+    'labels': None,  # legend labels of the data series, column names of .csv and .parquet files by default
+    'legend_loc': 'upper right',
+    'bins': 100
+}
+
+# Fields of CSV manifests with several values, separated by ';'
+_CSV_LIST_FIELD_TPL = ('data', 'theme', 'size', 'formats', 'labels')
+
+_PLOT_TYPE_TPL = ('line', 'scatter', 'histogram')
+
+
+def _read_manifest_file(
+        manifest_path: Path
+) -> object:
+    suffix = manifest_path.suffix.lower()
+    try:
+        if suffix == '.json':
+            with manifest_path.open('r', encoding='utf-8') as manifest_file:
+                return json.load(manifest_file)
+        if suffix in ('.yml', '.yaml'):
+            with manifest_path.open('r', encoding='utf-8') as manifest_file:
+                return yaml.safe_load(manifest_file)
+        if suffix == '.csv':
+            with manifest_path.open('r', newline='', encoding='utf-8') as manifest_file:
+                return [
+                    {
+                        field: value.split(';') if field in _CSV_LIST_FIELD_TPL else value
+                        for field, value in row.items() if value not in (None, '')
+                    }
+                    for row in csv.DictReader(manifest_file)
+                ]
+    except FileNotFoundError:
+        raise SciplotException("Manifest file not found: '" + str(manifest_path) + "'")
+
+    raise SciplotException(
+        "Unsupported manifest file type: '" + suffix + "'. Supported types are '.json', '.yml', '.yaml' and '.csv'.")
+
+
+def _get_size(
+        job: dict
+) -> List[float]:
+    # Width, or width and height in cm, as numbers or strings of numbers. A width alone gives a square figure
+    size = job['size']
+    size_lst = list(size) if isinstance(size, (list, tuple)) else [size]
+    try:
+        if not 1 <= len(size_lst) <= 2 or any(isinstance(length, bool) for length in size_lst):
+            raise ValueError
+        return [float(length) for length in size_lst]
+    except (TypeError, ValueError):
+        raise SciplotException(
+            "Invalid size: '" + str(size) + "' in job '" + str(job['name']) +
+            "'. Correct sizes are a width or a list of width and height in cm.")
+
+
+def _get_bins(
+        job: dict
+) -> int:
+    # Number of histogram bins, as a number or a string of a number
+    bins = job['bins']
+    try:
+        if isinstance(bins, bool) or int(bins) != float(bins) or int(bins) < 1:
+            raise ValueError
+        return int(bins)
+    except (TypeError, ValueError):
+        raise SciplotException(
+            "Invalid number of bins: '" + str(bins) + "' in job '" + str(job['name']) +
+            "'. Correct numbers of bins are positive integers.")
+
+
+def _get_job(
+        job_input: dict,
+        default_dict: dict,
+        manifest_directory: Path
+) -> dict:
+    unknown_field_lst = sorted((set(default_dict) | set(job_input)) - set(_JOB_DEFAULT_DICT))
+    if unknown_field_lst:
+        raise SciplotException(
+            "Unknown manifest job fields: '" + "', '".join(unknown_field_lst) + "' in job '" +
+            str(job_input.get('name')) + "'")
+
+    job = dict(_JOB_DEFAULT_DICT)
+    job.update(default_dict)
+    job.update(job_input)
+    if job['name'] is None or job['data'] is None:
+        raise SciplotException("Manifest job without 'name' or 'data': " + str(job_input))
+    if job['plot'] not in _PLOT_TYPE_TPL:
+        raise SciplotException(
+            "Invalid plot type: '" + str(job['plot']) + "' in job '" + str(job['name']) +
+            "'. Correct types are 'line', 'scatter' or 'histogram'.")
+    if job['latex'] not in ('on', 'auto', 'off'):
+        raise SciplotException(
+            "Invalid latex option: '" + str(job['latex']) + "' in job '" + str(job['name']) +
+            "'. Correct options are 'on', 'auto' or 'off'.")
+
+    # Values of CSV manifests are strings
+    job['name'] = str(job['name'])
+    job['locale'] = str(job['locale'])
+    data_lst = job['data'] if isinstance(job['data'], list) else [job['data']]
+    job['data'] = [str(manifest_directory / data) for data in data_lst]
+    job['output_dir'] = str(manifest_directory / job['output_dir'])
+    if job['size'] is not None:
+        job['size'] = _get_size(job)
+    if isinstance(job['labels'], str):
+        job['labels'] = [job['labels']]
+    job['bins'] = _get_bins(job)
+
+    return job
+
+
+def load_manifest(
+        manifest_path: Union[str, Path]
+) -> List[dict]:
+    # A manifest is a list of jobs, or a mapping with a list of 'jobs' and 'defaults' for all jobs. Paths are relative
+    # to the manifest
+    manifest_path = Path(manifest_path)
+    manifest = _read_manifest_file(manifest_path)
+
+    default_dict = {}
+    if isinstance(manifest, dict):
+        default_dict = manifest.get('defaults') or {}
+        manifest = manifest.get('jobs')
+    if not isinstance(manifest, list) or not all(isinstance(job_input, dict) for job_input in manifest):
+        raise SciplotException("Invalid manifest: '" + str(manifest_path) + "'. Expected a list of jobs.")
+
+    job_lst = [_get_job(job_input, default_dict, manifest_path.parent) for job_input in manifest]
+
+    # Fail before any job is rendered
+    for job in job_lst:
+        try:
+            get_locale_entry(job['locale'])
+        except locale.Error as error:
+            raise SciplotException(str(error) + " in job '" + job['name'] + "'")
+
+    name_lst = [job['name'] for job in job_lst]
+    duplicate_name_lst = sorted({name for name in name_lst if name_lst.count(name) > 1})
+    if duplicate_name_lst:
+        raise SciplotException("Duplicate manifest job names: '" + "', '".join(duplicate_name_lst) + "'")
+
+    return job_lst
+
+
+def _load_data(
+        data_path: str
+) -> Tuple['np.ndarray', List[str]]:
+    # Data as a 2D array with one column per series, and the column names if the file has them
+    suffix = Path(data_path).suffix.lower()
+    if suffix == '.npy':
+        data_ar = np.load(data_path, mmap_mode='r')
+        column_name_lst = None
+    elif suffix == '.csv':
+        with open(data_path, 'r', newline='', encoding='utf-8') as data_file:
+            header = next(csv.reader(data_file), [])
+        try:
+            [float(value) for value in header]
+            column_name_lst = None
+        except ValueError:
+            column_name_lst = [column_name.strip() for column_name in header]
+        data_ar = np.loadtxt(data_path, delimiter=',', skiprows=0 if column_name_lst is None else 1, ndmin=2)
+    elif suffix == '.parquet':
+        try:
+            data_frame = pd.read_parquet(data_path)
+        except ImportError:
+            raise SciplotException("Reading '.parquet' files requires pandas with pyarrow or fastparquet")
+        data_ar = data_frame.to_numpy(dtype=float)
+        column_name_lst = [str(column_name) for column_name in data_frame.columns]
+    else:
+        raise SciplotException(
+            "Unsupported data file type: '" + data_path + "'. Supported types are '.npy', '.csv' and '.parquet'.")
+
+    if data_ar.ndim == 1:
+        data_ar = data_ar[:, np.newaxis]
+    return data_ar, column_name_lst
+
+
+def _get_series_lst(
+        job: dict
+) -> Tuple[List[Tuple['np.ndarray', 'np.ndarray']], List[str]]:
+    # (x, y) of every series. Data with several columns has x in the first column, otherwise x is the row index
+    series_lst = []
+    label_lst = []
+    for data_path in job['data']:
+        data_ar, column_name_lst = _load_data(data_path)
+        first_y_column = 0 if job['plot'] == 'histogram' or data_ar.shape[1] == 1 else 1
+        x = np.arange(len(data_ar)) if first_y_column == 0 else data_ar[:, 0]
+        for column in range(first_y_column, data_ar.shape[1]):
+            series_lst.append((x, data_ar[:, column]))
+            label_lst.append(
+                column_name_lst[column] if column_name_lst is not None else Path(data_path).stem + ' ' + str(column))
+
+    if job['labels'] is not None:
+        label_lst = list(job['labels'])
+    return series_lst, label_lst
+
+
+def _plot_job(
+        job: dict
+) -> 'matplotlib.figure.Figure':
+    series_lst, label_lst = _get_series_lst(job)
+
+    if job['size'] is not None:
+        set_size_cm(*job['size'])
+    fig, ax = plt.subplots(1, 1)
+
+    if job['plot'] == 'histogram':
+        _, plot_lst = plot_histogram(ax, [y for _, y in series_lst], bins=job['bins'])
+    elif job['plot'] == 'scatter':
+        plot_lst = [ax.scatter(x, y) for x, y in series_lst]
+    else:
+        plot_lst = [plot_decimated(ax, x, y) for x, y in series_lst]
+
+    if job['title'] is not None:
+        fig.suptitle(job['title'])
+    if job['x_label'] is not None:
+        ax.set_xlabel(job['x_label'])
+    if job['y_label'] is not None:
+        ax.set_ylabel(job['y_label'])
+    if len(plot_lst) > 1 or job['labels'] is not None:
+        set_legend(ax, tuple(plot_lst), tuple(label_lst[:len(plot_lst)]), loc=job['legend_loc'])
+
+    return fig
+
+
+def _get_file_hash(
+        file_path: str,
+        file_hash_dict: Dict[str, dict]
+) -> str:
+    # Content hash of a file, reused from the previous run while its modification time and size are unchanged
+    stat = os.stat(file_path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    file_hash = file_hash_dict.get(file_path)
+    if file_hash is None or file_hash['stamp'] != stamp:
+        content_hash = hashlib.sha256()
+        with open(file_path, 'rb') as data_file:
+            for chunk in iter(lambda: data_file.read(1 << 20), b''):
+                content_hash.update(chunk)
+        file_hash = {'stamp': stamp, 'sha256': content_hash.hexdigest()}
+        file_hash_dict[file_path] = file_hash
+
+    return file_hash['sha256']
+
+
+def _get_theme_hash(
+        theme: Union[str, List[str]],
+        latex: str
+) -> str:
+    # Parameters as applied by the render workers, e.g. without LaTeX if latex is 'auto' and LaTeX is not installed
+    rc_params, theme_dark_mode = _compile_theme(theme)
+    rc_params, tex_fallback = _apply_latex_option(rc_params, latex)
+    return hashlib.sha256(repr((sorted(rc_params.items()), theme_dark_mode, tex_fallback)).encode('utf-8')).hexdigest()
+
+
+def _get_job_key(
+        job: dict,
+        file_hash_dict: Dict[str, dict]
+) -> str:
+    # Hash of everything a job's output depends on: the job itself, the contents of its data files and its theme
+    try:
+        data_hash_lst = [_get_file_hash(data_path, file_hash_dict) for data_path in job['data']]
+    except FileNotFoundError as error:
+        raise SciplotException("Data file not found: '" + str(error.filename) + "' in job '" + job['name'] + "'")
+
+    key = json.dumps([job, data_hash_lst, _get_theme_hash(job['theme'], job['latex'])], sort_keys=True)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def _load_state(
+        state_path: Path
+) -> dict:
+    try:
+        with state_path.open('r', encoding='utf-8') as state_file:
+            state = json.load(state_file)
+        if state.get('version') == _STATE_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'version': _STATE_VERSION, 'jobs': {}, 'files': {}}
+
+
+def _save_state(
+        state_path: Path,
+        state: dict
+):
+    # Write to a temporary file first, so that an interrupted run never leaves a partial state
+    temporary_path = state_path.with_name(state_path.name + '.tmp')
+    with temporary_path.open('w', encoding='utf-8') as state_file:
+        json.dump(state, state_file, indent=2, sort_keys=True)
+    os.replace(str(temporary_path), str(state_path))
+
+
+def _is_job_current(
+        job_state: dict,
+        key: str
+) -> bool:
+    return job_state is not None and job_state['key'] == key and all(
+        Path(plot_file_path).is_file() for plot_file_path in job_state['outputs'])
+
+
+def render_manifest(
+        manifest_path: Union[str, Path],
+        state_path: Union[str, Path] = None,  # next to the manifest by default
+        workers: int = None,
+        force: bool = False  # render all jobs, also unchanged ones
+) -> Tuple[List[RenderResult], List[str]]:
+    # Renders the jobs whose job, data or theme changed since the last run, and returns their results and the names of
+    # the skipped jobs
+    manifest_path = Path(manifest_path)
+    job_lst = load_manifest(manifest_path)
+    if state_path is None:
+        state_path = manifest_path.with_name(manifest_path.stem + '.sciplot-state.json')
+    state_path = Path(state_path)
+    state = _load_state(state_path)
+
+    # Jobs are rendered in one worker pool per theme, locale and LaTeX option, which apply the compiled theme once per
+    # worker
+    key_dict = {}
+    skipped_name_lst = []
+    group_dict = {}
+    for job in job_lst:
+        key = _get_job_key(job, state['files'])
+        if not force and _is_job_current(state['jobs'].get(job['name']), key):
+            skipped_name_lst.append(job['name'])
+            continue
+        key_dict[job['name']] = key
+        Path(job['output_dir']).mkdir(parents=True, exist_ok=True)
+        render_job = RenderJob(_plot_job, job['name'], job['output_dir'], job['formats'], (job,))
+        theme_key = json.dumps(job['theme']), job['locale'], job['latex']
+        group_dict.setdefault(theme_key, (job['theme'], job['locale'], job['latex'], []))[3].append(render_job)
+
+    result_lst = []
+    for theme, locale_setting, latex, render_job_lst in group_dict.values():
+        result_lst += render_many(render_job_lst, theme, locale_setting, workers, latex)
+
+    for result in result_lst:
+        if result.error is None:
+            plot_file_path_lst = result.plot_file_path
+            if isinstance(plot_file_path_lst, str):
+                plot_file_path_lst = [plot_file_path_lst]
+            state['jobs'][result.plot_file_name] = {'key': key_dict[result.plot_file_name], 'outputs': plot_file_path_lst}
+        else:
+            state['jobs'].pop(result.plot_file_name, None)
+
+    # Forget files that are no longer used by any job
+    data_path_set = {data_path for job in job_lst for data_path in job['data']}
+    state['files'] = {data_path: file_hash for data_path, file_hash in state['files'].items() if data_path in data_path_set}
+    _save_state(state_path, state)
+
+    return result_lst, skipped_name_lst
+
+
+def _render_command(
+        args: argparse.Namespace
+) -> int:
+    try:
+        result_lst, skipped_name_lst = render_manifest(args.manifest, args.state, args.workers, args.force)
+    except (SciplotException, locale.Error) as error:
+        print('Error: ' + str(error))
+        return 2
+
+    for name in skipped_name_lst:
+        print('{:<40} unchanged'.format(name))
+    for result in result_lst:
+        if result.error is None:
+            plot_file_path = result.plot_file_path
+            if not isinstance(plot_file_path, str):
+                plot_file_path = ', '.join(plot_file_path)
+            print('{:<40} {:8.3f} s  {}'.format(result.plot_file_name, result.duration, plot_file_path))
+        else:
+            print('{:<40} FAILED\n{}'.format(result.plot_file_name, result.error))
+
+    failed_no = sum(result.error is not None for result in result_lst)
+    print(str(len(result_lst) - failed_no) + ' rendered, ' + str(len(skipped_name_lst)) + ' unchanged, ' +
+          str(failed_no) + ' failed')
+    return 1 if failed_no else 0
+
+
+def main(
+        argv: Sequence[str] = None
+) -> int:
+    parser = argparse.ArgumentParser(prog='sciplot', description='Render sciplot figures from the command line')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    render_parser = subparsers.add_parser(
+        'render', help='render the jobs of a manifest whose data, theme or definition changed since the last run')
+    render_parser.add_argument('manifest', help='manifest of jobs, a .json, .yml, .yaml or .csv file')
+    render_parser.add_argument('--state', default=None,
+                               help='state file of incremental runs, <manifest>.sciplot-state.json by default')
+    render_parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    render_parser.add_argument('--force', action='store_true', help='render all jobs, also unchanged ones')
+
+    subparsers.add_parser(
+        'matrix', add_help=False,
+        help='render the sample plots for all theme combinations, see sciplot matrix --help')
+
+    args, remaining_arg_lst = parser.parse_known_args(argv)
+    if args.command == 'matrix':
+        return matrix_main(remaining_arg_lst, 'sciplot matrix')
+    if remaining_arg_lst:
+        parser.error('unrecognized arguments: ' + ' '.join(remaining_arg_lst))
+    return _render_command(args)
@@ -0,0 +1,133 @@
+from typing import Tuple
+from sciplot._lazy import LazyModule
+
+matplotlib = LazyModule('matplotlib')
+np = LazyModule('numpy')
+
+# Maximum number of points reduced at a time, which bounds the temporary memory of decimate()
+_CHUNK_SIZE = 1 << 22
+
+
+def _get_pixel_edge_ar(
+        ax: 'matplotlib.axes.Axes',
+        oversampling: int
+) -> 'np.ndarray':
+    # x data coordinates of the pixel column edges of the axes, at the larger of the figure and savefig resolutions
+    fig = ax.figure
+    scale = float(oversampling)
+    savefig_dpi = matplotlib.rcParams['savefig.dpi']
+    if savefig_dpi != 'figure' and savefig_dpi > fig.dpi:
+        scale *= savefig_dpi / fig.dpi
+
+    # Agg rasterizes lines with vertices snapped to pixel centres, so the bins are centred on the pixel boundaries
+    x0, x1 = sorted(ax.bbox.intervalx)
+    display_edge_ar = (np.arange(np.floor(x0 * scale) - 1, np.ceil(x1 * scale) + 1) + 0.5) / scale
+    display_ar = np.column_stack([display_edge_ar, np.zeros_like(display_edge_ar)])
+    return np.sort(ax.transData.inverted().transform(display_ar)[:, 0])
+
+
+def _get_extreme_index_ar(
+        y: 'np.ndarray',
+        start_ar: 'np.ndarray',
+        count_ar: 'np.ndarray',
+        extreme_ar: 'np.ndarray'
+) -> 'np.ndarray':
+    # Index of the first occurrence of each segment's extreme value
+    position_ar = np.flatnonzero(y == np.repeat(extreme_ar, count_ar))
+    return position_ar[np.searchsorted(position_ar, start_ar)]
+
+
+def _decimate_by_edges(
+        x: 'np.ndarray',
+        y: 'np.ndarray',
+        edge_ar: 'np.ndarray'
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    # Only sorted data without gaps can be reduced to the first, minimum, maximum and last point per pixel column (M4),
+    # which draws the same line as all points
+    if len(x) <= 4 * len(edge_ar) or x.dtype.kind not in 'iuf' or y.dtype.kind not in 'iuf':
+        return x, y
+    if np.any(x[1:] < x[:-1]) or (y.dtype.kind == 'f' and np.isnan(y).any()):
+        return x, y
+
+    # Points within the edges, and one point on either side so that lines leave the axes at the right angle
+    start = max(np.searchsorted(x, edge_ar[0], 'left') - 1, 0)
+    stop = min(np.searchsorted(x, edge_ar[-1], 'right') + 1, len(x))
+    x = x[start:stop]
+    y = y[start:stop]
+    if len(x) <= 4 * len(edge_ar):
+        return x, y
+
+    # Segments of points per column, without empty columns
+    bound_ar = np.unique(np.concatenate([[0], np.searchsorted(x, edge_ar[1:-1]), [len(x)]]))
+    segment_start_ar = bound_ar[:-1]
+    segment_stop_ar = bound_ar[1:]
+
+    index_ar_lst = []
+    segment = 0
+    while segment < len(segment_start_ar):
+        # Whole segments of at most _CHUNK_SIZE points, or a single larger one
+        chunk_start = segment_start_ar[segment]
+        segment_end = max(np.searchsorted(segment_stop_ar, chunk_start + _CHUNK_SIZE, 'right'), segment + 1)
+        chunk_stop = segment_stop_ar[segment_end - 1]
+
+        y_chunk = y[chunk_start:chunk_stop]
+        start_ar = segment_start_ar[segment:segment_end] - chunk_start
+        count_ar = segment_stop_ar[segment:segment_end] - segment_start_ar[segment:segment_end]
+
+        min_index_ar = _get_extreme_index_ar(y_chunk, start_ar, count_ar, np.minimum.reduceat(y_chunk, start_ar))
+        max_index_ar = _get_extreme_index_ar(y_chunk, start_ar, count_ar, np.maximum.reduceat(y_chunk, start_ar))
+        index_ar = np.sort(np.stack([start_ar, min_index_ar, max_index_ar, start_ar + count_ar - 1], axis=1), axis=1)
+        index_ar_lst.append(index_ar.ravel() + chunk_start)
+
+        segment = segment_end
+
+    index_ar = np.concatenate(index_ar_lst)
+    index_ar = index_ar[np.concatenate([[True], index_ar[1:] != index_ar[:-1]])]
+
+    return x[index_ar], y[index_ar]
+
+
+def decimate(
+        x: 'np.ndarray',
+        y: 'np.ndarray',
+        column_no: int,
+        x_range: Tuple[float, float] = None
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) == 0:
+        return x, y
+    if x_range is None:
+        x_range = (x[0], x[-1])
+
+    return _decimate_by_edges(x, y, np.linspace(x_range[0], x_range[1], column_no + 1))
+
+
+def plot_decimated(
+        ax: 'matplotlib.axes.Axes',
+        x: 'np.ndarray',
+        y: 'np.ndarray',
+        *args,
+        column_no: int = None,
+        oversampling: int = 4,  # columns per pixel, more keep antialiased lines closer to the full data
+        **kwargs
+) -> 'matplotlib.lines.Line2D':
+    # Like ax.plot() for a single line with x in ascending order, but only plots the points that are visible at the
+    # axes' pixel resolution. The points are chosen again for the visible range whenever the x-axis limits change
+    x = np.asarray(x)
+    y = np.asarray(y)
+
+    def get_edge_ar():
+        if column_no is None:
+            return _get_pixel_edge_ar(ax, oversampling)
+        return np.linspace(*sorted(ax.get_xlim()), column_no + 1)
+
+    # Before the limits are known, all data is decimated to the pixel width, which keeps the extremes for autoscaling
+    line, = ax.plot(*decimate(x, y, len(get_edge_ar()) - 1 if column_no is None else column_no), *args, **kwargs)
+
+    def on_xlim_changed(_):
+        line.set_data(*_decimate_by_edges(x, y, get_edge_ar()))
+
+    ax.callbacks.connect('xlim_changed', on_xlim_changed)
+
+    return line
@@ -0,0 +1,199 @@
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+from sciplot._lazy import LazyModule
+from sciplot.main import SciplotException, get_color_lst, get_legend_handle_lst, set_legend
+
+futures = LazyModule('concurrent.futures')
+matplotlib = LazyModule('matplotlib')
+np = LazyModule('numpy')
+
+# Default number of values binned at a time, which bounds the memory used for out-of-core data
+_CHUNK_SIZE = 1 << 22
+
+
+def _get_chunk_iter(
+        data_ar: 'np.ndarray',
+        chunk_size: int
+) -> Iterator['np.ndarray']:
+    # Chunks of whole rows along the first axis, so that memory-mapped files are read sequentially
+    row_size = max(int(np.prod(data_ar.shape[1:])), 1)
+    row_no = max(chunk_size // row_size, 1)
+    for start in range(0, len(data_ar), row_no):
+        yield data_ar[start:start + row_no]
+
+
+def _open_data(
+        data: Union[str, Path, 'np.ndarray', Iterable['np.ndarray']]
+) -> Union['np.ndarray', Iterable['np.ndarray']]:
+    if isinstance(data, (str, Path)):
+        return np.load(str(data), mmap_mode='r')
+    return data
+
+
+def _get_data_chunk_iter(
+        data: Union['np.ndarray', Iterable['np.ndarray']],
+        chunk_size: int
+) -> Iterator['np.ndarray']:
+    if isinstance(data, np.ndarray):
+        return _get_chunk_iter(data, chunk_size)
+    return iter(data)
+
+
+def _get_data_range(
+        data_lst: List[Union['np.ndarray', Iterable['np.ndarray']]],
+        chunk_size: int
+) -> Tuple[float, float]:
+    value_min = np.inf
+    value_max = -np.inf
+    for data in data_lst:
+        if not isinstance(data, np.ndarray):
+            raise SciplotException(
+                "Histograms of chunk iterators need explicit bin edges or a bin range, since chunks can only be read once")
+        for chunk in _get_chunk_iter(data, chunk_size):
+            chunk = np.asarray(chunk, dtype=float)
+            if chunk.size:
+                value_min = min(value_min, np.nanmin(chunk))
+                value_max = max(value_max, np.nanmax(chunk))
+
+    if value_min > value_max:
+        value_min, value_max = 0., 1.
+    elif value_min == value_max:
+        value_min, value_max = value_min - 0.5, value_max + 0.5
+
+    return value_min, value_max
+
+
+def _bin_chunk(
+        chunk: 'np.ndarray',
+        bin_edge_ar: 'np.ndarray',
+        uniform: bool
+) -> 'np.ndarray':
+    bin_no = len(bin_edge_ar) - 1
+    value_ar = np.asarray(chunk, dtype=float).ravel()
+    # Values outside the edges and NaNs are not counted. The last bin includes its right edge, like np.histogram()
+    value_ar = value_ar[(value_ar >= bin_edge_ar[0]) & (value_ar <= bin_edge_ar[-1])]
+
+    if uniform:
+        # Computed bin index, corrected for rounding at the edges as np.histogram() does
+        scale = bin_no / (bin_edge_ar[-1] - bin_edge_ar[0])
+        index_ar = ((value_ar - bin_edge_ar[0]) * scale).astype(np.intp)
+        index_ar[index_ar == bin_no] -= 1
+        index_ar[value_ar < bin_edge_ar[index_ar]] -= 1
+        index_ar[(value_ar >= bin_edge_ar[index_ar + 1]) & (index_ar != bin_no - 1)] += 1
+    else:
+        index_ar = np.searchsorted(bin_edge_ar, value_ar, 'right') - 1
+        index_ar[index_ar == bin_no] -= 1
+
+    return np.bincount(index_ar, minlength=bin_no)
+
+
+def _bin_file_chunk(
+        data_file_path: str,
+        start: int,
+        stop: int,
+        bin_edge_ar: 'np.ndarray',
+        uniform: bool
+) -> 'np.ndarray':
+    # Worker processes map the file themselves, so no data is sent between processes
+    return _bin_chunk(np.load(data_file_path, mmap_mode='r')[start:stop], bin_edge_ar, uniform)
+
+
+def _get_bin_edge_ar(
+        data_lst: List[Union['np.ndarray', Iterable['np.ndarray']]],
+        bins: Union[int, Sequence[float]],
+        bin_range: Tuple[float, float],
+        chunk_size: int
+) -> Tuple['np.ndarray', bool]:
+    if not isinstance(bins, int):
+        bin_edge_ar = np.asarray(bins, dtype=float)
+        bin_width_ar = np.diff(bin_edge_ar)
+        return bin_edge_ar, bool(np.allclose(bin_width_ar, bin_width_ar[0]))
+
+    if bin_range is None:
+        bin_range = _get_data_range(data_lst, chunk_size)
+    return np.linspace(bin_range[0], bin_range[1], bins + 1), True
+
+
+def _get_counts(
+        data: Union[str, Path, 'np.ndarray', Iterable['np.ndarray']],
+        bin_edge_ar: 'np.ndarray',
+        uniform: bool,
+        chunk_size: int,
+        executor: 'futures.Executor' = None
+) -> 'np.ndarray':
+    counts = np.zeros(len(bin_edge_ar) - 1, dtype=np.int64)
+
+    if executor is not None and isinstance(data, (str, Path)):
+        data_ar = _open_data(data)
+        row_no = max(chunk_size // max(int(np.prod(data_ar.shape[1:])), 1), 1)
+        future_lst = [
+            executor.submit(_bin_file_chunk, str(data), start, start + row_no, bin_edge_ar, uniform)
+            for start in range(0, len(data_ar), row_no)
+        ]
+        for future in future_lst:
+            counts += future.result()
+        return counts
+
+    for chunk in _get_data_chunk_iter(_open_data(data), chunk_size):
+        counts += _bin_chunk(chunk, bin_edge_ar, uniform)
+    return counts
+
+
+def histogram_counts(
+        data_lst: List[Union[str, Path, 'np.ndarray', Iterable['np.ndarray']]],
+        bins: Union[int, Sequence[float]] = 100,
+        bin_range: Tuple[float, float] = None,
+        density: bool = False,
+        chunk_size: int = _CHUNK_SIZE,
+        workers: int = None
+) -> Tuple[List['np.ndarray'], 'np.ndarray']:
+    # Data series are .npy file paths, arrays (e.g. memory-mapped) or iterables of chunks. All series share bin edges
+    data_lst = list(data_lst)
+    bin_edge_ar, uniform = _get_bin_edge_ar([_open_data(data) for data in data_lst], bins, bin_range, chunk_size)
+
+    if workers is not None and workers > 1 and any(isinstance(data, (str, Path)) for data in data_lst):
+        with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            counts_lst = [_get_counts(data, bin_edge_ar, uniform, chunk_size, executor) for data in data_lst]
+    else:
+        counts_lst = [_get_counts(data, bin_edge_ar, uniform, chunk_size) for data in data_lst]
+
+    if density:
+        bin_width_ar = np.diff(bin_edge_ar)
+        counts_lst = [counts / (max(counts.sum(), 1) * bin_width_ar) for counts in counts_lst]
+
+    return counts_lst, bin_edge_ar
+
+
+def plot_histogram(
+        ax: 'matplotlib.axes.Axes',
+        data_lst: List[Union[str, Path, 'np.ndarray', Iterable['np.ndarray']]],
+        bins: Union[int, Sequence[float]] = 100,
+        bin_range: Tuple[float, float] = None,
+        density: bool = False,
+        label_tpl: Tuple[str] = None,
+        seaborn_color_map: str = 'cubehelix',
+        colorful: bool = False,
+        alpha: float = 0.7,
+        loc: str = 'lower left',
+        outside_plot: bool = False,
+        chunk_size: int = _CHUNK_SIZE,
+        workers: int = None
+) -> Tuple[List['matplotlib.artist.Artist'], List['matplotlib.patches.Rectangle']]:
+    counts_lst, bin_edge_ar = histogram_counts(data_lst, bins, bin_range, density, chunk_size, workers)
+    color_lst = get_color_lst(len(counts_lst), seaborn_color_map=seaborn_color_map, colorful=colorful)
+
+    plot_lst = []
+    for counts, color in zip(counts_lst, color_lst):
+        if hasattr(ax, 'stairs'):
+            plot = ax.stairs(counts, bin_edge_ar, fill=True, color=color, alpha=alpha)
+        else:
+            # Matplotlib < 3.4 has no stairs(), but hist() can draw pre-binned counts as weights
+            plot = ax.hist(bin_edge_ar[:-1], bin_edge_ar, weights=counts, histtype='stepfilled', color=color,
+                           alpha=alpha)[2][0]
+        plot_lst.append(plot)
+    patch_lst = get_legend_handle_lst(color_lst, 'patch', alpha=alpha)
+
+    if label_tpl is not None:
+        set_legend(ax, tuple(patch_lst), tuple(label_tpl), loc=loc, outside_plot=outside_plot)
+
+    return plot_lst, patch_lst
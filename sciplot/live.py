@@ -0,0 +1,244 @@
+import os
+import time
+from typing import ContextManager, List, Tuple, Union
+from sciplot._lazy import LazyModule
+from sciplot.main import get_color_lst, set_legend, style
+
+matplotlib = LazyModule('matplotlib')
+backend_agg = LazyModule('matplotlib.backends.backend_agg')
+np = LazyModule('numpy')
+
+_CM_TO_INCH = 1 / 2.54
+
+
+def _freeze_layout(
+        fig: 'matplotlib.figure.Figure'
+) -> object:
+    # Keeps the current layout, so that axes do not jump when tick labels change. Returns the layout engine to restore,
+    # or None if there is none
+    if hasattr(fig, 'get_layout_engine'):
+        layout_engine = fig.get_layout_engine()
+        fig.set_layout_engine('none')
+        return layout_engine
+    if fig.get_tight_layout():
+        fig.set_tight_layout(False)
+        return True
+    return None
+
+
+def _unfreeze_layout(
+        fig: 'matplotlib.figure.Figure',
+        layout_engine: object
+):
+    if hasattr(fig, 'set_layout_engine'):
+        fig.set_layout_engine(layout_engine)
+    else:
+        fig.set_tight_layout(True)
+
+
+# Fixed size FIFO of columns. Every value is stored twice, at i and i + capacity, so that the buffered columns are
+# always a contiguous view and appending never shifts data
+class _RingBuffer:
+    def __init__(
+            self,
+            row_no: int,
+            capacity: int
+    ):
+        self._capacity = capacity
+        self._data_ar = np.zeros((row_no, 2 * capacity))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(
+            self,
+            column_ar: 'np.ndarray'
+    ):
+        column_ar = column_ar[:, -self._capacity:]
+        column_no = column_ar.shape[1]
+
+        index_ar = (self._start + self._size + np.arange(column_no)) % self._capacity
+        self._data_ar[:, index_ar] = column_ar
+        self._data_ar[:, index_ar + self._capacity] = column_ar
+
+        size = self._size + column_no
+        if size > self._capacity:
+            self._start = (self._start + size - self._capacity) % self._capacity
+            size = self._capacity
+        self._size = size
+
+    def view(self) -> 'np.ndarray':
+        return self._data_ar[:, self._start:self._start + self._size]
+
+
+# Sciplot styled line plot for live data. Data is appended to ring buffers, and frames only redraw the lines on a copy
+# of the rest of the figure (blitting). The whole figure is only redrawn when data leaves the axis limits
+class LivePlot:
+    def __init__(
+            self,
+            line_no: int = 1,
+            capacity: int = 1000,
+            label_tpl: Tuple[str] = None,
+            theme: Union[str, List[str]] = 'default',
+            locale_setting: str = 'sv_SE',
+            latex: str = 'on',
+            size: Tuple[float, float] = None,  # width and height in cm
+            dpi: float = None,  # resolution of frames, the theme's by default
+            loc: str = 'upper left',
+            headroom: float = 0.25,  # relative margin added to the axis limits when they are exceeded
+            frame_rate: float = None,  # exported frames per second, or None for no export
+            save_directory: str = '',
+            plot_file_name: str = 'frame'
+    ):
+        self._style_args = (theme, locale_setting)
+        self._latex = latex
+        self._headroom = headroom
+        self._buffer = _RingBuffer(line_no + 1, capacity)
+        self._background = None
+        self._full_draw_no = 0
+        self._layout_engine = None
+
+        self._frame_interval = None if frame_rate is None else 1 / frame_rate
+        self._next_export_time = None
+        self._export_no = 0
+        self._save_directory = str(save_directory)
+        self._plot_file_name = plot_file_name
+
+        with self.styled():
+            figsize = None if size is None else (size[0] * _CM_TO_INCH, size[1] * _CM_TO_INCH)
+            self.fig = matplotlib.figure.Figure(figsize=figsize, dpi=dpi)
+            self.canvas = backend_agg.FigureCanvasAgg(self.fig)
+            self.ax = self.fig.subplots(1, 1)
+
+            # Animated artists are left out of full draws, and drawn on top of the background instead. Lines are
+            # therefore always drawn above ticks and spines, and below the legend
+            color_lst = get_color_lst(line_no)
+            self.line_lst = [self.ax.plot([], [], color=color, animated=True)[0] for color in color_lst]
+            if label_tpl is not None:
+                set_legend(self.ax, tuple(self.line_lst), tuple(label_tpl), loc=loc)
+                self.ax.get_legend().set_animated(True)
+
+    def styled(self) -> ContextManager:
+        # Style context of the plot, e.g. for setting axis labels. Sets no process-wide locale, so plots can be updated
+        # from several threads
+        return style(*self._style_args, isolated=True, latex=self._latex, locale_mode='formatter')
+
+    def append(
+            self,
+            x: Union[float, 'np.ndarray'],
+            y: Union[float, 'np.ndarray']
+    ):
+        # y holds one value per line for each x value
+        x_ar = np.atleast_1d(np.asarray(x, dtype=float))
+        y_ar = np.asarray(y, dtype=float).reshape(len(self.line_lst), len(x_ar))
+        self._buffer.extend(np.vstack([x_ar[np.newaxis], y_ar]))
+
+    def _get_expanded_lim(
+            self,
+            value_min: float,
+            value_max: float,
+            lim: Tuple[float, float],
+            forward: bool
+    ) -> Tuple[float, float]:
+        if lim[0] <= value_min and value_max <= lim[1]:
+            return lim
+
+        span = value_max - value_min
+        if span == 0:
+            span = 1.
+        # Leading axes, e.g. time, only get headroom ahead, so that the plot scrolls in steps
+        if forward:
+            return value_min, value_max + span * self._headroom
+        return value_min - span * self._headroom / 2, value_max + span * self._headroom / 2
+
+    def _update_lims(self) -> bool:
+        data_ar = self._buffer.view()
+        if data_ar.shape[1] == 0:
+            return False
+
+        xlim = self._get_expanded_lim(data_ar[0].min(), data_ar[0].max(), self.ax.get_xlim(), True)
+        ylim = self._get_expanded_lim(data_ar[1:].min(), data_ar[1:].max(), self.ax.get_ylim(), False)
+        if xlim == self.ax.get_xlim() and ylim == self.ax.get_ylim():
+            return False
+
+        self.ax.set_xlim(xlim)
+        self.ax.set_ylim(ylim)
+        return True
+
+    def _draw_full(self):
+        self.canvas.draw()
+        if self._layout_engine is None:
+            self._layout_engine = _freeze_layout(self.fig)
+
+        # The restored region must cover all animated artists, including a legend outside the axes
+        background_bbox = self.ax.bbox
+        if self.ax.get_legend() is not None:
+            background_bbox = matplotlib.transforms.Bbox.union(
+                [background_bbox, self.ax.get_legend().get_window_extent(self.canvas.get_renderer())])
+        self._background = self.canvas.copy_from_bbox(background_bbox)
+        self._full_draw_no += 1
+
+    def _draw_animated(self):
+        for line in self.line_lst:
+            self.ax.draw_artist(line)
+        if self.ax.get_legend() is not None:
+            self.ax.draw_artist(self.ax.get_legend())
+
+    def update(self) -> 'np.ndarray':
+        data_ar = self._buffer.view()
+        for i, line in enumerate(self.line_lst):
+            line.set_data(data_ar[0], data_ar[i + 1])
+
+        # Text and paths read some rcParams when they are drawn
+        with self.styled():
+            if self._update_lims() or self._background is None:
+                self._draw_full()
+            else:
+                self.canvas.restore_region(self._background)
+            self._draw_animated()
+
+        if self._frame_interval is not None:
+            self._export_if_due()
+
+        return self.get_frame()
+
+    def redraw(self):
+        # Full redraw with a new layout after the figure has been changed, e.g. axis labels set with styled()
+        if self._layout_engine is not None:
+            _unfreeze_layout(self.fig, self._layout_engine)
+            self._layout_engine = None
+        self._background = None
+        self.update()
+
+    def get_frame(self) -> 'np.ndarray':
+        # RGBA pixels of the current frame, valid until the next update
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def export_frame(
+            self,
+            plot_file_path: str = None
+    ) -> str:
+        if plot_file_path is None:
+            plot_file_path = os.path.join(
+                self._save_directory,
+                self._plot_file_name + '_' + '{0:06d}'.format(self._export_no) + '.png'
+            )
+        matplotlib.image.imsave(plot_file_path, self.get_frame(), format='png')
+        self._export_no += 1
+        return plot_file_path
+
+    def _export_if_due(self):
+        # Frames are exported on a fixed time grid. Missed grid points are skipped, not caught up on
+        time_now = time.monotonic()
+        if self._next_export_time is None or time_now >= self._next_export_time:
+            self.export_frame()
+            if self._next_export_time is None:
+                self._next_export_time = time_now
+            missed_no = (time_now - self._next_export_time) // self._frame_interval
+            self._next_export_time += (missed_no + 1) * self._frame_interval
+
+    def close(self):
+        self._background = None
+        self.fig.clear()
@@ -0,0 +1,192 @@
+import contextvars
+import csv
+import functools
+import locale
+import os
+from pathlib import Path
+from typing import Dict, NamedTuple, Tuple
+from sciplot._lazy import LazyModule
+
+matplotlib = LazyModule('matplotlib')
+
+# Decimal separator of tick labels in the current style context, if applied by formatters instead of setlocale()
+_decimal_separator_var = contextvars.ContextVar('sciplot_decimal_separator', default=None)
+_original_format_maybe_minus_and_locale = None
+_original_formatter_call = None
+
+# Languages whose locales use a decimal point, and exceptions by language and territory. All others use a decimal comma
+_DECIMAL_POINT_LANGUAGE_SET = {
+    'c', 'posix', 'en', 'ar', 'as', 'bn', 'gu', 'he', 'hi', 'ja', 'kn', 'ko', 'ks', 'ml', 'mr', 'ms', 'mt', 'or', 'pa',
+    'sa', 'ta', 'te', 'th', 'zh'
+}
+_DECIMAL_POINT_LOCALE_SET = {
+    'de_ch', 'de_li', 'it_ch', 'es_do', 'es_gt', 'es_hn', 'es_mx', 'es_ni', 'es_pa', 'es_pe', 'es_pr', 'es_sv', 'es_us'
+}
+_DECIMAL_COMMA_LOCALE_SET = {'ar_dz', 'ar_ly', 'ar_ma', 'ar_tn'}
+
+
+# Locale of the catalog in parameters/locales.csv
+class LocaleEntry(NamedTuple):
+    name: str
+    code_set: str
+    description: str
+    decimal_separator: str
+
+
+def _get_locale_key(
+        locale_name: str
+) -> str:
+    # Case and code set spelling are ignored, e.g. 'sv_SE.utf8' is the same as 'sv_SE.UTF-8'
+    base_name, _, code_set = locale_name.lower().partition('.')
+    if code_set:
+        return base_name + '.' + code_set.replace('-', '').replace('_', '')
+    return base_name
+
+
+def _get_base_key(
+        locale_key: str
+) -> str:
+    return locale_key.partition('.')[0].partition('@')[0]
+
+
+def _get_decimal_separator(
+        locale_key: str
+) -> str:
+    base_key = _get_base_key(locale_key)
+    if base_key in _DECIMAL_COMMA_LOCALE_SET:
+        return ','
+    if base_key in _DECIMAL_POINT_LOCALE_SET or base_key.partition('_')[0] in _DECIMAL_POINT_LANGUAGE_SET:
+        return '.'
+    return ','
+
+
+@functools.lru_cache(maxsize=None)
+def _get_locale_catalog() -> Tuple[Tuple[LocaleEntry], Dict[str, LocaleEntry]]:
+    locales_file_path = Path(__file__).parent / 'parameters' / 'locales.csv'
+    with open(locales_file_path, 'r') as file:
+        row_lst = [row for row in csv.reader(file, delimiter='\t') if row]
+
+    locale_entry_lst = []
+    locale_entry_dict = {}
+    for name, code_set, description in row_lst:
+        locale_key = _get_locale_key(name)
+        locale_entry = LocaleEntry(name, code_set, description, _get_decimal_separator(locale_key))
+        locale_entry_lst.append(locale_entry)
+        locale_entry_dict[locale_key] = locale_entry
+
+    # Names without code set, e.g. 'sv_SE', refer to the UTF-8 locale if there is one, and otherwise to the first one
+    for locale_entry in locale_entry_lst:
+        if '@' in locale_entry.name:
+            continue
+        base_key = _get_base_key(_get_locale_key(locale_entry.name))
+        if base_key not in locale_entry_dict or (
+                locale_entry.code_set == 'UTF-8' and locale_entry_dict[base_key].code_set != 'UTF-8'):
+            locale_entry_dict[base_key] = locale_entry
+
+    return tuple(locale_entry_lst), locale_entry_dict
+
+
+def _get_environment_locale_name() -> str:
+    # Locale that setlocale() uses for an empty name
+    for variable in ('LC_ALL', 'LC_NUMERIC', 'LANG'):
+        if os.environ.get(variable):
+            return os.environ[variable]
+    return 'C'
+
+
+@functools.lru_cache(maxsize=256)
+def get_locale_entry(
+        locale_setting: str
+) -> LocaleEntry:
+    if not isinstance(locale_setting, str):
+        raise locale.Error("Invalid locale setting: '" + str(locale_setting) + "'")
+
+    locale_name = locale_setting if locale_setting else _get_environment_locale_name()
+    _, locale_entry_dict = _get_locale_catalog()
+
+    # Exact name, name without code set and aliases known to Python, e.g. 'swedish'
+    for locale_key in (
+            _get_locale_key(locale_name),
+            _get_base_key(_get_locale_key(locale_name)),
+            _get_locale_key(locale.normalize(locale_name))
+    ):
+        if locale_key in locale_entry_dict:
+            return locale_entry_dict[locale_key]
+
+    return _get_system_locale_entry(locale_setting, locale_name)
+
+
+def _get_system_locale_entry(
+        locale_setting: str,
+        locale_name: str
+) -> LocaleEntry:
+    # Locales missing from the catalog are accepted if the system has them, with the system's decimal separator
+    previous_locale_setting = locale.setlocale(locale.LC_NUMERIC)
+    try:
+        locale.setlocale(locale.LC_NUMERIC, locale_setting)
+        decimal_separator = locale.localeconv()['decimal_point']
+    except locale.Error:
+        raise locale.Error(
+            "Unknown locale: '" + locale_setting + "'. Available locales are listed by sciplot.get_available_locals()")
+    finally:
+        locale.setlocale(locale.LC_NUMERIC, previous_locale_setting)
+
+    return LocaleEntry(locale_name, locale_name.partition('.')[2].partition('@')[0], 'System locale', decimal_separator)
+
+
+def _apply_decimal_separator(
+        formatter: 'matplotlib.ticker.ScalarFormatter',
+        s: str
+) -> str:
+    decimal_separator = _decimal_separator_var.get()
+    if decimal_separator is None or decimal_separator == '.' or formatter.get_useLocale():
+        return s
+
+    # A comma in math mode is typeset as punctuation, followed by a space, unless it is braced
+    if decimal_separator == ',' and ('$' in s or getattr(formatter, '_usetex', False)):
+        decimal_separator = '{,}'
+    return s.replace('.', decimal_separator)
+
+
+def _format_maybe_minus_and_locale(
+        self,
+        fmt: str,
+        arg: float
+) -> str:
+    return _apply_decimal_separator(self, _original_format_maybe_minus_and_locale(self, fmt, arg))
+
+
+def _formatter_call(
+        self,
+        x: float,
+        pos: int = None
+) -> str:
+    return _apply_decimal_separator(self, _original_formatter_call(self, x, pos))
+
+
+def _install_formatter_hook():
+    global _original_format_maybe_minus_and_locale, _original_formatter_call
+    formatter_class = matplotlib.ticker.ScalarFormatter
+    if hasattr(formatter_class, '_format_maybe_minus_and_locale'):
+        if _original_format_maybe_minus_and_locale is None:
+            _original_format_maybe_minus_and_locale = formatter_class._format_maybe_minus_and_locale
+            formatter_class._format_maybe_minus_and_locale = _format_maybe_minus_and_locale
+    elif _original_formatter_call is None:
+        # Matplotlib < 3.5 formats tick labels without a common helper, so only tick labels are converted, not the
+        # offset text
+        _original_formatter_call = formatter_class.__call__
+        formatter_class.__call__ = _formatter_call
+
+
+def enable_locale_formatter(
+        decimal_separator: str
+) -> contextvars.Token:
+    # Tick labels formatted in the current context from now on use the decimal separator
+    _install_formatter_hook()
+    return _decimal_separator_var.set(decimal_separator)
+
+
+def disable_locale_formatter(
+        token: contextvars.Token
+):
+    _decimal_separator_var.reset(token)
@@ -1,17 +1,33 @@
+import collections
 import contextlib
-import csv
+import contextvars
+import functools
+import hashlib
+import json
 import locale
 import logging
 import os
+import pickle
 import re
+import threading
+import time
+import tracemalloc
 import warnings
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple, Union, OrderedDict
-import matplotlib
-import matplotlib.pyplot as plt
-import seaborn as sns
-import yaml
+from typing import Callable, Dict, Iterator, List, Tuple, Union, OrderedDict
+from sciplot._lazy import LazyModule
+from sciplot.locales import LocaleEntry, _get_locale_catalog, get_locale_entry
+from sciplot.locales import disable_locale_formatter, enable_locale_formatter
+from sciplot.palettes import get_palette
+from sciplot.tex_fallback import disable_tex_fallback, enable_tex_fallback, is_tex_available
+from sciplot.text_cache import disable_text_extent_cache, enable_text_extent_cache
+
+# Heavy dependencies are imported on first use, so that importing sciplot is fast
+matplotlib = LazyModule('matplotlib')
+plt = LazyModule('matplotlib.pyplot')
+backend_agg = LazyModule('matplotlib.backends.backend_agg')
+yaml = LazyModule('yaml')
 
 # Reset Matplotlib style library (use in case of unresolved errors)
 # plt.style.reload_library()
@@ -19,8 +35,47 @@ import yaml
 # Disable "findfont: Font family ['serif'] not found. Falling back to DejaVu Sans."
 logging.getLogger('matplotlib.font_manager').disabled = True
 
-# Dark mode boolean operator
-dark_mode = False
+# Dark mode boolean operator, tracked per thread and per style context
+_dark_mode_var = contextvars.ContextVar('sciplot_dark_mode', default=False)
+
+# Active isolated style contexts as (token, rcParams) layers in order of entry, and the rcParams values they replaced
+_style_layer_lst = []
+_style_base_dict = {}
+_style_lock = threading.RLock()
+
+# Maximum number of compiled themes kept in memory
+_THEME_CACHE_SIZE = 32
+
+# Compiled themes in least recently used order, keyed by theme tuple
+_theme_cache = collections.OrderedDict()
+_theme_cache_lock = threading.Lock()
+
+# Format version and maximum number of entries of the on-disk parameter cache
+_PARAMETER_CACHE_VERSION = 1
+_PARAMETER_CACHE_SIZE = 256
+
+# Format version and file suffixes of exported themes
+_THEME_BUNDLE_VERSION = 1
+_THEME_BUNDLE_SUFFIX_TPL = ('.mplstyle', '.pickle', '.pkl')
+_THEME_BUNDLE_DARK_MODE_PREFIX = '# Sciplot dark mode: '
+
+# Parsed parameter files keyed by content hash, loaded from disk on first use
+_parameter_cache = None
+_parameter_cache_lock = threading.Lock()
+
+# Callbacks receiving the name and duration of instrumented phases, replaced as a whole when changed
+_timing_callback_tpl = ()
+_timing_callback_lock = threading.Lock()
+# Total duration of the phases reported in each thread, including the time spent in their callbacks
+_phase_timer_local = threading.local()
+
+# Figure of the innermost figure() context, which save_time_stamped_figure() saves by default
+_current_figure_var = contextvars.ContextVar('sciplot_current_figure', default=None)
+
+# Memory traces of the open figure() contexts with a memory callback, and whether tracemalloc was started for them
+_memory_trace_lst = []
+_memory_trace_lock = threading.Lock()
+_tracemalloc_started = False
 
 
 # sciplot warning class
@@ -80,9 +135,6 @@ def _get_parameter_file_lst(
     if theme == 'default':
         parameter_file_lst = ['basic', 'typesetting', 'colors_light', 'fonts_cm_sans_serif', 'latex_sans_serif']
     elif theme == 'dark':
-        plt.style.use('dark_background')
-        global dark_mode
-        dark_mode = True
         parameter_file_lst = ['colors_dark']
     elif theme == 'serif':
         parameter_file_lst = ['fonts_cm_serif', 'latex_serif']
@@ -96,95 +148,605 @@ def _get_parameter_file_lst(
     return parameter_file_lst
 
 
+def _get_parameter_file_path(
+        parameter_file: str
+) -> Path:
+    return Path(__file__).parent / 'parameters' / (parameter_file + '.yml')
+
+
 def _theme_exists(
         theme: str
 ) -> bool:
     if not (theme in get_theme_priority_lst()):
-        try:
-            parameters_dir = Path(__file__).parent / 'parameters'
-            parameters_path = parameters_dir / (theme + '.yml')
-            with parameters_path.open():
-                pass
+        if _get_parameter_file_path(theme).is_file():
             return True
-        except FileNotFoundError:
-            warnings.warn("Invalid theme ignored by Sciplot: '" + theme + "'", SciplotWarning)
-            return False
+        warnings.warn("Invalid theme ignored by Sciplot: '" + theme + "'", SciplotWarning)
+        return False
     else:
         return False
 
 
-def _get_parameters_lst(
-        parameter_file_lst: List[str]
-) -> List[object]:
-    # Empty list of parameters
-    parameters_lst = []
+def _get_theme_parameter_file_lst(
+        theme_lst: List[str]
+) -> List[str]:
+    # Get ordered list if parameter files
+    parameter_file_lst = []
+    theme_priority_lst = get_theme_priority_lst()
+    theme_priority_lst.reverse()
+
+    # Add themes' associated parameter files to list
+    for theme_priority in theme_priority_lst:
+        for theme in theme_lst:
+            if theme == theme_priority:
+                parameter_file_lst += _get_parameter_file_lst(theme)
+
+    # Add user defined themes to parameter_file_lst
+    if any(theme not in theme_priority_lst for theme in theme_lst):
+        for theme in theme_lst:
+            if _theme_exists(theme):
+                parameter_file_lst += _get_parameter_file_lst(theme)
 
-    parameters_dir = Path(__file__).parent / 'parameters'
+    return parameter_file_lst
 
-    # Import parameters
+
+def _get_parameter_file_stamp(
+        parameter_file_lst: List[str]
+) -> Tuple[Tuple[int, int]]:
+    stamp_lst = []
     for parameter_file in parameter_file_lst:
         try:
-            parameters_path = parameters_dir / (parameter_file + '.yml')
-            with parameters_path.open() as setup_file:
-                parameters = yaml.safe_load(setup_file.read())
-                if parameters:
-                    parameters_lst.append(parameters)
+            stat = _get_parameter_file_path(parameter_file).stat()
         except FileNotFoundError:
             raise SciplotException(
                 "Unable to import theme parameter file: '" + parameter_file + "'")
+        stamp_lst.append((stat.st_mtime_ns, stat.st_size))
+
+    return tuple(stamp_lst)
+
+
+# Reports the durations of consecutive phases of a function to the timing callbacks. Phases of functions called inside
+# a phase, e.g. the theme phases inside style.compile_theme, are reported on their own and excluded from the outer
+# phase, so that the durations of all phases in a thread never overlap
+class _PhaseTimer:
+    def __init__(
+            self,
+            callback_tpl: Tuple[Callable[[str, float], None]]
+    ):
+        self._callback_tpl = callback_tpl
+        self.restart()
+
+    def restart(self):
+        self._time_start = time.perf_counter()
+        self._accounted_duration_start = getattr(_phase_timer_local, 'accounted_duration', 0.)
+
+    def lap(
+            self,
+            phase: str
+    ):
+        time_lap = time.perf_counter()
+        accounted_duration = getattr(_phase_timer_local, 'accounted_duration', 0.)
+        duration = time_lap - self._time_start - (accounted_duration - self._accounted_duration_start)
+        for callback in self._callback_tpl:
+            callback(phase, duration)
+        # The time spent in callbacks is not counted in the next phase, nor in an enclosing phase
+        _phase_timer_local.accounted_duration = accounted_duration + duration + time.perf_counter() - time_lap
+        self.restart()
+
+
+# Used when no timing callbacks are registered, so that instrumentation costs a method call per phase
+class _NullPhaseTimer:
+    def restart(self):
+        pass
+
+    def lap(
+            self,
+            phase: str
+    ):
+        pass
+
+
+_null_phase_timer = _NullPhaseTimer()
+
+
+def _get_phase_timer() -> Union[_PhaseTimer, _NullPhaseTimer]:
+    callback_tpl = _timing_callback_tpl
+    if callback_tpl:
+        return _PhaseTimer(callback_tpl)
+    return _null_phase_timer
+
+
+def add_timing_callback(
+        callback: Callable[[str, float], None]
+):
+    global _timing_callback_tpl
+    with _timing_callback_lock:
+        _timing_callback_tpl = _timing_callback_tpl + (callback,)
+
+
+def remove_timing_callback(
+        callback: Callable[[str, float], None]
+):
+    global _timing_callback_tpl
+    with _timing_callback_lock:
+        callback_lst = list(_timing_callback_tpl)
+        callback_lst.remove(callback)
+        _timing_callback_tpl = tuple(callback_lst)
+
+
+@contextlib.contextmanager
+def collect_timings() -> Iterator[List[Tuple[str, float]]]:
+    # Collects (phase, duration) of all instrumented phases, in all threads, while the context is active
+    timing_lst = []
+
+    def collect(phase, duration):
+        timing_lst.append((phase, duration))
+
+    add_timing_callback(collect)
+    try:
+        yield timing_lst
+    finally:
+        remove_timing_callback(collect)
+
+
+def _compile_theme(
+        theme: Union[str, List[str]]
+) -> Tuple[dict, bool]:
+    # Exported themes are applied as they are
+    if isinstance(theme, Path) or (isinstance(theme, str) and theme.endswith(_THEME_BUNDLE_SUFFIX_TPL)):
+        return _load_theme_bundle(Path(theme))
+
+    # Get requested themes as list, with or without default theme
+    theme_lst = _get_default_theme_lst(_get_theme_lst(theme))
+    parameter_file_lst = _get_theme_parameter_file_lst(theme_lst)
+
+    # Parameter files are identified by modification time and size, so edited user themes are recompiled
+    theme_key = tuple(theme_lst)
+    file_stamp = _get_parameter_file_stamp(parameter_file_lst)
+
+    with _theme_cache_lock:
+        cached = _theme_cache.get(theme_key)
+        if cached is not None and cached[0] == file_stamp:
+            _theme_cache.move_to_end(theme_key)
+            return cached[1]
+
+    theme_dark_mode = 'dark' in theme_lst
+
+    # Merge Matplotlib's dark background with all parameter files into a single dict of validated rcParams
+    rc_params = {}
+    if theme_dark_mode:
+        rc_params.update(matplotlib.style.library['dark_background'])
+    error_lst = []
+    for parameter_file, parameters in zip(parameter_file_lst, _get_parameters_lst(parameter_file_lst)):
+        rc_params.update(_validate_parameters(parameter_file, parameters, error_lst))
+    if error_lst:
+        raise SciplotException('Invalid theme parameters:\n' + '\n'.join(error_lst))
+
+    compiled_theme = (rc_params, theme_dark_mode)
+
+    with _theme_cache_lock:
+        _theme_cache[theme_key] = (file_stamp, compiled_theme)
+        _theme_cache.move_to_end(theme_key)
+        while len(_theme_cache) > _THEME_CACHE_SIZE:
+            _theme_cache.popitem(last=False)
+
+    return compiled_theme
+
+
+def _get_parameter_cache_path() -> Path:
+    return Path(get_cache_dir()) / 'parameters.json'
+
+
+def _load_parameter_cache() -> dict:
+    global _parameter_cache
+    if _parameter_cache is None:
+        try:
+            with _get_parameter_cache_path().open('r', encoding='utf-8') as cache_file:
+                cache = json.load(cache_file)
+            if cache.get('version') != _PARAMETER_CACHE_VERSION:
+                raise ValueError
+            _parameter_cache = cache['parameters']
+        except (OSError, ValueError, KeyError, AttributeError):
+            _parameter_cache = {}
+
+    return _parameter_cache
+
+
+def _save_parameter_cache(
+        parameter_cache: dict
+):
+    # Keep the most recently added entries only
+    parameter_cache_items = list(parameter_cache.items())[-_PARAMETER_CACHE_SIZE:]
+    cache = {'version': _PARAMETER_CACHE_VERSION, 'parameters': dict(parameter_cache_items)}
+
+    # Write to a temporary file first, so that concurrent processes never read a partial cache
+    cache_path = _get_parameter_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(cache_path.name + '.' + str(os.getpid()) + '.tmp')
+        with temp_path.open('w', encoding='utf-8') as cache_file:
+            json.dump(cache, cache_file, separators=(',', ':'))
+        os.replace(str(temp_path), str(cache_path))
+    except OSError:
+        pass
+
+
+def _get_parameters_lst(
+        parameter_file_lst: List[str]
+) -> List[object]:
+    # Empty list of parameters
+    parameters_lst = []
+    timer = _get_phase_timer()
+
+    with _parameter_cache_lock:
+        timer.restart()
+        parameter_cache = _load_parameter_cache()
+        parameter_cache_changed = False
+        timer.lap('theme.load_parameter_cache')
+
+        # Import parameters, parsing YAML only for files not found in the parameter cache
+        for parameter_file in parameter_file_lst:
+            try:
+                parameters_path = _get_parameter_file_path(parameter_file)
+                content = parameters_path.read_bytes()
+            except FileNotFoundError:
+                raise SciplotException(
+                    "Unable to import theme parameter file: '" + parameter_file + "'")
+
+            content_hash = hashlib.sha256(content).hexdigest()
+            if content_hash in parameter_cache:
+                parameters = parameter_cache[content_hash]
+            else:
+                timer.restart()
+                parameters = yaml.safe_load(content.decode('utf-8'))
+                timer.lap('theme.parse_parameter_file')
+                try:
+                    json.dumps(parameters)
+                    parameter_cache[content_hash] = parameters
+                    parameter_cache_changed = True
+                except (TypeError, ValueError):
+                    pass
+
+            parameters_lst.append(parameters)
+
+        if parameter_cache_changed:
+            timer.restart()
+            _save_parameter_cache(parameter_cache)
+            timer.lap('theme.save_parameter_cache')
 
     return parameters_lst
 
 
+def _get_parameter_line_dict(
+        parameter_file: str
+) -> Dict[str, int]:
+    # Line numbers of the top level keys of a parameter file, only read when there are errors to report
+    try:
+        node = yaml.compose(_get_parameter_file_path(parameter_file).read_text(encoding='utf-8'))
+    except (OSError, yaml.YAMLError):
+        return {}
+    if not isinstance(node, yaml.MappingNode):
+        return {}
+    return {str(key_node.value): key_node.start_mark.line + 1 for key_node, _ in node.value}
+
+
+def _validate_parameters(
+        parameter_file: str,
+        parameters: object,
+        error_lst: List[str]
+) -> dict:
+    # Parameters converted by Matplotlib's validators. Errors are appended to error_lst with their file and line
+    if not parameters:
+        return {}
+
+    parameters_path = str(_get_parameter_file_path(parameter_file))
+    if not isinstance(parameters, dict):
+        error_lst.append("  '" + parameters_path + "': Parameter files must contain 'key: value' pairs")
+        return {}
+
+    validator_dict = matplotlib.rcParams.validate
+    validated_parameters = {}
+    invalid_lst = []
+    for key, value in parameters.items():
+        if key not in validator_dict:
+            invalid_lst.append((key, "Unknown parameter '" + str(key) + "'"))
+            continue
+        try:
+            validated_parameters[key] = validator_dict[key](value)
+        except (ValueError, TypeError) as e:
+            invalid_lst.append((key, "Invalid value for '" + key + "': " + str(e)))
+
+    if invalid_lst:
+        line_dict = _get_parameter_line_dict(parameter_file)
+        for key, message in invalid_lst:
+            line = line_dict.get(str(key))
+            error_lst.append("  '" + parameters_path + "'" + ('' if line is None else ', line ' + str(line)) + ': ' + message)
+
+    return validated_parameters
+
+
+def _set_rc_params(
+        rc_params: dict
+):
+    # Values are validated when themes are compiled, or read from rcParams, so they are set in bulk without validating
+    # them again
+    dict.update(matplotlib.rcParams, rc_params)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_rc_params() -> Dict[str, object]:
+    # Matplotlib's defaults as applied by matplotlib.style.use('default'), i.e. without non-style parameters
+    style_blacklist = matplotlib.style.core.STYLE_BLACKLIST
+    return {key: value for key, value in dict.items(matplotlib.rcParamsDefault) if key not in style_blacklist}
+
+
+def _push_style_layer(
+        rc_params: dict
+) -> object:
+    token = object()
+    with _style_lock:
+        # Remember the values in place before the first active layer changed them
+        for key in rc_params:
+            if key not in _style_base_dict:
+                _style_base_dict[key] = matplotlib.rcParams[key]
+
+        _style_layer_lst.append((token, rc_params))
+        _set_rc_params(rc_params)
+
+    return token
+
+
+def _pop_style_layer(
+        token: object
+):
+    with _style_lock:
+        rc_params = next(layer for layer_token, layer in _style_layer_lst if layer_token is token)
+        _style_layer_lst[:] = [(layer_token, layer) for layer_token, layer in _style_layer_lst if layer_token is not token]
+
+        # Restore the keys of the removed layer to their base values, overridden by layers that are still active
+        restored_rc_params = {key: _style_base_dict[key] for key in rc_params}
+        for _, layer in _style_layer_lst:
+            restored_rc_params.update((key, layer[key]) for key in rc_params if key in layer)
+        _set_rc_params(restored_rc_params)
+
+        for key in rc_params:
+            if not any(key in layer for _, layer in _style_layer_lst):
+                del _style_base_dict[key]
+
+
+def _check_latex_option(
+        latex: str
+):
+    if latex not in ('on', 'auto', 'off'):
+        raise SciplotException("Invalid latex option: '" + str(latex) + "'. Correct options are 'on', 'auto' or 'off'.")
+
+
+def _apply_latex_option(
+        rc_params: Dict[str, object],
+        latex: str
+) -> Tuple[Dict[str, object], bool]:
+    # Without LaTeX, siunitx and physics macros in text are translated to mathtext instead. This includes themes that
+    # turn LaTeX off themselves, e.g. no-latex
+    if bool(rc_params.get('text.usetex')) and (latex == 'off' or (latex == 'auto' and not is_tex_available())):
+        rc_params = dict(rc_params)
+        rc_params['text.usetex'] = False
+    tex_fallback = not rc_params.get('text.usetex', matplotlib.rcParamsDefault['text.usetex'])
+
+    return rc_params, tex_fallback
+
+
 @contextlib.contextmanager
 def style(
         theme: Union[str, List[str]] = 'default',
-        locale_setting: str = 'sv_SE'
+        locale_setting: str = 'sv_SE',
+        isolated: bool = False,
+        latex: str = 'on',
+        locale_mode: str = 'setlocale'
 ):
-    # Set locale (to get correct decimal separater etc)
-    locale.setlocale(locale.LC_NUMERIC, locale_setting)
+    _check_latex_option(latex)
+    if locale_mode not in ('setlocale', 'formatter'):
+        raise SciplotException(
+            "Invalid locale mode: '" + str(locale_mode) + "'. Correct options are 'setlocale' or 'formatter'.")
 
-    # Get requested themes as list
-    theme_lst = _get_theme_lst(theme)
+    timer = _get_phase_timer()
 
-    # Get list with or without default theme
-    theme_lst = _get_default_theme_lst(theme_lst)
+    # Validate locale before any state is changed
+    locale_entry = get_locale_entry(locale_setting)
 
-    # Get ordered list if parameter files
-    parameter_file_lst = []
-    theme_priority_lst = get_theme_priority_lst()
-    theme_priority_lst.reverse()
+    # Get merged parameters of all requested themes
+    rc_params, theme_dark_mode = _compile_theme(theme)
+    timer.lap('style.compile_theme')
 
-    # Add themes' associated parameter files to list
-    for theme_priority in theme_priority_lst:
-        for theme in theme_lst:
-            if theme == theme_priority:
-                parameter_file_lst += _get_parameter_file_lst(theme)
+    rc_params, tex_fallback = _apply_latex_option(rc_params, latex)
 
-    # Add user defined themes to parameter_file_lst
-    if any(theme not in theme_priority_lst for theme in theme_lst):
-        for theme in theme_lst:
-            if _theme_exists(theme):
-                parameter_file_lst += _get_parameter_file_lst(theme)
+    # Without setlocale(), which is process-wide, tick formatters apply the locale's decimal separator instead
+    if locale_mode == 'formatter':
+        rc_params = dict(rc_params)
+        rc_params['axes.formatter.use_locale'] = False
+        locale_formatter_token = enable_locale_formatter(locale_entry.decimal_separator)
+        previous_locale_setting = None
+    else:
+        # Set locale (to get correct decimal separater etc), and restore the previous one on exit
+        previous_locale_setting = locale.setlocale(locale.LC_NUMERIC)
+        locale.setlocale(locale.LC_NUMERIC, locale_setting)
+        locale_formatter_token = None
+    timer.lap('style.locale')
+
+    dark_mode_token = _dark_mode_var.set(theme_dark_mode)
+    tex_fallback_token = enable_tex_fallback() if tex_fallback else None
+    # Figures drawn in the context share measured text extents, e.g. of tick labels, across layout passes and figures
+    text_extent_cache_token = enable_text_extent_cache()
+    try:
+        if isolated:
+            # Only change the theme's keys, and restore them on exit without touching other contexts
+            style_token = _push_style_layer(rc_params)
+            timer.lap('style.update_rc_params')
+            try:
+                yield
+            finally:
+                timer.restart()
+                _pop_style_layer(style_token)
+                timer.lap('style.restore_rc_params')
+        else:
+            # Set all parameters
+            _set_rc_params(rc_params)
+            timer.lap('style.update_rc_params')
+            try:
+                yield
+            finally:
+                timer.restart()
+                _set_rc_params(_get_default_rc_params())
+                timer.lap('style.restore_rc_params')
+    finally:
+        disable_text_extent_cache(text_extent_cache_token)
+        if tex_fallback_token is not None:
+            disable_tex_fallback(tex_fallback_token)
+        _dark_mode_var.reset(dark_mode_token)
+        if locale_formatter_token is not None:
+            disable_locale_formatter(locale_formatter_token)
+        if previous_locale_setting is not None:
+            locale.setlocale(locale.LC_NUMERIC, previous_locale_setting)
+
+
+def is_dark_mode() -> bool:
+    return _dark_mode_var.get()
+
+
+def compile_theme(
+        theme: Union[str, List[str]] = 'default'
+) -> dict:
+    rc_params, _ = _compile_theme(theme)
+    return dict(rc_params)
+
+
+def _get_mplstyle_value(
+        rc_key: str,
+        value: object
+) -> str:
+    if isinstance(value, (list, tuple)):
+        return ', '.join(_get_mplstyle_value(rc_key, item) for item in value)
+    if not isinstance(value, str):
+        value = repr(value) if isinstance(value, float) else str(value)
+
+    # Style files have one parameter per line, and '#' starts a comment. Hex colors are written without '#', which
+    # Matplotlib accepts for six and eight digits
+    value = ' '.join(value.split('\n')).strip()
+    value = re.sub(r"^#([0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?)$", r"\1", value)
+    value = re.sub(r"(['\"])#([0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?)\1", r"\1\2\1", value)
+    if '#' in value:
+        raise SciplotException(
+            "Unable to export parameter '" + rc_key + "' to a style file, since its value contains '#'. "
+            "Export the theme to a '.pickle' file instead.")
+
+    return value
+
+
+def export_theme(
+        theme: Union[str, List[str]],
+        file_path: Union[str, Path]  # .mplstyle for a Matplotlib style file, or .pickle/.pkl for a pickled dict
+) -> str:
+    # Single file with the compiled rcParams of the theme, which style() applies without resolving parameter files
+    file_path = Path(file_path)
+    rc_params, theme_dark_mode = _compile_theme(theme)
+    theme_lst = _get_default_theme_lst(_get_theme_lst(theme))
+
+    if file_path.suffix == '.mplstyle':
+        line_lst = [
+            '# Sciplot theme: ' + ', '.join(theme_lst),
+            _THEME_BUNDLE_DARK_MODE_PREFIX + str(theme_dark_mode)
+        ]
+        if any('\n' in value and '%' in value for value in rc_params.values() if isinstance(value, str)):
+            raise SciplotException(
+                "Unable to export a multi-line parameter with '%' to a style file. Export the theme to a '.pickle' "
+                "file instead.")
+        for rc_key, value in sorted(rc_params.items()):
+            line_lst.append(rc_key + ': ' + _get_mplstyle_value(rc_key, value))
+        file_path.write_text('\n'.join(line_lst) + '\n', encoding='utf-8')
+    elif file_path.suffix in _THEME_BUNDLE_SUFFIX_TPL:
+        with file_path.open('wb') as bundle_file:
+            pickle.dump({
+                'version': _THEME_BUNDLE_VERSION,
+                'theme': theme_lst,
+                'dark_mode': theme_dark_mode,
+                'rc_params': dict(rc_params)
+            }, bundle_file)
+    else:
+        raise SciplotException(
+            "Invalid theme file type: '" + file_path.suffix + "'. Correct options are '.mplstyle', '.pickle' or '.pkl'.")
+
+    return str(file_path)
+
+
+def _load_theme_bundle(
+        file_path: Path
+) -> Tuple[dict, bool]:
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise SciplotException("Unable to import theme file: '" + str(file_path) + "'")
+
+    theme_key = ('file', str(file_path.resolve()))
+    file_stamp = (stat.st_mtime_ns, stat.st_size)
+    with _theme_cache_lock:
+        cached = _theme_cache.get(theme_key)
+        if cached is not None and cached[0] == file_stamp:
+            _theme_cache.move_to_end(theme_key)
+            return cached[1]
+
+    if file_path.suffix == '.mplstyle':
+        rc_params = dict(matplotlib.rc_params_from_file(str(file_path), fail_on_error=True, use_default_template=False))
+        theme_dark_mode = False
+        with file_path.open('r', encoding='utf-8') as bundle_file:
+            for line in bundle_file:
+                if line.startswith(_THEME_BUNDLE_DARK_MODE_PREFIX):
+                    theme_dark_mode = line[len(_THEME_BUNDLE_DARK_MODE_PREFIX):].strip() == 'True'
+                    break
+    else:
+        # Only load pickled themes from trusted sources, since unpickling can execute code
+        with file_path.open('rb') as bundle_file:
+            bundle = pickle.load(bundle_file)
+        if not isinstance(bundle, dict) or bundle.get('version') != _THEME_BUNDLE_VERSION:
+            raise SciplotException(
+                "Unsupported theme file: '" + str(file_path) + "'. Export the theme again with this version of sciplot.")
+        rc_params = bundle['rc_params']
+        theme_dark_mode = bundle['dark_mode']
+
+    compiled_theme = (rc_params, theme_dark_mode)
+
+    with _theme_cache_lock:
+        _theme_cache[theme_key] = (file_stamp, compiled_theme)
+        _theme_cache.move_to_end(theme_key)
+        while len(_theme_cache) > _THEME_CACHE_SIZE:
+            _theme_cache.popitem(last=False)
 
-    # Get list of parameter objects from file list
-    parameters_lst = _get_parameters_lst(parameter_file_lst)
+    return compiled_theme
 
-    # Set all parameters in list
-    for parameters in parameters_lst:
-        plt.rcParams.update(parameters)
 
-    yield
+def load_theme(
+        file_path: Union[str, Path]
+) -> dict:
+    rc_params, _ = _load_theme_bundle(Path(file_path))
+    return dict(rc_params)
 
-    plt.style.use('default')
-    global dark_mode
-    dark_mode = False
+
+def clear_theme_cache():
+    with _theme_cache_lock:
+        _theme_cache.clear()
 
 
 def get_parameters_dir() -> str:
     return str(Path(__file__).parent / 'parameters')
 
 
+def get_cache_dir() -> str:
+    if os.environ.get('SCIPLOT_CACHE_DIR'):
+        return os.environ['SCIPLOT_CACHE_DIR']
+    if os.name == 'nt' and os.environ.get('LOCALAPPDATA'):
+        return str(Path(os.environ['LOCALAPPDATA']) / 'sciplot' / 'Cache')
+    if os.environ.get('XDG_CACHE_HOME'):
+        return str(Path(os.environ['XDG_CACHE_HOME']) / 'sciplot')
+    return str(Path.home() / '.cache' / 'sciplot')
+
+
 def get_theme_priority_lst() -> List[str]:
     theme_priority_lst = [
         'alpha',
@@ -199,15 +761,18 @@ def get_theme_priority_lst() -> List[str]:
     return theme_priority_lst
 
 
-def get_available_locals():
-    locales_file_path = Path(__file__).parent / 'parameters' / 'locales.csv'
-    with open(locales_file_path, 'r') as file:
-        csv_reader = csv.reader(file, delimiter='\t')
+def get_available_locals(
+        verbose: bool = False
+) -> List[LocaleEntry]:
+    locale_entry_tpl, _ = _get_locale_catalog()
+    if verbose:
         print('=' * 89 + '\n', ' ' * 35, 'Available locales', ' ' * 35, '\n' + '=' * 89 + '\n')
         print('{0:<30}{1:<20}{2}'.format(*['Locale', 'Code set', 'Description']))
         print('-' * 89)
-        for row in csv_reader:
-            print('{0:<30}{1:<20}{2}'.format(*row))
+        for locale_entry in locale_entry_tpl:
+            print('{0:<30}{1:<20}{2}'.format(*locale_entry))
+
+    return list(locale_entry_tpl)
 
 
 def set_size_cm(
@@ -218,17 +783,127 @@ def set_size_cm(
         height = width
 
     cm2in = 1 / 2.54
-    plt.rcParams['figure.figsize'] = (width * cm2in, height * cm2in)
+    matplotlib.rcParams['figure.figsize'] = (width * cm2in, height * cm2in)
+
+
+# Traced memory of one figure() context. Since tracemalloc has a single, process-wide peak, the peak is folded into all
+# open traces before it is reset for a new trace, so that nested and concurrent traces keep their own peaks
+class _MemoryTrace:
+    def __init__(self):
+        global _tracemalloc_started
+        with _memory_trace_lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracemalloc_started = True
+            self.memory_start, self.memory_peak = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc, 'reset_peak'):
+                _fold_memory_peak()
+                tracemalloc.reset_peak()
+                self.memory_peak = self.memory_start
+            _memory_trace_lst.append(self)
+
+    def stop(self) -> Tuple[int, int]:
+        global _tracemalloc_started
+        with _memory_trace_lock:
+            memory_now = tracemalloc.get_traced_memory()[0]
+            _fold_memory_peak()
+            _memory_trace_lst.remove(self)
+            # Tracing is only stopped by the last trace, and only if it was started by a trace
+            if not _memory_trace_lst and _tracemalloc_started:
+                tracemalloc.stop()
+                _tracemalloc_started = False
+
+        return self.memory_peak - self.memory_start, memory_now - self.memory_start
+
+
+def _fold_memory_peak():
+    memory_peak = tracemalloc.get_traced_memory()[1]
+    for memory_trace in _memory_trace_lst:
+        memory_trace.memory_peak = max(memory_trace.memory_peak, memory_peak)
+
+
+@contextlib.contextmanager
+def figure(
+        size: Tuple[float, float] = None,  # width and height in cm, the current figure size by default
+        dpi: float = None,  # the current resolution by default
+        memory_callback: Callable[[int, int], None] = None  # gets the peak and retained traced memory in bytes
+) -> Iterator['matplotlib.figure.Figure']:
+    # Figure outside of pyplot, which keeps no reference to it, in the current style. The figure is released on exit
+    timer = _get_phase_timer()
+
+    # Trace memory allocations only for figures with a memory callback, since tracing slows down Python
+    memory_trace = None if memory_callback is None else _MemoryTrace()
+
+    figsize = None if size is None else (size[0] / 2.54, size[1] / 2.54)
+    fig = matplotlib.figure.Figure(figsize=figsize, dpi=dpi)
+    backend_agg.FigureCanvasAgg(fig)
+    figure_token = _current_figure_var.set(fig)
+    timer.lap('figure.create')
+    try:
+        yield fig
+    finally:
+        timer.restart()
+        _current_figure_var.reset(figure_token)
+        # Break the references between the figure and its artists, so that most of it is freed right away instead of at
+        # the next garbage collection
+        fig.clear()
+        del fig
+        timer.lap('figure.release')
+
+        if memory_trace is not None:
+            memory_callback(*memory_trace.stop())
+
+
+def _get_legend_column_no(
+        ax: 'matplotlib.axes.Axes',
+        label_no: int
+) -> int:
+    # Fewest columns whose rows fit within the axes height. Rows are estimated from the font size, without measuring any
+    # text, since a row is about as high as the font size plus the label spacing
+    rc_params = matplotlib.rcParams
+    font_size = matplotlib.font_manager.FontProperties(size=rc_params['legend.fontsize']).get_size_in_points()
+    axes_height = ax.get_position().height * ax.figure.get_figheight() * 72
+    available_height = axes_height - 2 * (rc_params['legend.borderpad'] + rc_params['legend.borderaxespad']) * font_size
+    row_no = max(int(available_height // (font_size * (1 + rc_params['legend.labelspacing']))), 1)
+
+    return -(-label_no // row_no)
+
+
+def get_legend_handle_lst(
+        color_lst: List[str],
+        handle_type: str = 'line',  # 'line', 'marker' or 'patch'
+        **kwargs  # further properties of all handles, e.g. alpha
+) -> List['matplotlib.artist.Artist']:
+    # Proxy artists for legends of many series, e.g. from get_color_lst(), without plotting anything
+    if handle_type == 'line':
+        return [matplotlib.lines.Line2D([], [], color=color, **kwargs) for color in color_lst]
+    if handle_type == 'marker':
+        kwargs.setdefault('marker', 'o')
+        return [matplotlib.lines.Line2D([], [], color=color, linestyle='none', **kwargs) for color in color_lst]
+    if handle_type == 'patch':
+        return [matplotlib.patches.Rectangle((0, 0), 1, 1, color=color, **kwargs) for color in color_lst]
+
+    raise SciplotException(
+        "Invalid handle type: '" + str(handle_type) + "'. Correct options are 'line', 'marker' or 'patch'.")
 
 
 def set_legend(
-        ax: matplotlib.axes.Axes,
-        plot_tpl: Tuple[matplotlib.artist.Artist],
+        ax: 'matplotlib.axes.Axes',
+        plot_tpl: Tuple['matplotlib.artist.Artist'],
         label_tpl: Tuple[str],
         loc: str = 'lower left',
         outside_plot: bool = False,
-        handle_scale_factor: float = 5.
-):
+        handle_scale_factor: float = 5.,  # marker area of scatter plot handles
+        column_no: Union[int, str] = 1  # number of columns, or 'auto' for as many as needed to fit the axes height
+) -> 'matplotlib.legend.Legend':
+    timer = _get_phase_timer()
+
+    if column_no == 'auto':
+        column_no = _get_legend_column_no(ax, len(label_tpl))
+    elif not isinstance(column_no, int) or column_no < 1:
+        raise SciplotException(
+            "Invalid number of legend columns: '" + str(column_no) + "'. Correct options are a positive integer or 'auto'.")
+
     if outside_plot:
         if 'right' in loc:
             horizontal_anchor = 1.04
@@ -251,7 +926,8 @@ def set_legend(
             label_tpl,
             scatterpoints=1,
             loc=loc,
-            bbox_to_anchor=(horizontal_anchor, vertical_anchor)
+            bbox_to_anchor=(horizontal_anchor, vertical_anchor),
+            ncol=column_no
         )
     else:
         lgnd = ax.legend(
@@ -259,10 +935,19 @@ def set_legend(
             label_tpl,
             scatterpoints=1,
             loc=loc,
+            ncol=column_no
         )
+    timer.lap('set_legend.create_legend')
+
+    # Matplotlib 3.7 renamed legendHandles, and 3.9 removed the old name. Only collection handles, e.g. of scatter plots,
+    # have sizes
+    lgnd_handle_lst = lgnd.legend_handles if hasattr(lgnd, 'legend_handles') else lgnd.legendHandles
+    for lgnd_handle in lgnd_handle_lst:
+        if isinstance(lgnd_handle, matplotlib.collections.Collection):
+            lgnd_handle.set_sizes([handle_scale_factor])
+    timer.lap('set_legend.scale_handles')
 
-    for lgnd_handle in lgnd.legendHandles:
-        lgnd_handle._sizes = [handle_scale_factor]
+    return lgnd
 
 
 def get_color_lst(
@@ -273,30 +958,44 @@ def get_color_lst(
     if color_no == 0 or not isinstance(color_no, int):
         raise SciplotException("Invalid number of colors: '" + str(color_no) + "'")
 
+    return list(_get_color_tpl(color_no, seaborn_color_map, colorful, _dark_mode_var.get()))
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_color_tpl(
+        color_no: int,
+        seaborn_color_map: str,
+        colorful: bool,
+        color_dark_mode: bool
+) -> Tuple[str]:
     if color_no > 4 and colorful:
-        color_lst = sns.color_palette(seaborn_color_map, color_no).as_hex()
-    elif color_no == 1 and not dark_mode:
+        color_lst = get_palette(seaborn_color_map, color_no)
+    elif color_no == 1 and not color_dark_mode:
         color_lst = ['#000000']
-    elif color_no == 1 and dark_mode:
+    elif color_no == 1 and color_dark_mode:
         color_lst = ['#FFFFFF']
-    elif not colorful and dark_mode:
-        color_lst = sns.color_palette(seaborn_color_map, color_no).as_hex()[:-1] + ['#FFFFFF']
+    elif not colorful and color_dark_mode:
+        color_lst = get_palette(seaborn_color_map, color_no)[:-1] + ['#FFFFFF']
     else:
-        color_lst = ['#000000'] + sns.color_palette(seaborn_color_map, color_no).as_hex()[:-1]
+        color_lst = ['#000000'] + get_palette(seaborn_color_map, color_no)[:-1]
 
-    return color_lst
+    return tuple(color_lst)
 
 
-def save_time_stamped_figure(
-        plot_file_name: str,  # filnamn/filsökväg med eller utan ändelse, t.ex. .png eller .pdf
-        save_directory: str = '',  # valfri uppdelning i filnamn och mappsökväg
-        file_type: str = 'png'  # filtyp
-):
-    time_stamp = datetime.today().strftime('%Y-%m-%dT%H.%M')
+def _get_time_stamped_file_path(
+        plot_file_name: str,
+        save_directory: str,
+        file_type: str,
+        time_stamp: str = None
+) -> str:
+    if time_stamp is None:
+        time_stamp = datetime.today().strftime('%Y-%m-%dT%H.%M')
     if 'png' in plot_file_name:
         plot_file_name = str(re.sub(r'\.png$', '', plot_file_name))
     elif 'pdf' in plot_file_name:
         plot_file_name = str(re.sub(r'\.pdf$', '', plot_file_name))
+    elif plot_file_name.endswith('.' + file_type):
+        plot_file_name = plot_file_name[:-len(file_type) - 1]
 
     if save_directory == '':
         plot_file_path = plot_file_name + '_' + time_stamp + '.' + file_type
@@ -306,4 +1005,94 @@ def save_time_stamped_figure(
             plot_file_name + '_' + time_stamp + '.' + file_type
         )
 
-    plt.savefig(plot_file_path, bbox_inches='tight', pad_inches=0.04)
+    return plot_file_path
+
+
+def _get_tight_bbox(
+        fig: 'matplotlib.figure.Figure',
+        pad_inches: float
+) -> 'matplotlib.transforms.Bbox':
+    # Lay out the figure without rasterizing it at the resolution of saved files, as savefig(bbox_inches='tight') does
+    dpi = matplotlib.rcParams['savefig.dpi']
+    figure_dpi = fig.dpi
+    if dpi != 'figure':
+        fig.dpi = dpi
+    try:
+        if hasattr(fig, 'draw_without_rendering'):
+            fig.draw_without_rendering()
+            tight_bbox = fig.get_tightbbox()
+        else:
+            renderer = fig.canvas.get_renderer()
+            fig.draw(renderer)
+            tight_bbox = fig.get_tightbbox(renderer)
+    finally:
+        fig.dpi = figure_dpi
+
+    return tight_bbox.padded(pad_inches)
+
+
+@contextlib.contextmanager
+def _fixed_layout(
+        fig: 'matplotlib.figure.Figure'
+) -> Iterator[None]:
+    # Without a layout engine, savefig() keeps the geometry the tight bounding box was measured with, instead of laying
+    # out the figure again for every file
+    if hasattr(fig, 'get_layout_engine'):
+        layout_engine = fig.get_layout_engine()
+        if layout_engine is None:
+            yield
+            return
+        fig.set_layout_engine('none')
+        try:
+            yield
+        finally:
+            fig.set_layout_engine(layout_engine)
+    else:
+        tight_layout, constrained_layout = fig.get_tight_layout(), fig.get_constrained_layout()
+        fig.set_tight_layout(False)
+        fig.set_constrained_layout(False)
+        try:
+            yield
+        finally:
+            fig.set_constrained_layout(constrained_layout)
+            fig.set_tight_layout(tight_layout)
+
+
+def save_time_stamped_figure(
+        plot_file_name: str,  # filnamn/filsökväg med eller utan ändelse, t.ex. .png eller .pdf
+        save_directory: str = '',  # valfri uppdelning i filnamn och mappsökväg
+        file_type: Union[str, List[str]] = 'png',  # filtyp eller lista med filtyper
+        fig: 'matplotlib.figure.Figure' = None  # figur att spara, annars aktuell figur
+) -> Union[str, List[str]]:
+    if fig is None:
+        fig = _current_figure_var.get()
+    if fig is None:
+        fig = plt.gcf()
+
+    timer = _get_phase_timer()
+
+    if isinstance(file_type, str):
+        plot_file_path = _get_time_stamped_file_path(plot_file_name, str(save_directory), file_type)
+        fig.savefig(plot_file_path, bbox_inches='tight', pad_inches=0.04)
+        timer.lap('save_time_stamped_figure.savefig.' + file_type)
+        return plot_file_path
+
+    # All formats share one time stamp, and the tight bounding box is computed only once
+    time_stamp = datetime.today().strftime('%Y-%m-%dT%H.%M')
+    tight_bbox = _get_tight_bbox(fig, 0.04)
+    timer.lap('save_time_stamped_figure.layout')
+    for file_type_item in file_type:
+        if plot_file_name.endswith('.' + file_type_item):
+            plot_file_name = plot_file_name[:-len(file_type_item) - 1]
+            break
+
+    plot_file_path_lst = []
+    with _fixed_layout(fig):
+        for file_type_item in file_type:
+            plot_file_path = _get_time_stamped_file_path(
+                plot_file_name, str(save_directory), file_type_item, time_stamp)
+            fig.savefig(plot_file_path, format=file_type_item, bbox_inches=tight_bbox)
+            timer.lap('save_time_stamped_figure.savefig.' + file_type_item)
+            plot_file_path_lst.append(plot_file_path)
+
+    return plot_file_path_lst
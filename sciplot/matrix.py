@@ -0,0 +1,270 @@
+import argparse
+import csv
+import itertools
+import os
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from sciplot import samples
+from sciplot._lazy import LazyModule
+from sciplot.main import (
+    _get_default_theme_lst,
+    _get_parameters_lst,
+    _get_theme_lst,
+    _get_theme_parameter_file_lst,
+    get_theme_priority_lst,
+    save_time_stamped_figure,
+    style
+)
+from sciplot.tex import use_tex_cache
+
+futures = LazyModule('concurrent.futures')
+matplotlib = LazyModule('matplotlib')
+backend_agg = LazyModule('matplotlib.backends.backend_agg')
+plt = LazyModule('matplotlib.pyplot')
+
+# Built-in themes of which at most one is used at a time, in the order of get_theme_priority_lst()
+_EXCLUSIVE_THEME_GROUP_LST = [
+    ['alpha', 'beta', 'gamma'],
+    ['no-latex'],
+    ['serif', 'sans-serif'],
+    ['dark']
+]
+
+# Standard sample plots rendered for every theme combination
+SAMPLE_PLOT_DICT: Dict[str, Callable[[], 'matplotlib.figure.Figure']] = {
+    'Line_plot': samples.line_plot,
+    'Histogram_plot': samples.histogram_plot
+}
+
+# Width in inches of a sample plot on the contact sheet
+_CONTACT_SHEET_CELL_WIDTH = 3.5
+
+
+# Outcome of rendering one sample plot with one theme combination. Durations are in seconds, and on failure
+# plot_file_path is None and error holds the formatted traceback
+class ThemeRenderResult(NamedTuple):
+    theme_lst: List[str]
+    plot_name: str
+    plot_file_path: Optional[str]
+    style_duration: float
+    plot_duration: float
+    save_duration: float
+    error: Optional[str]
+
+    @property
+    def duration(self) -> float:
+        return self.style_duration + self.plot_duration + self.save_duration
+
+
+def get_theme_combination_name(
+        theme_lst: List[str]
+) -> str:
+    return '+'.join(theme_lst) if theme_lst else 'default'
+
+
+def _get_parameter_source_key(
+        theme_lst: List[str]
+) -> Tuple[frozenset, bool]:
+    # Parameter file that each parameter of a theme combination is finally taken from. Combinations with the same
+    # sources apply the same parameters, even if their parameter file lists differ in empty, repeated or overridden files
+    full_theme_lst = _get_default_theme_lst(_get_theme_lst(list(theme_lst)))
+    parameter_file_lst = _get_theme_parameter_file_lst(full_theme_lst)
+
+    source_dict = {}
+    for parameter_file, parameters in zip(parameter_file_lst, _get_parameters_lst(parameter_file_lst)):
+        for rc_key in parameters or {}:
+            source_dict[rc_key] = parameter_file
+
+    return frozenset(source_dict.items()), 'dark' in full_theme_lst
+
+
+def get_theme_combination_lst(
+        user_theme_lst: Sequence[str] = ()  # user themes, each combined with all built-in theme combinations
+) -> List[List[str]]:
+    # Combinations of at most one theme of every exclusive group, ordered like get_theme_priority_lst(). Combinations
+    # that take all parameters from the same parameter files, e.g. because a theme file is empty, are only kept once
+    theme_priority_lst = get_theme_priority_lst()
+    group_lst = [[[]] + [[theme] for theme in theme_group] for theme_group in _EXCLUSIVE_THEME_GROUP_LST]
+    group_lst += [[[], [user_theme.lower()]] for user_theme in user_theme_lst]
+
+    theme_combination_lst = []
+    source_key_set = set()
+    for theme_tpl in itertools.product(*group_lst):
+        theme_lst = [theme for theme_sub_lst in theme_tpl for theme in theme_sub_lst]
+        theme_lst.sort(key=lambda theme: theme_priority_lst.index(theme) if theme in theme_priority_lst else -1)
+        source_key = _get_parameter_source_key(theme_lst)
+        if source_key not in source_key_set:
+            source_key_set.add(source_key)
+            theme_combination_lst.append(theme_lst)
+
+    return theme_combination_lst
+
+
+def _render_theme_sample(
+        theme_lst: List[str],
+        plot_name: str,
+        save_directory: str,
+        locale_setting: str,
+        latex: str
+) -> ThemeRenderResult:
+    time_start = time.perf_counter()
+    style_duration = plot_duration = 0.
+    plot_file_path = None
+    error = None
+    try:
+        with style(theme_lst, locale_setting, isolated=True, latex=latex):
+            time_plot = time.perf_counter()
+            style_duration = time_plot - time_start
+            fig = SAMPLE_PLOT_DICT[plot_name]()
+            time_save = time.perf_counter()
+            plot_duration = time_save - time_plot
+            plot_file_path = save_time_stamped_figure(plot_name, save_directory, fig=fig)
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        plt.close('all')
+
+    save_duration = time.perf_counter() - time_start - style_duration - plot_duration
+    return ThemeRenderResult(theme_lst, plot_name, plot_file_path, style_duration, plot_duration, save_duration, error)
+
+
+def _init_theme_worker():
+    matplotlib.use('Agg')
+    use_tex_cache()
+
+
+def render_theme_matrix(
+        save_directory: str,
+        user_theme_lst: Sequence[str] = (),
+        plot_name_lst: Sequence[str] = None,  # names in SAMPLE_PLOT_DICT, all sample plots by default
+        locale_setting: str = 'sv_SE',
+        latex: str = 'auto',
+        workers: int = None
+) -> List[ThemeRenderResult]:
+    # Sample plots of every theme combination are saved in a subdirectory per combination
+    if plot_name_lst is None:
+        plot_name_lst = list(SAMPLE_PLOT_DICT)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    job_lst = []
+    for theme_lst in get_theme_combination_lst(user_theme_lst):
+        combination_directory = Path(save_directory) / get_theme_combination_name(theme_lst)
+        combination_directory.mkdir(parents=True, exist_ok=True)
+        for plot_name in plot_name_lst:
+            job_lst.append((theme_lst, plot_name, str(combination_directory), locale_setting, latex))
+
+    if workers > 1:
+        with futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_theme_worker) as executor:
+            future_lst = [executor.submit(_render_theme_sample, *job) for job in job_lst]
+            return [future.result() for future in future_lst]
+
+    _init_theme_worker()
+    return [_render_theme_sample(*job) for job in job_lst]
+
+
+def save_contact_sheet(
+        result_lst: List[ThemeRenderResult],
+        plot_file_name: str,
+        save_directory: str = ''
+) -> str:
+    # One row per theme combination and one column per sample plot, with Matplotlib's default style
+    theme_name_lst = list(dict.fromkeys(get_theme_combination_name(result.theme_lst) for result in result_lst))
+    plot_name_lst = list(dict.fromkeys(result.plot_name for result in result_lst))
+    result_dict = {(get_theme_combination_name(result.theme_lst), result.plot_name): result for result in result_lst}
+
+    with matplotlib.style.context('default'):
+        fig = matplotlib.figure.Figure(
+            figsize=(_CONTACT_SHEET_CELL_WIDTH * len(plot_name_lst), _CONTACT_SHEET_CELL_WIDTH * len(theme_name_lst)),
+            constrained_layout=True
+        )
+        backend_agg.FigureCanvasAgg(fig)
+        ax_ar = fig.subplots(len(theme_name_lst), len(plot_name_lst), squeeze=False)
+
+        for row, theme_name in enumerate(theme_name_lst):
+            for column, plot_name in enumerate(plot_name_lst):
+                ax = ax_ar[row, column]
+                ax.set_axis_off()
+                ax.set_title(theme_name + ': ' + plot_name, fontsize='small')
+                result = result_dict.get((theme_name, plot_name))
+                if result is None or result.plot_file_path is None:
+                    ax.text(0.5, 0.5, 'Failed', ha='center', va='center', color='tab:red', transform=ax.transAxes)
+                else:
+                    ax.imshow(matplotlib.image.imread(result.plot_file_path))
+
+        return save_time_stamped_figure(plot_file_name, save_directory, fig=fig)
+
+
+def save_timing_report(
+        result_lst: List[ThemeRenderResult],
+        report_file_path: str
+) -> str:
+    with open(report_file_path, 'w', newline='', encoding='utf-8') as report_file:
+        writer = csv.writer(report_file)
+        writer.writerow(['theme', 'plot', 'style_s', 'plot_s', 'save_s', 'total_s', 'error'])
+        for result in sorted(result_lst, key=lambda result: result.duration, reverse=True):
+            writer.writerow([
+                get_theme_combination_name(result.theme_lst),
+                result.plot_name,
+                '{:.4f}'.format(result.style_duration),
+                '{:.4f}'.format(result.plot_duration),
+                '{:.4f}'.format(result.save_duration),
+                '{:.4f}'.format(result.duration),
+                '' if result.error is None else result.error.strip().splitlines()[-1]
+            ])
+
+    return report_file_path
+
+
+def main(
+        argv: Sequence[str] = None,
+        prog: str = 'python -m sciplot.matrix'
+) -> int:
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Render the sample plots for all theme combinations, with a contact sheet and a timing report')
+    parser.add_argument('save_directory', help='directory for the rendered plots, contact sheet and timing report')
+    parser.add_argument('--user-theme', action='append', default=[], dest='user_theme_lst',
+                        help='user theme to combine with the built-in themes, can be given several times')
+    parser.add_argument('--plot', action='append', choices=list(SAMPLE_PLOT_DICT), dest='plot_name_lst',
+                        help='sample plot to render, all by default')
+    parser.add_argument('--locale', default='sv_SE', dest='locale_setting', help='locale of the plots')
+    parser.add_argument('--latex', default='auto', choices=['on', 'auto', 'off'], help='LaTeX mode of style()')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    args = parser.parse_args(argv)
+
+    result_lst = render_theme_matrix(
+        args.save_directory,
+        args.user_theme_lst,
+        args.plot_name_lst,
+        args.locale_setting,
+        args.latex,
+        args.workers
+    )
+    contact_sheet_path = save_contact_sheet(result_lst, 'Contact_sheet', args.save_directory)
+    report_file_path = save_timing_report(result_lst, str(Path(args.save_directory) / 'timings.csv'))
+
+    for result in result_lst:
+        print('{:<40} {:<16} {:8.3f} s{}'.format(
+            get_theme_combination_name(result.theme_lst),
+            result.plot_name,
+            result.duration,
+            '' if result.error is None else '  FAILED'
+        ))
+    print('Contact sheet: ' + contact_sheet_path)
+    print('Timing report: ' + report_file_path)
+
+    failed_no = sum(result.error is not None for result in result_lst)
+    if failed_no:
+        print(str(failed_no) + ' renders failed:')
+        for result in result_lst:
+            if result.error is not None:
+                print(get_theme_combination_name(result.theme_lst) + ' ' + result.plot_name + ':\n' + result.error)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
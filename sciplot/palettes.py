@@ -0,0 +1,143 @@
+import functools
+import itertools
+from typing import List, Tuple
+from sciplot._lazy import LazyModule
+from sciplot._palette_data import SEABORN_LUT_HEX_DICT, SEABORN_PALETTE_DICT
+
+matplotlib = LazyModule('matplotlib')
+matplotlib_cm = LazyModule('matplotlib.cm')
+np = LazyModule('numpy')
+sns = LazyModule('seaborn')
+
+# Number of entries in colormap lookup tables (same as Matplotlib's 'image.lut' default)
+_LUT_SIZE = 256
+
+# Number of colors in Matplotlib's qualitative colormaps, which are indexed rather than interpolated
+_QUALITATIVE_COLOR_NO_DICT = {
+    'tab10': 10,
+    'tab20': 20,
+    'tab20b': 20,
+    'tab20c': 20,
+    'Set1': 9,
+    'Set2': 8,
+    'Set3': 12,
+    'Accent': 8,
+    'Paired': 12,
+    'Pastel1': 9,
+    'Pastel2': 8,
+    'Dark2': 8
+}
+
+# RGB coefficients of the cubehelix colour scheme by D.A. Green
+_CUBEHELIX_COEFFICIENT_TPL = (
+    (-0.14861, 1.78277),
+    (-0.29227, -0.90649),
+    (1.97294, 0.0)
+)
+
+
+def _get_cubehelix_lut(
+        reverse: bool = False,
+        gamma: float = 1.0,
+        start: float = 0.5,
+        rotation: float = -1.5,
+        hue: float = 1.0
+) -> 'np.ndarray':
+    # Sample the helix exactly like Matplotlib's 'cubehelix' colormap, so that the hex values are identical
+    x = np.linspace(0, 1, _LUT_SIZE)
+    if reverse:
+        x = 1 - x
+    x_gamma = x ** gamma
+    amplitude = hue * x_gamma * (1 - x_gamma) / 2
+    phi = 2 * np.pi * (start / 3 + rotation * x)
+    coefficient_ar = np.array(_CUBEHELIX_COEFFICIENT_TPL)
+    rgb_ar = x_gamma + amplitude * (coefficient_ar[:, :1] * np.cos(phi) + coefficient_ar[:, 1:] * np.sin(phi))
+
+    return np.clip(rgb_ar, 0, 1).T
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lut(
+        palette_name: str
+) -> 'np.ndarray':
+    reverse = palette_name.endswith('_r')
+    base_name = palette_name[:-2] if reverse else palette_name
+
+    if base_name == 'cubehelix':
+        # Round to 8-bit here already, as Matplotlib does when converting to hex
+        lut = np.round(_get_cubehelix_lut(reverse) * 255).astype(np.uint8)
+    elif base_name in SEABORN_LUT_HEX_DICT:
+        lut = np.frombuffer(bytes.fromhex(''.join(SEABORN_LUT_HEX_DICT[base_name])), dtype=np.uint8).reshape(-1, 3)
+        if reverse:
+            lut = lut[::-1]
+    else:
+        raise KeyError(palette_name)
+
+    lut.flags.writeable = False
+    return lut
+
+
+def _get_hex_lst(
+        rgb_ar: 'np.ndarray'
+) -> List[str]:
+    return ['#{0:02x}{1:02x}{2:02x}'.format(*rgb) for rgb in rgb_ar.tolist()]
+
+
+def _get_colormap(
+        palette_name: str
+) -> 'matplotlib.colors.Colormap':
+    # The colormap registry is only available from Matplotlib 3.5, and get_cmap() was removed in Matplotlib 3.9. Both
+    # raise KeyError or ValueError for unknown names
+    if hasattr(matplotlib, 'colormaps'):
+        return matplotlib.colormaps[palette_name]
+    return matplotlib_cm.get_cmap(palette_name)
+
+
+def _get_colormap_hex_lst(
+        palette_name: str,
+        color_no: int
+) -> List[str]:
+    # Evenly spaced samples, excluding the extremes of the colormap
+    x_ar = np.linspace(0, 1, color_no + 2)[1:-1]
+
+    try:
+        lut = _get_lut(palette_name)
+        index_ar = (x_ar * len(lut)).astype(int)
+        return _get_hex_lst(lut[index_ar])
+    except KeyError:
+        pass
+
+    colormap = _get_colormap(palette_name)
+    if palette_name in _QUALITATIVE_COLOR_NO_DICT:
+        x_ar = np.linspace(0, 1, _QUALITATIVE_COLOR_NO_DICT[palette_name])[:color_no]
+    rgb_ar = np.round(colormap(x_ar)[:, :3] * 255).astype(int)
+    return _get_hex_lst(rgb_ar)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_palette_tpl(
+        palette_name: str,
+        color_no: int
+) -> Tuple[str]:
+    if palette_name in SEABORN_PALETTE_DICT:
+        hex_lst = [color.lower() for color in SEABORN_PALETTE_DICT[palette_name]]
+    else:
+        try:
+            hex_lst = _get_colormap_hex_lst(palette_name, color_no)
+        except (KeyError, ValueError):
+            # Palette specifications only known to Seaborn, e.g. 'hls' or 'ch:s=.25,rot=-.25'
+            try:
+                return tuple(sns.color_palette(palette_name, color_no).as_hex())
+            except ImportError:
+                raise ValueError(
+                    "Palette '" + palette_name + "' requires Seaborn, which is not installed") from None
+
+    # Always return as many colors as requested, like Seaborn
+    return tuple(itertools.islice(itertools.cycle(hex_lst), color_no))
+
+
+def get_palette(
+        palette_name: str,
+        color_no: int
+) -> List[str]:
+    return list(_get_palette_tpl(palette_name, color_no))
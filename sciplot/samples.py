@@ -0,0 +1,87 @@
+from typing import Tuple
+from sciplot._lazy import LazyModule
+from sciplot.main import get_color_lst, set_legend, set_size_cm
+
+matplotlib = LazyModule('matplotlib')
+np = LazyModule('numpy')
+plt = LazyModule('matplotlib.pyplot')
+
+# Sample plots of example_plots/example_plots.py, used by benchmarks and theme renders. Labels use siunitx macros, which
+# style() translates to mathtext when LaTeX is not used
+
+
+def _get_pareto_pdf(
+        x: 'np.ndarray',
+        scale: float,
+        shape: float
+) -> 'np.ndarray':
+    pdf = shape * scale ** shape / np.maximum(x, scale) ** (shape + 1)
+    return np.where(x >= scale, pdf, 0.)
+
+
+def line_plot(
+        size: Tuple[float, float] = (7, 7)
+) -> 'matplotlib.figure.Figure':
+    x_m = 2  # scale
+    alpha_lst = [1, 2, 3, 4]  # shape parameters
+    x = np.linspace(0, 6, 1000)
+
+    pdf = np.array([_get_pareto_pdf(x, x_m, alpha) for alpha in alpha_lst])
+
+    set_size_cm(*size)
+    fig, ax = plt.subplots(1, 1)
+
+    fig.suptitle(r'Pareto PDF' +
+                 r' $p(x \,|\, x_\mathrm{m}, \alpha) = \frac{\alpha x_\mathrm{m}^\alpha}{x^{\alpha+1}}$' +
+                 r' with $x_\mathrm{m}=2$')
+
+    line_plot_lst = ax.plot(x, pdf.T)
+
+    set_legend(
+        ax=ax,
+        plot_tpl=tuple(line_plot_lst),
+        label_tpl=tuple(r'$\alpha=' + str(alpha) + '$' for alpha in alpha_lst),
+        loc='upper right'
+    )
+
+    ax.set_xlabel('$x$')
+    ax.set_ylabel(r'$p(x \,|\, x_\mathrm{m}, \alpha)$')
+
+    return fig
+
+
+def histogram_plot(
+        size: Tuple[float, float] = (16, 8),
+        sample_no: int = 10000
+) -> 'matplotlib.figure.Figure':
+    rng = np.random.RandomState(42)
+    mean_ar = np.array([4.5, 6.1, 8.3])
+    std_ar = np.array([0.2, 0.9, 0.5])
+    data_ar = rng.normal(mean_ar[:, np.newaxis], std_ar[:, np.newaxis], (len(mean_ar), sample_no))
+
+    set_size_cm(*size)
+    fig, ax = plt.subplots(1, 1)
+
+    fig.suptitle(r'Histogram of normally distributed velocities with \SI{' + str(sample_no) + r'}{} samples')
+
+    plot_lst = []
+    color_lst = get_color_lst(len(data_ar), seaborn_color_map='rocket', colorful=False)
+
+    for i, data in enumerate(data_ar):
+        ax.hist(data, density=True, bins=100, alpha=0.7, color=color_lst[i])
+        plot_lst.append(matplotlib.patches.Rectangle((0, 0), 1, 1, color=color_lst[i], alpha=0.7))
+
+    set_legend(
+        ax=ax,
+        plot_tpl=tuple(plot_lst),
+        label_tpl=tuple(
+            r'$\mu=\SI{' + str(mean) + r'}{}$, $\sigma=\SI{' + str(std) + r'}{}$' for mean, std in zip(mean_ar, std_ar)
+        ),
+        loc='lower right',
+        outside_plot=True
+    )
+
+    ax.set_xlabel(r'Velocity (\si{\metre\per\second})')
+    ax.set_ylabel(r'Relative frequency')
+
+    return fig
@@ -0,0 +1,194 @@
+import contextvars
+import io
+import os
+import pickle
+import threading
+from typing import Dict
+from sciplot._lazy import LazyModule
+from sciplot.locales import _decimal_separator_var, disable_locale_formatter, enable_locale_formatter
+from sciplot.main import _get_time_stamped_file_path
+
+asyncio = LazyModule('asyncio')
+futures = LazyModule('concurrent.futures')
+matplotlib = LazyModule('matplotlib')
+
+# Writer used by save_time_stamped_figure_async() when no writer is given
+_default_writer = None
+_default_writer_lock = threading.Lock()
+
+
+def _get_savefig_kwargs(
+        fig: 'matplotlib.figure.Figure'
+) -> Dict[str, object]:
+    # Resolve savefig rcParams when the figure is submitted, since rcParams may have changed when it is encoded
+    rc_params = matplotlib.rcParams
+    savefig_kwargs = {
+        'dpi': fig.dpi if rc_params['savefig.dpi'] == 'figure' else rc_params['savefig.dpi'],
+        'transparent': rc_params['savefig.transparent'],
+        'bbox_inches': 'tight',
+        'pad_inches': 0.04
+    }
+    if not rc_params['savefig.transparent']:
+        for key in ('facecolor', 'edgecolor'):
+            color = rc_params['savefig.' + key]
+            savefig_kwargs[key] = getattr(fig, 'get_' + key)() if color == 'auto' else color
+
+    return savefig_kwargs
+
+
+def _get_style_rc_params() -> Dict[str, object]:
+    # Only style parameters are applied when the figure is encoded, since e.g. the backend of a worker must not change
+    style_blacklist = matplotlib.style.core.STYLE_BLACKLIST
+    return {key: value for key, value in dict.items(matplotlib.rcParams) if key not in style_blacklist}
+
+
+def _write_figure_file(
+        fig: 'matplotlib.figure.Figure',
+        rc_params: Dict[str, object],
+        plot_file_path: str,
+        file_type: str,
+        savefig_kwargs: Dict[str, object]
+) -> str:
+    # Encode into memory first, and move the complete file into place, so that readers never see a partial file. The
+    # figure is encoded with the rcParams it was submitted with, which may have changed since, e.g. after style() exits
+    buffer = io.BytesIO()
+    with matplotlib.rc_context(rc_params):
+        fig.savefig(buffer, format=file_type, **savefig_kwargs)
+
+    temp_file_path = plot_file_path + '.' + str(os.getpid()) + '.' + str(threading.get_ident()) + '.tmp'
+    with open(temp_file_path, 'wb') as plot_file:
+        plot_file.write(buffer.getbuffer())
+    os.replace(temp_file_path, plot_file_path)
+
+    return plot_file_path
+
+
+def _write_pickled_figure_file(
+        fig_bytes: bytes,
+        rc_params: Dict[str, object],
+        decimal_separator: str,
+        plot_file_path: str,
+        file_type: str,
+        savefig_kwargs: Dict[str, object]
+) -> str:
+    # Worker processes render with the rcParams and tick label decimal separator the figure was submitted with
+    matplotlib.use('Agg')
+    locale_formatter_token = None if decimal_separator is None else enable_locale_formatter(decimal_separator)
+    fig = pickle.loads(fig_bytes)
+    try:
+        return _write_figure_file(fig, rc_params, plot_file_path, file_type, savefig_kwargs)
+    finally:
+        matplotlib.pyplot.close(fig)
+        if locale_formatter_token is not None:
+            disable_locale_formatter(locale_formatter_token)
+
+
+# Background writer that encodes and saves figures on a thread or process pool. At most max_queue_size figures are
+# pending at a time, and submit() blocks until there is room. Figures must not be changed after they are submitted
+class FigureWriter:
+    def __init__(
+            self,
+            max_queue_size: int = 8,
+            workers: int = None,
+            use_processes: bool = False
+    ):
+        if workers is None:
+            workers = min(4, os.cpu_count() or 1)
+
+        self._use_processes = use_processes
+        self._slots = threading.BoundedSemaphore(max_queue_size)
+        if use_processes:
+            self._executor = futures.ProcessPoolExecutor(max_workers=workers)
+        else:
+            self._executor = futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sciplot-writer')
+
+    def submit(
+            self,
+            fig: 'matplotlib.figure.Figure',
+            plot_file_name: str,
+            save_directory: str = '',
+            file_type: str = 'png'
+    ) -> 'futures.Future':
+        plot_file_path = _get_time_stamped_file_path(plot_file_name, str(save_directory), file_type)
+        savefig_kwargs = _get_savefig_kwargs(fig)
+        rc_params = _get_style_rc_params()
+
+        self._slots.acquire()
+        try:
+            if self._use_processes:
+                future = self._executor.submit(
+                    _write_pickled_figure_file,
+                    pickle.dumps(fig),
+                    rc_params,
+                    _decimal_separator_var.get(),
+                    plot_file_path,
+                    file_type,
+                    savefig_kwargs
+                )
+            else:
+                # Threads encode in the submitting context, e.g. with the tick label decimal separator of its style()
+                future = self._executor.submit(
+                    contextvars.copy_context().run,
+                    _write_figure_file,
+                    fig,
+                    rc_params,
+                    plot_file_path,
+                    file_type,
+                    savefig_kwargs
+                )
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def close(
+            self,
+            wait: bool = True
+    ):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> 'FigureWriter':
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def _get_default_writer() -> FigureWriter:
+    global _default_writer
+    with _default_writer_lock:
+        if _default_writer is None:
+            _default_writer = FigureWriter()
+        return _default_writer
+
+
+def save_time_stamped_figure_background(
+        fig: 'matplotlib.figure.Figure',
+        plot_file_name: str,
+        save_directory: str = '',
+        file_type: str = 'png',
+        writer: FigureWriter = None
+) -> 'futures.Future':
+    if writer is None:
+        writer = _get_default_writer()
+    return writer.submit(fig, plot_file_name, save_directory, file_type)
+
+
+async def save_time_stamped_figure_async(
+        fig: 'matplotlib.figure.Figure',
+        plot_file_name: str,
+        save_directory: str = '',
+        file_type: str = 'png',
+        writer: FigureWriter = None
+) -> str:
+    if writer is None:
+        writer = _get_default_writer()
+
+    # Submitting blocks while the writer's queue is full, which must not block the event loop. The executor thread does
+    # not inherit the caller's context, so submit() runs in a copy of it
+    loop = asyncio.get_running_loop()
+    future = await loop.run_in_executor(
+        None, contextvars.copy_context().run, writer.submit, fig, plot_file_name, save_directory, file_type)
+    return await asyncio.wrap_future(future)
@@ -0,0 +1,135 @@
+from typing import Callable, ContextManager, List, Sequence, Tuple, Union
+from sciplot._lazy import LazyModule
+from sciplot.live import _freeze_layout, _unfreeze_layout
+from sciplot.main import _get_time_stamped_file_path, save_time_stamped_figure, style
+
+matplotlib = LazyModule('matplotlib')
+backend_agg = LazyModule('matplotlib.backends.backend_agg')
+np = LazyModule('numpy')
+
+_CM_TO_INCH = 1 / 2.54
+
+
+# Styled figure that is built once and saved for many datasets. Everything except the data artists returned by
+# build_func, e.g. axes, labels and legends, is drawn once into a cached background, and each saved figure only draws
+# the data artists on top of a copy of it (blitting). The background is redrawn when the axis limits change
+class FigureTemplate:
+    def __init__(
+            self,
+            build_func: Callable[['matplotlib.figure.Figure'], Sequence['matplotlib.artist.Artist']],
+            theme: Union[str, List[str]] = 'default',
+            locale_setting: str = 'sv_SE',
+            latex: str = 'on',
+            size: Tuple[float, float] = None,  # width and height in cm, the current figure size by default
+            autoscale: bool = False  # rescale axes without fixed limits to the data of every dataset
+    ):
+        self._style_args = (theme, locale_setting)
+        self._latex = latex
+        self._autoscale = autoscale
+        self._background = None
+        self._lim_tpl = None
+        self._tight_bbox = None
+        self._layout_engine = None
+        self._full_draw_no = 0
+
+        with self.styled():
+            figsize = None if size is None else (size[0] * _CM_TO_INCH, size[1] * _CM_TO_INCH)
+            # Frames are drawn at the resolution of saved figures
+            savefig_dpi = matplotlib.rcParams['savefig.dpi']
+            self.fig = matplotlib.figure.Figure(figsize=figsize, dpi=None if savefig_dpi == 'figure' else savefig_dpi)
+            self.canvas = backend_agg.FigureCanvasAgg(self.fig)
+            self.artist_tpl = tuple(build_func(self.fig))
+
+        # Animated artists are left out of full draws, and drawn on top of the background instead. Legends are
+        # animated as well, so that they stay above the data
+        self._overlay_tpl = tuple(ax.get_legend() for ax in self.fig.axes if ax.get_legend() is not None)
+        for artist in self.artist_tpl + self._overlay_tpl:
+            artist.set_animated(True)
+
+    def styled(self) -> ContextManager:
+        # Style context of the template, e.g. for changing labels after it has been built
+        return style(*self._style_args, isolated=True, latex=self._latex, locale_mode='formatter')
+
+    def _get_lim_tpl(self) -> Tuple[Tuple[float, ...], ...]:
+        return tuple(tuple(ax.viewLim.bounds) for ax in self.fig.axes)
+
+    def _draw_full(self):
+        self.canvas.draw()
+        if self._layout_engine is None:
+            self._layout_engine = _freeze_layout(self.fig)
+
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._lim_tpl = self._get_lim_tpl()
+
+        # Pixel rows and columns of the tight bounding box, as saved by save_time_stamped_figure(). Data artists are
+        # clipped to their axes, so the bounding box is the same for all datasets
+        tight_bbox = self.fig.get_tightbbox(self.canvas.get_renderer()).padded(0.04)
+        dpi = self.fig.dpi
+        height = self.fig.bbox.height
+        self._tight_bbox = (
+            max(int(np.floor(height - tight_bbox.y1 * dpi)), 0),
+            min(int(np.ceil(height - tight_bbox.y0 * dpi)), int(height)),
+            max(int(np.floor(tight_bbox.x0 * dpi)), 0),
+            min(int(np.ceil(tight_bbox.x1 * dpi)), int(self.fig.bbox.width))
+        )
+        self._full_draw_no += 1
+
+    def render(self) -> 'np.ndarray':
+        # Draws the current data of the data artists and returns the RGBA pixels of the whole figure, valid until the
+        # next render
+        with self.styled():
+            if self._autoscale:
+                for ax in self.fig.axes:
+                    ax.relim(visible_only=True)
+                    ax.autoscale_view()
+
+            if self._background is None or self._get_lim_tpl() != self._lim_tpl:
+                self._draw_full()
+            else:
+                self.canvas.restore_region(self._background)
+
+            for artist in self.artist_tpl + self._overlay_tpl:
+                self.fig.draw_artist(artist)
+
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def save(
+            self,
+            plot_file_name: str,
+            save_directory: str = '',
+            file_type: Union[str, List[str]] = 'png'
+    ) -> Union[str, List[str]]:
+        # PNG files are written from the blitted frame, cropped to the cached tight bounding box. Other file types are
+        # saved with a full draw by save_time_stamped_figure()
+        if file_type != 'png':
+            for artist in self.artist_tpl + self._overlay_tpl:
+                artist.set_animated(False)
+            try:
+                with self.styled():
+                    return save_time_stamped_figure(plot_file_name, save_directory, file_type, fig=self.fig)
+            finally:
+                for artist in self.artist_tpl + self._overlay_tpl:
+                    artist.set_animated(True)
+
+        frame = self.render()
+        row_start, row_stop, column_start, column_stop = self._tight_bbox
+
+        plot_file_path = _get_time_stamped_file_path(plot_file_name, str(save_directory), 'png')
+        matplotlib.image.imsave(
+            plot_file_path,
+            np.ascontiguousarray(frame[row_start:row_stop, column_start:column_stop]),
+            format='png',
+            dpi=self.fig.dpi
+        )
+        return plot_file_path
+
+    def redraw(self):
+        # Full redraw with a new layout after the figure has been changed, e.g. axis labels set with styled()
+        if self._layout_engine is not None:
+            _unfreeze_layout(self.fig, self._layout_engine)
+            self._layout_engine = None
+        self._background = None
+
+    def close(self):
+        self._background = None
+        self.fig.clear()
@@ -0,0 +1,226 @@
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from sciplot._lazy import LazyModule
+from sciplot.main import SciplotException, style
+
+futures = LazyModule('concurrent.futures')
+matplotlib = LazyModule('matplotlib')
+mpl_compare = LazyModule('matplotlib.testing.compare')
+plt = LazyModule('matplotlib.pyplot')
+np = LazyModule('numpy')
+
+# Format version of hash library files
+_HASH_LIBRARY_VERSION = 1
+
+# Side of the grayscale thumbnail whose gradients make up the perceptual hash, i.e. a hash of _HASH_SIZE ** 2 bits
+_HASH_SIZE = 16
+
+
+# Figure rendered for an image comparison by compare_figures(). The plot callable must be picklable, i.e. defined at
+# module level, and should return the figure (the current pyplot figure is used if it returns None)
+class ImageJob(NamedTuple):
+    name: str
+    plot_func: Callable
+    theme: Union[str, List[str]] = 'default'
+    args: tuple = ()
+    kwargs: Optional[dict] = None
+
+
+# Exact hash of the pixels and perceptual hash of a rendered figure
+class FigureHashes(NamedTuple):
+    exact: str
+    perceptual: str
+
+
+# Outcome of an image comparison. Status is 'exact' if the pixels are identical to the hash library, 'similar' if the
+# pixel difference to the baseline image is within the tolerance, 'different', 'unverified' if the pixels differ from
+# the hash library and there is no baseline image to compare with, 'missing' if the figure is not in the hash library,
+# or 'generated' when the hash library is generated. The perceptual distance to the hash library is for diagnostics only
+class ImageComparison(NamedTuple):
+    name: str
+    status: str
+    hashes: FigureHashes
+    perceptual_distance: Optional[int]
+    rms: Optional[float]
+
+    @property
+    def passed(self) -> bool:
+        return self.status in ('exact', 'similar', 'generated')
+
+
+def _get_image_ar(
+        png_bytes: bytes
+) -> 'np.ndarray':
+    # RGBA pixels as 8-bit integers, as used by Matplotlib's image comparison
+    return (matplotlib.image.imread(io.BytesIO(png_bytes), format='png') * 255).round().astype(np.uint8)
+
+
+def _get_area_mean_ar(
+        gray_ar: 'np.ndarray',
+        shape: Tuple[int, int]
+) -> 'np.ndarray':
+    # Downscaled image, where each pixel is the mean of the area it covers
+    row_edge_ar = np.linspace(0, gray_ar.shape[0], shape[0] + 1).astype(int)
+    column_edge_ar = np.linspace(0, gray_ar.shape[1], shape[1] + 1).astype(int)
+    area_sum_ar = np.add.reduceat(np.add.reduceat(gray_ar, row_edge_ar[:-1], axis=0), column_edge_ar[:-1], axis=1)
+    return area_sum_ar / np.outer(np.diff(row_edge_ar), np.diff(column_edge_ar))
+
+
+def get_image_hashes(
+        image_ar: 'np.ndarray'
+) -> FigureHashes:
+    # The exact hash covers the shape and all pixels, and the perceptual hash (difference hash) is the sign of the
+    # horizontal gradients of a small grayscale thumbnail, which is insensitive to antialiasing and font hinting
+    exact_hash = hashlib.sha256(str(image_ar.shape).encode('ascii') + np.ascontiguousarray(image_ar).tobytes())
+
+    gray_ar = image_ar[:, :, :3].astype(float).mean(axis=2)
+    if gray_ar.shape[0] < _HASH_SIZE or gray_ar.shape[1] < _HASH_SIZE + 1:
+        gray_ar = np.kron(gray_ar, np.ones((_HASH_SIZE, _HASH_SIZE + 1)))
+    thumbnail_ar = _get_area_mean_ar(gray_ar, (_HASH_SIZE, _HASH_SIZE + 1))
+    bit_ar = thumbnail_ar[:, 1:] > thumbnail_ar[:, :-1]
+    perceptual_hash = np.packbits(bit_ar.ravel()).tobytes().hex()
+
+    return FigureHashes(exact_hash.hexdigest(), perceptual_hash)
+
+
+def get_figure_png(
+        fig: 'matplotlib.figure.Figure'
+) -> bytes:
+    # Saved like pytest-mpl saves figures, so that its baseline images can be compared with
+    png_buffer = io.BytesIO()
+    fig.savefig(png_buffer, format='png')
+    return png_buffer.getvalue()
+
+
+def get_perceptual_distance(
+        perceptual_hash: str,
+        other_perceptual_hash: str
+) -> int:
+    # Number of differing bits
+    return bin(int(perceptual_hash, 16) ^ int(other_perceptual_hash, 16)).count('1')
+
+
+def load_hash_library(
+        hash_library_path: Union[str, Path]
+) -> Dict[str, FigureHashes]:
+    try:
+        with open(hash_library_path, 'r', encoding='utf-8') as hash_library_file:
+            hash_library = json.load(hash_library_file)
+    except FileNotFoundError:
+        return {}
+
+    if hash_library.get('version') != _HASH_LIBRARY_VERSION:
+        raise SciplotException(
+            "Unsupported hash library: '" + str(hash_library_path) + "'. Generate it again with this version of sciplot.")
+    return {name: FigureHashes(**hashes) for name, hashes in hash_library['hashes'].items()}
+
+
+def save_hash_library(
+        hash_library_path: Union[str, Path],
+        hash_dict: Dict[str, FigureHashes]
+):
+    hash_library = {
+        'version': _HASH_LIBRARY_VERSION,
+        'hashes': {name: hashes._asdict() for name, hashes in sorted(hash_dict.items())}
+    }
+    with open(hash_library_path, 'w', encoding='utf-8') as hash_library_file:
+        json.dump(hash_library, hash_library_file, indent=2)
+        hash_library_file.write('\n')
+
+
+def compare_image(
+        name: str,
+        png_bytes: bytes,
+        hash_dict: Dict[str, FigureHashes],
+        baseline_dir: Union[str, Path] = None,
+        tolerance: float = 2.,  # RMS pixel difference to the baseline image of similar images
+        hashes: FigureHashes = None
+) -> ImageComparison:
+    if hashes is None:
+        hashes = get_image_hashes(_get_image_ar(png_bytes))
+
+    library_hashes = hash_dict.get(name)
+    if library_hashes is None:
+        return ImageComparison(name, 'missing', hashes, None, None)
+    if hashes.exact == library_hashes.exact:
+        return ImageComparison(name, 'exact', hashes, 0, 0.)
+
+    # Perceptual hashes miss small but real changes, e.g. of a label or decimal marker, so every figure that is not
+    # identical is compared pixel by pixel
+    perceptual_distance = get_perceptual_distance(hashes.perceptual, library_hashes.perceptual)
+    baseline_path = None if baseline_dir is None else Path(baseline_dir) / (name + '.png')
+    if baseline_path is None or not baseline_path.is_file():
+        return ImageComparison(name, 'unverified', hashes, perceptual_distance, None)
+
+    image_ar = _get_image_ar(png_bytes)
+    baseline_image_ar = _get_image_ar(baseline_path.read_bytes())
+    if image_ar.shape != baseline_image_ar.shape:
+        return ImageComparison(name, 'different', hashes, perceptual_distance, None)
+
+    rms = float(mpl_compare.calculate_rms(baseline_image_ar, image_ar))
+    status = 'similar' if rms <= tolerance else 'different'
+    return ImageComparison(name, status, hashes, perceptual_distance, rms)
+
+
+def _render_image_job(
+        job: ImageJob,
+        locale_setting: str,
+        latex: str
+) -> Tuple[str, bytes, FigureHashes]:
+    # Rendered and hashed in worker processes, so that only the PNG file and the hashes are sent back
+    matplotlib.use('Agg')
+    try:
+        with style(job.theme, locale_setting, isolated=True, latex=latex):
+            fig = job.plot_func(*job.args, **(job.kwargs or {}))
+            if fig is None:
+                fig = plt.gcf()
+            png_bytes = get_figure_png(fig)
+    finally:
+        plt.close('all')
+
+    return job.name, png_bytes, get_image_hashes(_get_image_ar(png_bytes))
+
+
+def compare_figures(
+        jobs: Sequence[ImageJob],
+        hash_library_path: Union[str, Path],
+        baseline_dir: Union[str, Path] = None,
+        locale_setting: str = 'C',
+        latex: str = 'auto',
+        workers: int = None,
+        generate: bool = False,  # store the hashes (and baseline images) of all figures instead of comparing them
+        tolerance: float = 2.
+) -> List[ImageComparison]:
+    jobs = [job if isinstance(job, ImageJob) else ImageJob(*job) for job in jobs]
+    if not jobs:
+        return []
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers > 1:
+        with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            future_lst = [executor.submit(_render_image_job, job, locale_setting, latex) for job in jobs]
+            rendered_lst = [future.result() for future in future_lst]
+    else:
+        rendered_lst = [_render_image_job(job, locale_setting, latex) for job in jobs]
+
+    hash_dict = load_hash_library(hash_library_path)
+
+    if generate:
+        for name, png_bytes, hashes in rendered_lst:
+            hash_dict[name] = hashes
+            if baseline_dir is not None:
+                Path(baseline_dir).mkdir(parents=True, exist_ok=True)
+                (Path(baseline_dir) / (name + '.png')).write_bytes(png_bytes)
+        save_hash_library(hash_library_path, hash_dict)
+        return [ImageComparison(name, 'generated', hashes, None, None) for name, _, hashes in rendered_lst]
+
+    return [
+        compare_image(name, png_bytes, hash_dict, baseline_dir, tolerance, hashes)
+        for name, png_bytes, hashes in rendered_lst
+    ]
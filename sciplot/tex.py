@@ -0,0 +1,131 @@
+import os
+import traceback
+from pathlib import Path
+from typing import Iterable, List, Tuple, Union
+from sciplot._lazy import LazyModule
+from sciplot.main import _compile_theme, _set_rc_params, get_cache_dir
+
+futures = LazyModule('concurrent.futures')
+matplotlib = LazyModule('matplotlib')
+
+# rcParams of text elements whose font sizes are used for LaTeX labels
+_FONT_SIZE_KEY_LST = [
+    'font.size',
+    'axes.labelsize',
+    'axes.titlesize',
+    'figure.titlesize',
+    'legend.fontsize',
+    'xtick.labelsize',
+    'ytick.labelsize'
+]
+
+
+def get_tex_cache_dir() -> str:
+    return str(Path(get_cache_dir()) / 'tex.cache')
+
+
+def use_tex_cache(
+        tex_cache_dir: str = None
+) -> str:
+    if tex_cache_dir is None:
+        tex_cache_dir = get_tex_cache_dir()
+    Path(tex_cache_dir).mkdir(parents=True, exist_ok=True)
+
+    # Matplotlib 3.8 made the cache directory attribute private
+    tex_manager = matplotlib.texmanager.TexManager
+    if hasattr(tex_manager, '_texcache'):
+        tex_manager._texcache = str(tex_cache_dir)
+    else:
+        tex_manager.texcache = str(tex_cache_dir)
+
+    return str(tex_cache_dir)
+
+
+def _get_font_size_lst(
+        rc_params: dict
+) -> List[float]:
+    font_size_set = set()
+    for key in _FONT_SIZE_KEY_LST:
+        font_size = rc_params[key]
+        # Relative sizes, e.g. 'medium', are resolved against 'font.size'
+        if isinstance(font_size, str):
+            font_size = matplotlib.font_manager.font_scalings[font_size] * rc_params['font.size']
+        font_size_set.add(float(font_size))
+
+    return sorted(font_size_set)
+
+
+def _get_dpi_lst(
+        rc_params: dict
+) -> List[float]:
+    dpi_lst = [rc_params['figure.dpi']]
+    if rc_params['savefig.dpi'] != 'figure' and rc_params['savefig.dpi'] not in dpi_lst:
+        dpi_lst.append(rc_params['savefig.dpi'])
+
+    return dpi_lst
+
+
+def _init_tex_worker(
+        theme: Union[str, List[str]],
+        tex_cache_dir: str
+):
+    rc_params, _ = _compile_theme(theme)
+    _set_rc_params(rc_params)
+    use_tex_cache(tex_cache_dir)
+
+
+def _compile_tex(
+        label: str,
+        font_size: float,
+        dpi_lst: List[float]
+) -> Tuple[str, str]:
+    tex_manager = matplotlib.texmanager.TexManager()
+    try:
+        # The DVI file is used for text layout, and the PNG files by the Agg backend
+        tex_manager.make_dvi(label, font_size)
+        for dpi in dpi_lst:
+            tex_manager.make_png(label, font_size, dpi)
+        return label, None
+    except Exception:
+        return label, traceback.format_exc()
+
+
+def warm_tex_cache(
+        label_lst: Iterable[str] = (),
+        theme: Union[str, List[str]] = 'default',
+        font_size_lst: List[float] = None,
+        tex_cache_dir: str = None,
+        workers: int = None
+) -> List[str]:
+    # Validated theme parameters on top of the current ones, without changing the current ones
+    rc_params = dict(matplotlib.rcParams)
+    rc_params.update(matplotlib.RcParams(_compile_theme(theme)[0]))
+    if not rc_params['text.usetex']:
+        return []
+
+    # Figures rendered later by this process use the warmed cache as well
+    tex_cache_dir = use_tex_cache(tex_cache_dir)
+
+    if font_size_lst is None:
+        font_size_lst = _get_font_size_lst(rc_params)
+    dpi_lst = _get_dpi_lst(rc_params)
+
+    # A plain label compiles the preamble and its packages, so that the first figure does not pay for it either
+    label_lst = list(dict.fromkeys(['$x$'] + list(label_lst)))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_tex_worker,
+            initargs=(theme, tex_cache_dir)
+    ) as executor:
+        future_lst = [
+            executor.submit(_compile_tex, label, font_size, dpi_lst)
+            for label in label_lst
+            for font_size in font_size_lst
+        ]
+        failed_label_lst = [future.result()[0] for future in future_lst if future.result()[1] is not None]
+
+    return list(dict.fromkeys(failed_label_lst))
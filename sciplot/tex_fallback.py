@@ -0,0 +1,438 @@
+import contextvars
+import functools
+import re
+import shutil
+from typing import List
+from sciplot._lazy import LazyModule
+
+matplotlib = LazyModule('matplotlib')
+
+# Whether text created in the current style context is translated from LaTeX to mathtext
+_tex_fallback_var = contextvars.ContextVar('sciplot_tex_fallback', default=False)
+_original_set_text = None
+
+# siunitx unit macros and their symbols
+_UNIT_DICT = {
+    'ampere': 'A',
+    'candela': 'cd',
+    'gram': 'g',
+    'kelvin': 'K',
+    'kilogram': 'kg',
+    'metre': 'm',
+    'meter': 'm',
+    'mole': 'mol',
+    'second': 's',
+    'becquerel': 'Bq',
+    'coulomb': 'C',
+    'farad': 'F',
+    'gray': 'Gy',
+    'henry': 'H',
+    'hertz': 'Hz',
+    'joule': 'J',
+    'katal': 'kat',
+    'lumen': 'lm',
+    'lux': 'lx',
+    'newton': 'N',
+    'pascal': 'Pa',
+    'radian': 'rad',
+    'siemens': 'S',
+    'sievert': 'Sv',
+    'steradian': 'sr',
+    'tesla': 'T',
+    'volt': 'V',
+    'watt': 'W',
+    'weber': 'Wb',
+    'bar': 'bar',
+    'electronvolt': 'eV',
+    'hour': 'h',
+    'litre': 'L',
+    'liter': 'L',
+    'minute': 'min',
+    'tonne': 't',
+    'dalton': 'Da',
+    'bel': 'B',
+    'decibel': 'dB',
+    'neper': 'Np',
+    'day': 'd',
+    'hectare': 'ha',
+    'astronomicalunit': 'au',
+    'atomicmassunit': 'u',
+}
+
+# siunitx units that are math symbols rather than upright letters
+_UNIT_SYMBOL_DICT = {
+    'ohm': r'\Omega',
+    'degree': r'^{\circ}',
+    'arcminute': r'^{\prime}',
+    'arcsecond': r'^{\prime\prime}',
+    'celsius': r'^{\circ}\mathrm{C}',
+    'degreeCelsius': r'^{\circ}\mathrm{C}',
+    'percent': r'\%',
+    'angstrom': r'\AA',
+}
+
+# siunitx prefix macros and their symbols
+_PREFIX_DICT = {
+    'yocto': 'y',
+    'zepto': 'z',
+    'atto': 'a',
+    'femto': 'f',
+    'pico': 'p',
+    'nano': 'n',
+    'micro': r'\mu',
+    'milli': 'm',
+    'centi': 'c',
+    'deci': 'd',
+    'deca': 'da',
+    'deka': 'da',
+    'hecto': 'h',
+    'kilo': 'k',
+    'mega': 'M',
+    'giga': 'G',
+    'tera': 'T',
+    'peta': 'P',
+    'exa': 'E',
+    'zetta': 'Z',
+    'yotta': 'Y',
+}
+
+# Simple replacements of macros without arguments, in math mode
+_SYMBOL_DICT = {
+    'dd': r'\mathrm{d}',
+    'degree': r'^{\circ}',
+    'celsius': r'^{\circ}\mathrm{C}',
+    'tfrac': r'\frac',
+    'dfrac': r'\frac',
+    'mathbbm': r'\mathbb',
+    'vb': r'\mathbf',
+    'vectorbold': r'\mathbf',
+    'mathdefault': r'\mathdefault',
+}
+
+# siunitx power macros before and after a unit
+_POWER_DICT = {
+    'square': '2',
+    'cubic': '3',
+}
+_POWER_AFTER_DICT = {
+    'squared': '2',
+    'cubed': '3',
+}
+
+_MACRO_REGEX = re.compile(r'\\([A-Za-z]+)')
+
+
+def is_tex_available() -> bool:
+    # Matplotlib needs both LaTeX and dvipng to typeset text with the Agg backend
+    return _is_tex_available()
+
+
+@functools.lru_cache(maxsize=None)
+def _is_tex_available() -> bool:
+    return shutil.which('latex') is not None and shutil.which('dvipng') is not None
+
+
+def _get_decimal_marker() -> str:
+    # siunitx' 'locale=DE' of the bundled preambles typesets a decimal comma
+    if 'locale=DE' in matplotlib.rcParams['text.latex.preamble']:
+        return '{,}'
+    return '.'
+
+
+class _TexReader:
+    def __init__(
+            self,
+            tex: str
+    ):
+        self.tex = tex
+        self.position = 0
+
+    def skip_space(self):
+        while self.position < len(self.tex) and self.tex[self.position] == ' ':
+            self.position += 1
+
+    def peek(self) -> str:
+        self.skip_space()
+        return self.tex[self.position:self.position + 1]
+
+    def read_delimited(
+            self,
+            opening: str,
+            closing: str
+    ) -> str:
+        start = self.position + 1
+        depth = 0
+        while self.position < len(self.tex):
+            char = self.tex[self.position]
+            if char == '\\':
+                self.position += 2
+                continue
+            if char == opening:
+                depth += 1
+            elif char == closing:
+                depth -= 1
+                if depth == 0:
+                    self.position += 1
+                    return self.tex[start:self.position - 1]
+            self.position += 1
+        return self.tex[start:]
+
+    def read_group(self) -> str:
+        # Braced argument, or a single character as in '\dd x'
+        if self.peek() == '{':
+            return self.read_delimited('{', '}')
+        match = _MACRO_REGEX.match(self.tex, self.position)
+        if match:
+            self.position = match.end()
+            return match.group(0)
+        argument = self.tex[self.position:self.position + 1]
+        self.position += 1
+        return argument
+
+    def read_optional(self) -> str:
+        if self.peek() == '[':
+            return self.read_delimited('[', ']')
+        return None
+
+    def read_star(self) -> bool:
+        if self.tex[self.position:self.position + 1] == '*':
+            self.position += 1
+            return True
+        return False
+
+
+def _get_number_mathtext(
+        number: str
+) -> str:
+    number = number.strip().replace(' ', '')
+    match = re.fullmatch(r'([^eE]*)[eE]([+-]?[0-9]+)', number)
+    mantissa, exponent = match.groups() if match else (number, '')
+    mantissa = re.sub(r'[.,]', _get_decimal_marker(), mantissa.replace('+-', r'\pm '))
+    if exponent:
+        return (mantissa + r' \times ' if mantissa else '') + '10^{' + exponent + '}'
+    return mantissa
+
+
+def _get_unit_symbol(
+        prefix: str,
+        name: str
+) -> str:
+    # Greek prefixes are kept outside of \mathrm
+    greek_prefix = ''
+    if prefix.startswith('\\'):
+        greek_prefix, prefix = prefix[:3], prefix[3:]
+    if name in _UNIT_DICT:
+        return greek_prefix + r'\mathrm{' + prefix + _UNIT_DICT[name] + '}'
+    return greek_prefix + (r'\mathrm{' + prefix + '}' if prefix else '') + _UNIT_SYMBOL_DICT[name]
+
+
+def _get_literal_unit_mathtext(
+        unit: str
+) -> str:
+    # Literal units, e.g. \si{m/s} or \si{kg.m}
+    unit = unit.strip()
+    if not unit:
+        return ''
+    return r'\mathrm{' + re.sub(r'[.~]', r'}\\,\\mathrm{', unit) + '}'
+
+
+def _read_unit_power(
+        name: str,
+        reader: _TexReader
+) -> str:
+    # Power of a power macro, e.g. \square, \squared, \raiseto{4} or \tothe{4}
+    if name in _POWER_DICT:
+        return _POWER_DICT[name]
+    if name in _POWER_AFTER_DICT:
+        return _POWER_AFTER_DICT[name]
+    return reader.read_group()
+
+
+def _join_unit_mathtext(
+        numerator_lst: List[str],
+        denominator_lst: List[str]
+) -> str:
+    unit_mathtext = r'\,'.join(numerator_lst)
+    if denominator_lst:
+        unit_mathtext = (unit_mathtext or '1') + '/' + r'\,'.join(denominator_lst)
+    return unit_mathtext
+
+
+def _get_unit_mathtext(
+        unit: str
+) -> str:
+    if '\\' not in unit:
+        return _get_literal_unit_mathtext(unit)
+
+    numerator_lst = []
+    denominator_lst = []
+    prefix = ''
+    power = ''
+    per = False
+    reader = _TexReader(unit)
+    while True:
+        match = _MACRO_REGEX.search(unit, reader.position)
+        if match is None:
+            break
+        reader.position = match.end()
+        name = match.group(1)
+
+        # 'sticky-per' of the bundled preambles puts all units after \per in the denominator
+        unit_lst = denominator_lst if per else numerator_lst
+        if name in _PREFIX_DICT:
+            prefix += _PREFIX_DICT[name]
+        elif name == 'per':
+            per = True
+        elif name in _POWER_DICT or name == 'raiseto':
+            power = '^{' + _read_unit_power(name, reader) + '}'
+        elif name in _POWER_AFTER_DICT or name == 'tothe':
+            unit_power = _read_unit_power(name, reader)
+            if unit_lst:
+                unit_lst[-1] += '^{' + unit_power + '}'
+        elif name in _UNIT_DICT or name in _UNIT_SYMBOL_DICT:
+            unit_lst.append(_get_unit_symbol(prefix, name) + power)
+            prefix = ''
+            power = ''
+
+    return _join_unit_mathtext(numerator_lst, denominator_lst)
+
+
+def _get_quantity_mathtext(
+        number: str,
+        unit: str
+) -> str:
+    unit_mathtext = _get_unit_mathtext(unit)
+    if not unit_mathtext:
+        return _get_number_mathtext(number)
+    if unit_mathtext.startswith(('^', r'\%')):
+        # No space before degree, arc minute and percent symbols
+        return _get_number_mathtext(number) + unit_mathtext
+    return _get_number_mathtext(number) + r'\,' + unit_mathtext
+
+
+def _translate_derivative(
+        reader: _TexReader,
+        differential: str
+) -> str:
+    order = reader.read_optional()
+    function = reader.read_group()
+    if reader.peek() == '{':
+        variable = reader.read_group()
+    else:
+        function, variable = '', function
+    if differential == r'\partial' and reader.peek() == '{':
+        # Mixed partial derivative, e.g. \pdv{f}{x}{y}
+        second_variable = reader.read_group()
+        return (r'\frac{' + differential + '^{2} ' + function + '}{' + differential + ' ' + variable + ' ' +
+                differential + ' ' + second_variable + '}')
+    power = '^{' + order + '}' if order else ''
+    return r'\frac{' + differential + power + ' ' + function + '}{' + differential + ' ' + variable + power + '}'
+
+
+def _translate_delimited(
+        reader: _TexReader,
+        left: str,
+        right: str
+) -> str:
+    reader.read_star()
+    if reader.peek() in ('(', '['):
+        opening = reader.peek()
+        argument = reader.read_delimited(opening, ')' if opening == '(' else ']')
+    else:
+        argument = reader.read_group()
+    return left + translate_tex(argument, math_mode=True) + right
+
+
+# Macros with arguments, translated in math mode. Handlers return the translated mathtext
+_MACRO_HANDLER_DICT = {
+    'SI': lambda reader: (reader.read_optional(), _get_quantity_mathtext(reader.read_group(), reader.read_group()))[1],
+    'si': lambda reader: (reader.read_optional(), _get_unit_mathtext(reader.read_group()))[1],
+    'num': lambda reader: (reader.read_optional(), _get_number_mathtext(reader.read_group()))[1],
+    'ang': lambda reader: (reader.read_optional(), _get_number_mathtext(reader.read_group()) + r'^{\circ}')[1],
+    'dv': lambda reader: _translate_derivative(reader, r'\mathrm{d}'),
+    'pdv': lambda reader: _translate_derivative(reader, r'\partial'),
+    'abs': lambda reader: _translate_delimited(reader, r'\left|', r'\right|'),
+    'norm': lambda reader: _translate_delimited(reader, r'\left\Vert ', r'\right\Vert'),
+    'qty': lambda reader: _translate_delimited(reader, r'\left(', r'\right)'),
+    'order': lambda reader: _translate_delimited(reader, r'\mathcal{O}\left(', r'\right)'),
+    'expval': lambda reader: _translate_delimited(reader, r'\langle ', r'\rangle'),
+    'ev': lambda reader: _translate_delimited(reader, r'\langle ', r'\rangle'),
+    'ket': lambda reader: _translate_delimited(reader, '|', r'\rangle'),
+    'bra': lambda reader: _translate_delimited(reader, r'\langle ', '|'),
+    'braket': lambda reader: r'\langle ' + reader.read_group() + '|' + reader.read_group() + r'\rangle',
+    'vu': lambda reader: r'\hat{\mathbf{' + reader.read_group() + '}}',
+    'text': lambda reader: r'\mathrm{' + reader.read_group().replace(' ', r'\ ') + '}',
+    'textrm': lambda reader: r'\mathrm{' + reader.read_group().replace(' ', r'\ ') + '}',
+}
+
+# Macros that produce math, and are wrapped in '$' when used in text mode
+_TEXT_MODE_MACRO_LST = ['SI', 'si', 'num', 'ang']
+
+
+def translate_tex(
+        tex: str,
+        math_mode: bool = False
+) -> str:
+    # Translate common siunitx and physics macros into Matplotlib mathtext, leaving everything else untouched
+    if '\\' not in tex:
+        return tex
+
+    reader = _TexReader(tex)
+    part_lst = []
+    while reader.position < len(tex):
+        char = tex[reader.position]
+        if char == '$':
+            math_mode = not math_mode
+            part_lst.append(char)
+            reader.position += 1
+            continue
+
+        match = _MACRO_REGEX.match(tex, reader.position) if char == '\\' else None
+        if match is None:
+            # Escaped characters, e.g. '\$', are copied as they are
+            part_lst.append(tex[reader.position:reader.position + (2 if char == '\\' else 1)])
+            reader.position += 2 if char == '\\' else 1
+            continue
+
+        name = match.group(1)
+        if name in _MACRO_HANDLER_DICT and (math_mode or name in _TEXT_MODE_MACRO_LST):
+            reader.position = match.end()
+            mathtext = _MACRO_HANDLER_DICT[name](reader)
+            part_lst.append(mathtext if math_mode else '$' + mathtext + '$')
+        elif name in _SYMBOL_DICT and math_mode:
+            reader.position = match.end()
+            part_lst.append(_SYMBOL_DICT[name])
+        else:
+            reader.position = match.end()
+            part_lst.append(match.group(0))
+
+    return ''.join(part_lst)
+
+
+def _set_text(
+        self,
+        s
+):
+    if _tex_fallback_var.get() and isinstance(s, str):
+        s = translate_tex(s)
+    _original_set_text(self, s)
+
+
+def _install_set_text_hook():
+    global _original_set_text
+    if _original_set_text is None:
+        text_class = matplotlib.text.Text
+        _original_set_text = text_class.set_text
+        text_class.set_text = _set_text
+
+
+def enable_tex_fallback() -> contextvars.Token:
+    # Text created in the current context from now on is translated to mathtext
+    _install_set_text_hook()
+    return _tex_fallback_var.set(True)
+
+
+def disable_tex_fallback(
+        token: contextvars.Token
+):
+    _tex_fallback_var.reset(token)
@@ -0,0 +1,189 @@
+import collections
+import contextvars
+import threading
+from typing import NamedTuple, Tuple
+from sciplot._lazy import LazyModule
+
+matplotlib = LazyModule('matplotlib')
+
+# Whether text extents measured in the current style context are shared between figures
+_text_extent_cache_var = contextvars.ContextVar('sciplot_text_extent_cache', default=False)
+_original_get_text_metrics_with_cache = None
+_original_text_area_get_bbox = None
+
+# Maximum number of text extents kept in memory
+_TEXT_EXTENT_CACHE_SIZE = 8192
+
+# Text extents as (width, height, descent) in least recently used order, keyed by text, font properties and font file,
+# type of math, resolution, renderer type and the rcParams the measurement depends on
+_text_extent_cache = collections.OrderedDict()
+_text_extent_cache_lock = threading.Lock()
+_text_extent_cache_hit_no = 0
+_text_extent_cache_miss_no = 0
+
+# rcParams that text extents depend on besides the font properties, for plain text, mathtext and LaTeX
+_TEXT_RC_KEY_TPL = ('text.hinting', 'text.hinting_factor', 'text.kerning_factor', 'pdf.use14corefonts', 'ps.useafm')
+_MATHTEXT_RC_KEY_TPL = _TEXT_RC_KEY_TPL + (
+    'mathtext.fontset', 'mathtext.fallback', 'mathtext.default', 'mathtext.rm', 'mathtext.it', 'mathtext.bf',
+    'mathtext.sf', 'mathtext.tt', 'mathtext.cal'
+)
+_TEX_RC_KEY_TPL = (
+    'text.latex.preamble', 'font.family', 'font.serif', 'font.sans-serif', 'font.monospace', 'font.cursive'
+)
+
+
+# Statistics of the text extent cache, like functools' cache_info()
+class TextExtentCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+# Renderer whose text measurements go through the text extent cache, for Matplotlib code that measures text directly
+class _TextExtentCachingRenderer:
+    def __init__(
+            self,
+            renderer: 'matplotlib.backend_bases.RendererBase'
+    ):
+        self._cached_renderer = renderer
+
+    def __getattr__(
+            self,
+            name: str
+    ):
+        return getattr(self._cached_renderer, name)
+
+    def get_text_width_height_descent(
+            self,
+            s: str,
+            prop: 'matplotlib.font_manager.FontProperties',
+            ismath: object
+    ) -> Tuple[float, float, float]:
+        renderer = self._cached_renderer
+        return _get_text_metrics_with_cache(renderer, s, prop, ismath, renderer.points_to_pixels(72.))
+
+
+def _get_rc_key(
+        ismath: object
+) -> Tuple:
+    if ismath == 'TeX':
+        rc_key_tpl = _TEX_RC_KEY_TPL
+    elif ismath:
+        rc_key_tpl = _MATHTEXT_RC_KEY_TPL
+    else:
+        rc_key_tpl = _TEXT_RC_KEY_TPL
+
+    rc_params = matplotlib.rcParams
+    return tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in (rc_params.get(rc_key) for rc_key in rc_key_tpl)
+    )
+
+
+def _get_font_key(
+        fontprop: 'matplotlib.font_manager.FontProperties'
+) -> Tuple:
+    # Font properties by value, since equal hashes of FontProperties do not imply equal fonts, and the font file they
+    # resolve to with the current font family lists, e.g. font.sans-serif
+    math_fontfamily = fontprop.get_math_fontfamily() if hasattr(fontprop, 'get_math_fontfamily') else None
+    return (
+        tuple(fontprop.get_family()),
+        fontprop.get_style(),
+        fontprop.get_variant(),
+        fontprop.get_weight(),
+        fontprop.get_stretch(),
+        fontprop.get_size_in_points(),
+        fontprop.get_file(),
+        math_fontfamily,
+        matplotlib.font_manager.findfont(fontprop)
+    )
+
+
+def _get_text_metrics_with_cache(
+        renderer: 'matplotlib.backend_bases.RendererBase',
+        text: str,
+        fontprop: 'matplotlib.font_manager.FontProperties',
+        ismath: object,
+        dpi: float
+) -> Tuple[float, float, float]:
+    global _text_extent_cache_hit_no, _text_extent_cache_miss_no
+
+    if isinstance(renderer, _TextExtentCachingRenderer):
+        renderer = renderer._cached_renderer
+    if not _text_extent_cache_var.get():
+        return _original_get_text_metrics_with_cache(renderer, text, fontprop, ismath, dpi)
+
+    # Matplotlib only caches extents per renderer, i.e. per figure and draw. Vector backends measure text with the
+    # renderer that MixedModeRenderer currently delegates to
+    measuring_renderer = renderer._renderer if type(renderer).__name__ == 'MixedModeRenderer' else renderer
+    key = (text, _get_font_key(fontprop), ismath, dpi, type(measuring_renderer), _get_rc_key(ismath))
+
+    with _text_extent_cache_lock:
+        extent_tpl = _text_extent_cache.get(key)
+        if extent_tpl is not None:
+            _text_extent_cache.move_to_end(key)
+            _text_extent_cache_hit_no += 1
+            return extent_tpl
+
+    extent_tpl = tuple(renderer.get_text_width_height_descent(text, fontprop, ismath))
+
+    with _text_extent_cache_lock:
+        _text_extent_cache_miss_no += 1
+        _text_extent_cache[key] = extent_tpl
+        if len(_text_extent_cache) > _TEXT_EXTENT_CACHE_SIZE:
+            _text_extent_cache.popitem(last=False)
+
+    return extent_tpl
+
+
+def _text_area_get_bbox(
+        self,
+        renderer: 'matplotlib.backend_bases.RendererBase'
+) -> 'matplotlib.transforms.Bbox':
+    # Legend entries measure the height of 'lp' on every layout pass, without Matplotlib's cache
+    if _text_extent_cache_var.get():
+        renderer = _TextExtentCachingRenderer(renderer)
+    return _original_text_area_get_bbox(self, renderer)
+
+
+def _install_text_metrics_hook():
+    global _original_get_text_metrics_with_cache, _original_text_area_get_bbox
+    # Matplotlib < 3.5 caches text layouts per Text instance and has no function to hook into
+    if _original_get_text_metrics_with_cache is None and hasattr(matplotlib.text, '_get_text_metrics_with_cache'):
+        _original_get_text_metrics_with_cache = matplotlib.text._get_text_metrics_with_cache
+        matplotlib.text._get_text_metrics_with_cache = _get_text_metrics_with_cache
+
+        text_area_class = matplotlib.offsetbox.TextArea
+        _original_text_area_get_bbox = text_area_class.get_bbox
+        text_area_class.get_bbox = _text_area_get_bbox
+
+
+def enable_text_extent_cache() -> contextvars.Token:
+    # Text extents measured in the current context from now on are shared between figures
+    _install_text_metrics_hook()
+    return _text_extent_cache_var.set(True)
+
+
+def disable_text_extent_cache(
+        token: contextvars.Token
+):
+    _text_extent_cache_var.reset(token)
+
+
+def get_text_extent_cache_info() -> TextExtentCacheInfo:
+    with _text_extent_cache_lock:
+        return TextExtentCacheInfo(
+            _text_extent_cache_hit_no,
+            _text_extent_cache_miss_no,
+            _TEXT_EXTENT_CACHE_SIZE,
+            len(_text_extent_cache)
+        )
+
+
+def clear_text_extent_cache():
+    global _text_extent_cache_hit_no, _text_extent_cache_miss_no
+    with _text_extent_cache_lock:
+        _text_extent_cache.clear()
+        _text_extent_cache_hit_no = 0
+        _text_extent_cache_miss_no = 0
@@ -28,5 +28,7 @@ setuptools.setup(
     package_data={'sciplot': ['parameters/*.yml', '../README.md']},
     include_package_data=True,
     python_requires='>=3.7',
-    install_requires=['matplotlib>=3.3.4', 'pyyaml', 'seaborn'],
+    install_requires=['matplotlib>=3.3.4', 'numpy', 'pyyaml'],
+    extras_require={'seaborn': ['seaborn'], 'parquet': ['pandas', 'pyarrow']},
+    entry_points={'console_scripts': ['sciplot = sciplot.cli:main']},
 )
@@ -0,0 +1,85 @@
+import locale
+import sys
+import numpy as np
+import pytest
+import matplotlib.pyplot as plt
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot  # noqa: E402
+import sciplot.main  # noqa: E402
+
+
+def plot_line(slope):
+    sciplot.set_size_cm(4)
+    fig, ax = plt.subplots(1, 1)
+    x = np.linspace(0, 1, 2)
+    ax.plot(x, slope * x)
+    return fig
+
+
+def plot_si_label():
+    # Text is kept as text in SVG files
+    plt.rcParams['svg.fonttype'] = 'none'
+    fig = plot_line(1)
+    fig.axes[0].set_title(r'Sine \SI{5}{\metre}')
+    return fig
+
+
+def plot_failure():
+    raise ValueError('Failing plot')
+
+
+def test_render_many(tmp_path):
+    jobs = [
+        sciplot.RenderJob(plot_line, 'line_' + str(slope), str(tmp_path), args=(slope,))
+        for slope in range(4)
+    ]
+    result_lst = sciplot.render_many(jobs, theme='no-latex', locale_setting='en_US.UTF-8', workers=2)
+
+    assert [result.plot_file_name for result in result_lst] == ['line_0', 'line_1', 'line_2', 'line_3']
+    for result in result_lst:
+        assert result.error is None
+        assert result.duration > 0
+        assert Path(result.plot_file_path).is_file()
+
+
+def test_render_many_with_error(tmp_path):
+    jobs = [
+        sciplot.RenderJob(plot_failure, 'failure', str(tmp_path)),
+        sciplot.RenderJob(plot_line, 'line', str(tmp_path), args=(1,))
+    ]
+    result_lst = sciplot.render_many(jobs, theme='no-latex', locale_setting='en_US.UTF-8', workers=1)
+
+    assert result_lst[0].plot_file_path is None
+    assert 'Failing plot' in result_lst[0].error
+    assert result_lst[1].error is None
+
+
+def test_render_many_with_uninstalled_locale(tmp_path, monkeypatch):
+    setlocale = locale.setlocale
+
+    def setlocale_without_fr(category, locale_setting=None):
+        if locale_setting == 'fr_FR.UTF-8':
+            raise locale.Error('unsupported locale setting')
+        return setlocale(category, locale_setting)
+
+    # Fails in the parent process instead of breaking the worker pool
+    monkeypatch.setattr(locale, 'setlocale', setlocale_without_fr)
+    with pytest.raises(locale.Error):
+        sciplot.render_many([sciplot.RenderJob(plot_line, 'line', str(tmp_path), args=(1,))], theme='no-latex',
+                            locale_setting='fr_FR.UTF-8', workers=1)
+
+
+def test_render_many_translates_tex_without_latex(tmp_path):
+    for theme, latex in (('no-latex', 'on'), ('default', 'off')):
+        job = sciplot.RenderJob(plot_si_label, 'si_' + theme, str(tmp_path), file_type='svg')
+        result, = sciplot.render_many([job], theme=theme, locale_setting='en_US.UTF-8', workers=1, latex=latex)
+
+        assert result.error is None
+        svg = Path(result.plot_file_path).read_text(encoding='utf-8')
+        assert 'Sine' in svg
+        assert '\\SI' not in svg
+
+    with pytest.raises(sciplot.main.SciplotException):
+        sciplot.render_many([job], latex='maybe')
@@ -0,0 +1,165 @@
+import json
+import sys
+import numpy as np
+import pytest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot.cli as cli  # noqa: E402
+import sciplot.main  # noqa: E402
+
+
+def write_manifest(tmp_path):
+    x = np.linspace(0, 1, 50)
+    np.save(str(tmp_path / 'lines.npy'), np.column_stack([x, x ** 2, x ** 3]))
+    np.savetxt(str(tmp_path / 'samples.csv'), np.column_stack([x, 2 * x]), delimiter=',', header='a,b', comments='')
+
+    manifest = {
+        'defaults': {'theme': 'no-latex', 'locale': 'en_US.UTF-8', 'size': [6, 4], 'output_dir': 'plots'},
+        'jobs': [
+            {'name': 'Lines', 'data': 'lines.npy', 'x_label': 'Time / s', 'formats': ['png', 'svg']},
+            {'name': 'Samples', 'data': 'samples.csv', 'plot': 'histogram', 'bins': 10, 'theme': ['no-latex', 'dark']}
+        ]
+    }
+    manifest_path = tmp_path / 'manifest.json'
+    manifest_path.write_text(json.dumps(manifest))
+    return manifest_path
+
+
+def test_load_manifest_formats(tmp_path):
+    manifest_path = write_manifest(tmp_path)
+    job_lst = cli.load_manifest(manifest_path)
+    assert [job['name'] for job in job_lst] == ['Lines', 'Samples']
+    assert job_lst[0]['data'] == [str(tmp_path / 'lines.npy')]
+    assert job_lst[1]['size'] == [6., 4.]
+
+    yaml_path = tmp_path / 'manifest.yml'
+    yaml_path.write_text('- name: Lines\n  data: lines.npy\n  size: [6, 4]\n')
+    assert cli.load_manifest(yaml_path)[0]['size'] == [6., 4.]
+
+    csv_path = tmp_path / 'manifest.csv'
+    csv_path.write_text('name,data,size,formats,labels\nLines,lines.npy,6;4,png;pdf,Square\n')
+    job, = cli.load_manifest(csv_path)
+    assert job['size'] == [6., 4.]
+    assert job['formats'] == ['png', 'pdf']
+    assert job['labels'] == ['Square']
+
+
+def test_load_manifest_errors(tmp_path):
+    manifest_path = tmp_path / 'manifest.json'
+    for manifest in (
+            [{'name': 'Lines', 'data': 'lines.npy', 'colour': 'red'}],
+            [{'name': 'Lines'}],
+            [{'name': 'Lines', 'data': 'lines.npy', 'plot': 'pie'}],
+            [{'name': 'Lines', 'data': 'lines.npy'}, {'name': 'Lines', 'data': 'other.npy'}],
+            {'jobs': 'Lines'}
+    ):
+        manifest_path.write_text(json.dumps(manifest))
+        with pytest.raises(sciplot.main.SciplotException):
+            cli.load_manifest(manifest_path)
+
+    with pytest.raises(sciplot.main.SciplotException):
+        cli.load_manifest(tmp_path / 'manifest.toml')
+
+
+def test_load_manifest_size(tmp_path):
+    manifest_path = tmp_path / 'manifest.json'
+    for size, expected_size in ((12, [12.]), ('12', [12.]), ([12, 8], [12., 8.]), (['12', '8'], [12., 8.])):
+        manifest_path.write_text(json.dumps([{'name': 'Lines', 'data': 'lines.npy', 'size': size}]))
+        assert cli.load_manifest(manifest_path)[0]['size'] == expected_size
+
+    for size in ('large', [12, 8, 4], [], {'width': 12}, True):
+        manifest_path.write_text(json.dumps([{'name': 'Lines', 'data': 'lines.npy', 'size': size}]))
+        with pytest.raises(sciplot.main.SciplotException):
+            cli.load_manifest(manifest_path)
+
+    csv_path = tmp_path / 'manifest.csv'
+    csv_path.write_text('name,data,size\nLines,lines.npy,12\n')
+    assert cli.load_manifest(csv_path)[0]['size'] == [12.]
+
+
+def test_load_manifest_bins_and_latex(tmp_path):
+    csv_path = tmp_path / 'manifest.csv'
+    csv_path.write_text('name,data,plot,bins,latex\nSamples,samples.csv,histogram,20,off\n')
+    job, = cli.load_manifest(csv_path)
+    assert job['bins'] == 20
+    assert job['latex'] == 'off'
+
+    for row in ('Samples,samples.csv,histogram,many,off', 'Samples,samples.csv,histogram,2.5,off',
+                'Samples,samples.csv,histogram,20,maybe'):
+        csv_path.write_text('name,data,plot,bins,latex\n' + row + '\n')
+        with pytest.raises(sciplot.main.SciplotException):
+            cli.load_manifest(csv_path)
+
+
+def test_render_manifest_translates_tex_without_latex(tmp_path):
+    np.save(str(tmp_path / 'lines.npy'), np.column_stack([np.linspace(0, 1, 50)] * 2))
+    manifest_path = tmp_path / 'manifest.json'
+    job = {'name': 'Sine', 'data': 'lines.npy', 'title': r'Sine \SI{5}{\metre}', 'formats': 'svg', 'locale': 'C'}
+    for theme, latex in (('no-latex', 'on'), ('default', 'off')):
+        # Text is kept as text in SVG files
+        theme_path = sciplot.main.export_theme(theme, tmp_path / (theme + '.mplstyle'))
+        with open(theme_path, 'a', encoding='utf-8') as theme_file:
+            theme_file.write('svg.fonttype: none\n')
+        manifest_path.write_text(json.dumps([dict(job, theme=str(theme_path), latex=latex)]))
+        result, = cli.render_manifest(manifest_path, workers=1)[0]
+
+        assert result.error is None
+        svg = Path(result.plot_file_path).read_text(encoding='utf-8')
+        assert 'Sine' in svg
+        assert '\\SI' not in svg
+
+
+def test_load_manifest_unknown_locale(tmp_path, capsys):
+    manifest_path = tmp_path / 'manifest.json'
+    manifest_path.write_text(json.dumps([{'name': 'Lines', 'data': 'lines.npy', 'locale': 'xx_YY'}]))
+    with pytest.raises(sciplot.main.SciplotException):
+        cli.load_manifest(manifest_path)
+    assert cli.main(['render', str(manifest_path)]) == 2
+    assert 'xx_YY' in capsys.readouterr().out
+
+
+def test_load_data_csv_header(tmp_path):
+    manifest_path = write_manifest(tmp_path)
+    data_ar, column_name_lst = cli._load_data(str(manifest_path.parent / 'samples.csv'))
+    assert data_ar.shape == (50, 2)
+    assert column_name_lst == ['a', 'b']
+
+
+def test_render_manifest_incremental(tmp_path):
+    manifest_path = write_manifest(tmp_path)
+
+    result_lst, skipped_name_lst = cli.render_manifest(manifest_path, workers=1)
+    assert skipped_name_lst == []
+    assert all(result.error is None for result in result_lst)
+    assert len(list((tmp_path / 'plots').glob('Lines_*.png'))) == 1
+    assert len(list((tmp_path / 'plots').glob('Lines_*.svg'))) == 1
+    assert len(list((tmp_path / 'plots').glob('Samples_*.png'))) == 1
+
+    # Unchanged jobs are skipped
+    result_lst, skipped_name_lst = cli.render_manifest(manifest_path, workers=1)
+    assert result_lst == []
+    assert skipped_name_lst == ['Lines', 'Samples']
+
+    # Changed data is rendered again
+    np.save(str(tmp_path / 'lines.npy'), np.zeros((10, 2)))
+    result_lst, skipped_name_lst = cli.render_manifest(manifest_path, workers=1)
+    assert [result.plot_file_name for result in result_lst] == ['Lines']
+    assert skipped_name_lst == ['Samples']
+
+    # Deleted outputs are rendered again, and all jobs with force
+    for plot_file_path in (tmp_path / 'plots').glob('Samples_*.png'):
+        plot_file_path.unlink()
+    result_lst, _ = cli.render_manifest(manifest_path, workers=1)
+    assert [result.plot_file_name for result in result_lst] == ['Samples']
+    result_lst, _ = cli.render_manifest(manifest_path, workers=1, force=True)
+    assert len(result_lst) == 2
+
+
+def test_main(tmp_path, capsys):
+    manifest_path = write_manifest(tmp_path)
+    assert cli.main(['render', str(manifest_path), '--workers', '1']) == 0
+    assert '2 rendered, 0 unchanged, 0 failed' in capsys.readouterr().out
+    assert (tmp_path / 'manifest.sciplot-state.json').is_file()
+
+    assert cli.main(['render', str(tmp_path / 'missing.json')]) == 2
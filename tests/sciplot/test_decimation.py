@@ -0,0 +1,66 @@
+import sys
+import numpy as np
+import matplotlib.pyplot as plt
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot  # noqa: E402
+
+
+def get_data(n=200000):
+    x = np.linspace(0, 100, n)
+    y = np.sin(x) + np.random.RandomState(0).normal(0, 0.3, n)
+    return x, y
+
+
+def render(plot_func, x, y):
+    fig = plt.figure(figsize=(4, 3), dpi=100)
+    ax = fig.add_subplot()
+    plot_func(ax, x, y, linewidth=0.72, antialiased=False)
+    fig.canvas.draw()
+    rgba_ar = np.asarray(fig.canvas.buffer_rgba()).copy()
+    plt.close(fig)
+    return rgba_ar
+
+
+def test_decimate_keeps_extremes():
+    x, y = get_data()
+    x_decimated, y_decimated = sciplot.decimate(x, y, 100)
+
+    assert len(x_decimated) <= 4 * 100
+    assert (x_decimated[0], x_decimated[-1]) == (x[0], x[-1])
+    for column in range(100):
+        in_column = (x >= column) & (x < column + 1)
+        in_decimated_column = (x_decimated >= column) & (x_decimated < column + 1)
+        assert y_decimated[in_decimated_column].min() == y[in_column].min()
+        assert y_decimated[in_decimated_column].max() == y[in_column].max()
+
+
+def test_decimate_unsorted_or_nan_unchanged():
+    x, y = get_data(1000)
+    y[10] = np.nan
+    assert sciplot.decimate(x, y, 10)[1] is y
+    assert sciplot.decimate(x[::-1], y, 10)[1] is y
+
+
+def test_plot_decimated_renders_like_full_data():
+    x, y = get_data()
+    full_rgba_ar = render(lambda ax, *args, **kwargs: ax.plot(*args, **kwargs), x, y)
+    decimated_rgba_ar = render(sciplot.plot_decimated, x, y)
+
+    assert np.abs(full_rgba_ar.astype(int) - decimated_rgba_ar).mean() < 0.5
+
+
+def test_plot_decimated_on_zoom():
+    x, y = get_data()
+    fig, ax = plt.subplots(1, 1)
+    line = sciplot.plot_decimated(ax, x, y)
+    fig.canvas.draw()
+    point_no = len(line.get_xdata())
+    assert point_no < len(x)
+
+    ax.set_xlim(10, 20)
+    x_zoomed = line.get_xdata()
+    assert x_zoomed[0] > 9.5 and x_zoomed[-1] < 20.5
+    assert len(x_zoomed) > 0.5 * point_no
+    plt.close(fig)
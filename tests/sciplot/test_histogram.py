@@ -0,0 +1,61 @@
+import sys
+import numpy as np
+import matplotlib.pyplot as plt
+import pytest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot  # noqa: E402
+
+
+def get_data_ar(mean=4.5, std=0.2, n=10000):
+    return np.random.RandomState(42).normal(mean, std, n)
+
+
+def test_histogram_counts_like_numpy():
+    data_ar = get_data_ar()
+    for bins in (100, np.array([3.5, 4, 4.2, 4.5, 4.8, 5.5])):
+        counts_lst, bin_edge_ar = sciplot.histogram_counts([data_ar], bins=bins, chunk_size=999)
+        counts_expected, bin_edge_ar_expected = np.histogram(data_ar, bins=bins)
+        assert np.array_equal(counts_lst[0], counts_expected)
+        assert np.allclose(bin_edge_ar, bin_edge_ar_expected)
+
+
+def test_histogram_counts_density_like_numpy():
+    data_ar = get_data_ar()
+    counts_lst, _ = sciplot.histogram_counts([data_ar], bins=50, bin_range=(3, 6), density=True)
+    assert np.allclose(counts_lst[0], np.histogram(data_ar, bins=50, range=(3, 6), density=True)[0])
+
+
+def test_histogram_counts_of_chunks_needs_range():
+    chunk_lst = np.array_split(get_data_ar(), 7)
+    with pytest.raises(sciplot.SciplotException):
+        sciplot.histogram_counts([iter(chunk_lst)], bins=10)
+
+    counts_lst, _ = sciplot.histogram_counts([iter(chunk_lst)], bins=10, bin_range=(4, 5))
+    assert np.array_equal(counts_lst[0], np.histogram(get_data_ar(), bins=10, range=(4, 5))[0])
+
+
+def test_histogram_counts_of_npy_files(tmp_path):
+    data_file_path = tmp_path / 'data.npy'
+    np.save(str(data_file_path), get_data_ar().reshape(100, 100))
+
+    counts_lst, _ = sciplot.histogram_counts([data_file_path], bins=20, bin_range=(4, 5), chunk_size=1000, workers=2)
+    assert np.array_equal(counts_lst[0], np.histogram(get_data_ar(), bins=20, range=(4, 5))[0])
+
+
+def test_plot_histogram():
+    fig, ax = plt.subplots(1, 1)
+    plot_lst, patch_lst = sciplot.plot_histogram(
+        ax,
+        [get_data_ar(4.5, 0.2), get_data_ar(6.1, 0.9)],
+        density=True,
+        label_tpl=('a', 'b'),
+        seaborn_color_map='rocket'
+    )
+    color_lst = sciplot.get_color_lst(2, seaborn_color_map='rocket')
+
+    assert len(plot_lst) == 2
+    assert [patch.get_facecolor()[:3] for patch in patch_lst] == [plt.matplotlib.colors.to_rgb(c) for c in color_lst]
+    assert [text.get_text() for text in ax.get_legend().get_texts()] == ['a', 'b']
+    plt.close(fig)
@@ -0,0 +1,64 @@
+import sys
+import numpy as np
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot  # noqa: E402
+from sciplot.live import _RingBuffer  # noqa: E402
+
+
+def test_ring_buffer_wraps():
+    buffer = _RingBuffer(2, 5)
+    buffer.extend(np.array([[0, 1, 2], [0, 10, 20]]))
+    assert len(buffer) == 3
+
+    buffer.extend(np.array([[3, 4, 5, 6], [30, 40, 50, 60]]))
+    assert len(buffer) == 5
+    assert buffer.view().tolist() == [[2, 3, 4, 5, 6], [20, 30, 40, 50, 60]]
+
+    buffer.extend(np.arange(14).reshape(2, 7))
+    assert buffer.view().tolist() == [[2, 3, 4, 5, 6], [9, 10, 11, 12, 13]]
+
+
+def test_live_plot_blits_within_limits():
+    live_plot = sciplot.LivePlot(line_no=2, capacity=100, label_tpl=('a', 'b'), theme='no-latex', locale_setting='C')
+    live_plot.append(np.arange(10), np.vstack([np.arange(10), -np.arange(10)]))
+    live_plot.update()
+    assert live_plot._full_draw_no == 1
+
+    # Within the headroom of the new limits, only the lines are redrawn
+    live_plot.append(10, [9.5, -9.5])
+    frame = live_plot.update()
+    assert live_plot._full_draw_no == 1
+    assert frame.shape[2] == 4
+    assert live_plot.line_lst[0].get_xdata()[-1] == 10
+
+    live_plot.append(100, [100, -100])
+    live_plot.update()
+    assert live_plot._full_draw_no == 2
+    live_plot.close()
+
+
+def test_live_plot_blitted_frame_matches_full_draw():
+    live_plot = sciplot.LivePlot(line_no=1, capacity=100, label_tpl=('a',), theme='no-latex', locale_setting='C', dpi=100)
+    live_plot.append(np.arange(10), np.arange(10))
+    live_plot.update()
+    live_plot.append(10, 5)
+    blitted_frame = live_plot.update().copy()
+
+    # Full draw with the same layout
+    live_plot._background = None
+    live_plot.update()
+
+    assert np.array_equal(blitted_frame, live_plot.get_frame())
+    live_plot.close()
+
+
+def test_live_plot_exports_at_frame_rate(tmp_path):
+    live_plot = sciplot.LivePlot(theme='no-latex', locale_setting='C', frame_rate=1e-3, save_directory=str(tmp_path))
+    for i in range(3):
+        live_plot.append(i, i)
+        live_plot.update()
+
+    assert [path.name for path in tmp_path.iterdir()] == ['frame_000000.png']
+    live_plot.close()
@@ -1,4 +1,9 @@
+import os
+import subprocess
 import sys
+import threading
+import time
+import tracemalloc
 import pytest
 import numpy as np
 from scipy.stats import pareto
@@ -19,6 +24,22 @@ def test_get_parameters_dir():
     assert '/'.split(sciplot.get_parameters_dir())[-4:] == '/'.split(str(parameters_dir))[-4:]
 
 
+def test_import_is_lazy():
+    code = (
+        'import sys\n'
+        'import sciplot\n'
+        'print(any(module in sys.modules for module in ["matplotlib.pyplot", "seaborn", "yaml"]))'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=str(Path(__file__).parent / '..' / '..'),
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True
+    ).stdout
+    assert output.strip() == 'False'
+
+
 def test_get_theme_priority_lst():
     theme_priority_lst = [
         'alpha',
@@ -60,6 +81,117 @@ def test_get_theme_lst_with_float_in_list():
         sciplot._get_theme_lst(theme)
 
 
+def test_compile_theme_default():
+    rc_params = sciplot.compile_theme()
+    assert rc_params['text.usetex'] is True
+    assert rc_params['font.size'] == 7
+
+
+def test_compile_theme_dark():
+    rc_params = sciplot.compile_theme(['dark', 'no-latex'])
+    assert rc_params['figure.facecolor'] == 'black'
+    assert rc_params['text.usetex'] is False
+
+
+def test_compile_theme_cached():
+    sciplot.clear_theme_cache()
+    assert sciplot._compile_theme('serif') is sciplot._compile_theme(['SERIF'])
+
+
+def test_compile_theme_validated():
+    rc_params = sciplot.compile_theme(['dark', 'serif'])
+    assert rc_params['figure.dpi'] == 600.
+    assert isinstance(rc_params['axes.prop_cycle'], type(plt.rcParams['axes.prop_cycle']))
+
+
+def test_compile_theme_invalid_user_theme():
+    parameters_path = Path(sciplot.get_parameters_dir()) / 'test_invalid_theme.yml'
+    try:
+        parameters_path.write_text('# Invalid theme\nfont.size: 8\nlines.linewidth: thick\nfont.sise: 8\n')
+        with pytest.raises(sciplot.SciplotException) as exception_info:
+            sciplot.compile_theme('test_invalid_theme')
+        message = str(exception_info.value)
+        assert str(parameters_path) + "', line 3: Invalid value for 'lines.linewidth'" in message
+        assert str(parameters_path) + "', line 4: Unknown parameter 'font.sise'" in message
+    finally:
+        parameters_path.unlink()
+
+
+def test_style_restores_default_rc_params():
+    plt.style.use('default')
+    rc_params = dict(plt.rcParams)
+    with sciplot.style(['dark', 'serif'], locale_setting='en_US.UTF-8'):
+        assert plt.rcParams['figure.facecolor'] == 'black'
+    assert dict(plt.rcParams) == rc_params
+
+
+@pytest.mark.parametrize('file_name', ['theme.mplstyle', 'theme.pickle'])
+def test_export_theme(tmp_path, file_name):
+    theme_file_path = sciplot.export_theme(['dark', 'serif'], tmp_path / file_name)
+    rc_params = plt.matplotlib.RcParams(sciplot.compile_theme(['dark', 'serif']))
+    assert plt.matplotlib.RcParams(sciplot.load_theme(theme_file_path)) == rc_params
+
+    with sciplot.style(theme_file_path, locale_setting='en_US.UTF-8'):
+        assert sciplot.is_dark_mode()
+        assert plt.rcParams['figure.facecolor'] == rc_params['figure.facecolor']
+        assert plt.rcParams['text.latex.preamble'] == rc_params['text.latex.preamble']
+
+
+def test_export_theme_mplstyle_usable_by_matplotlib(tmp_path):
+    theme_file_path = sciplot.export_theme('no-latex', tmp_path / 'theme.mplstyle')
+    with plt.style.context(theme_file_path):
+        assert plt.rcParams['text.usetex'] is False
+        assert plt.rcParams['font.size'] == sciplot.compile_theme('no-latex')['font.size']
+
+
+def test_export_theme_incorrect():
+    with pytest.raises(sciplot.SciplotException):
+        sciplot.export_theme('default', 'theme.yml')
+    with pytest.raises(sciplot.SciplotException):
+        sciplot.load_theme('missing_theme.mplstyle')
+    with pytest.raises(sciplot.SciplotException):
+        sciplot._get_mplstyle_value('text.latex.preamble', r'\newcommand{\x}[1]{#1}')
+    assert sciplot._get_mplstyle_value('axes.prop_cycle', "cycler('color', ['#1f77b4', 'k'])") == \
+        "cycler('color', ['1f77b4', 'k'])"
+
+
+def test_compile_theme_user_theme_changed():
+    parameters_path = Path(sciplot.get_parameters_dir()) / 'test_user_theme.yml'
+    try:
+        parameters_path.write_text('font.size: 8\n')
+        assert sciplot.compile_theme('test_user_theme')['font.size'] == 8
+
+        parameters_path.write_text('font.size: 12\n')
+        os.utime(parameters_path, ns=(0, 0))
+        assert sciplot.compile_theme('test_user_theme')['font.size'] == 12
+    finally:
+        parameters_path.unlink()
+
+
+def test_get_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv('SCIPLOT_CACHE_DIR', str(tmp_path))
+    assert sciplot.get_cache_dir() == str(tmp_path)
+
+
+def test_get_parameters_lst_from_parameter_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv('SCIPLOT_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(sciplot, '_parameter_cache', None)
+    parameters_lst = sciplot._get_parameters_lst(['basic', 'typesetting'])
+    assert (tmp_path / 'parameters.json').is_file()
+
+    # A new process reads the parameter cache without importing PyYAML
+    monkeypatch.setattr(sciplot, '_parameter_cache', None)
+    monkeypatch.setitem(sys.modules, 'yaml', None)
+    assert sciplot._get_parameters_lst(['basic', 'typesetting']) == parameters_lst
+
+
+def test_get_parameters_lst_with_corrupt_parameter_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv('SCIPLOT_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(sciplot, '_parameter_cache', None)
+    (tmp_path / 'parameters.json').write_text('{')
+    assert sciplot._get_parameters_lst(['no_latex']) == [{'text.usetex': False}]
+
+
 def test_color_lst_one_color():
     color_no = 1
     color_lst = ['#000000']
@@ -89,8 +221,317 @@ def test_style_locale_incorrect():
             return plt.gcf()
 
 
+def test_style_isolated_restores_changed_keys_only():
+    plt.rcParams['font.size'] = 11
+    plt.rcParams['image.origin'] = 'lower'
+    try:
+        with sciplot.style('no-latex', locale_setting='en_US.UTF-8', isolated=True):
+            assert plt.rcParams['font.size'] == 7
+        assert plt.rcParams['font.size'] == 11
+        assert plt.rcParams['image.origin'] == 'lower'
+    finally:
+        plt.style.use('default')
+
+
+def test_style_isolated_nested():
+    with sciplot.style(['no-latex', 'serif'], locale_setting='en_US.UTF-8', isolated=True):
+        with sciplot.style(['clean', 'dark'], locale_setting='en_US.UTF-8', isolated=True):
+            assert sciplot.is_dark_mode()
+            assert plt.rcParams['font.family'] == ['serif']
+            assert plt.rcParams['figure.facecolor'] == 'black'
+        assert not sciplot.is_dark_mode()
+        assert plt.rcParams['figure.facecolor'] == 'white'
+        assert plt.rcParams['font.family'] == ['serif']
+    assert plt.rcParams['font.family'] == ['sans-serif']
+    assert not sciplot._style_base_dict
+
+
+def test_style_isolated_concurrent():
+    barrier = threading.Barrier(2)
+    dark_mode_lst = []
+
+    def render(theme):
+        with sciplot.style(theme, locale_setting='en_US.UTF-8', isolated=True):
+            barrier.wait()
+            dark_mode_lst.append((theme, sciplot.is_dark_mode()))
+            barrier.wait()
+
+    thread_lst = [threading.Thread(target=render, args=(theme,)) for theme in ['dark', 'clean']]
+    for thread in thread_lst:
+        thread.start()
+    for thread in thread_lst:
+        thread.join()
+
+    assert sorted(dark_mode_lst) == [('clean', False), ('dark', True)]
+    assert plt.rcParams['figure.facecolor'] == 'white'
+    assert not sciplot._style_base_dict
+
+
+def test_collect_timings(tmp_path):
+    with sciplot.collect_timings() as timing_lst:
+        with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+            fig, ax = plt.subplots(1, 1)
+            plot_tpl = tuple(ax.plot([0, 1], [0, 1]))
+            sciplot.set_legend(ax, plot_tpl, ('Line',))
+            sciplot.save_time_stamped_figure('line', str(tmp_path), ['png', 'pdf'], fig=fig)
+            plt.close(fig)
+
+    phase_lst = [phase for phase, _ in timing_lst]
+    # A cold theme cache adds theme phases before the style phases
+    style_phase_lst = [phase for phase in phase_lst if phase.startswith('style.')]
+    assert style_phase_lst[:3] == ['style.compile_theme', 'style.locale', 'style.update_rc_params']
+    assert phase_lst[-1] == 'style.restore_rc_params'
+    for phase in [
+        'set_legend.create_legend',
+        'save_time_stamped_figure.layout',
+        'save_time_stamped_figure.savefig.png',
+        'save_time_stamped_figure.savefig.pdf'
+    ]:
+        assert phase in phase_lst
+    assert all(duration >= 0 for _, duration in timing_lst)
+    assert not sciplot._timing_callback_tpl
+
+
+def test_collect_timings_single_format(tmp_path):
+    fig = plot_line()
+    with sciplot.collect_timings() as timing_lst:
+        sciplot.save_time_stamped_figure('line', str(tmp_path), 'png', fig=fig)
+    plt.close(fig)
+
+    assert [phase for phase, _ in timing_lst] == ['save_time_stamped_figure.savefig.png']
+
+
+def test_collect_timings_nested_phases_do_not_overlap(monkeypatch):
+    compile_theme = sciplot._compile_theme
+
+    def compile_theme_with_nested_phase(theme):
+        timer = sciplot._get_phase_timer()
+        time.sleep(0.05)
+        timer.lap('theme.nested')
+        return compile_theme(theme)
+
+    monkeypatch.setattr(sciplot, '_compile_theme', compile_theme_with_nested_phase)
+    with sciplot.collect_timings() as timing_lst:
+        with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+            pass
+
+    duration_dict = dict(timing_lst)
+    assert duration_dict['theme.nested'] >= 0.05
+    assert duration_dict['style.compile_theme'] < 0.05
+
+
+def test_timing_callback_removed():
+    timing_lst = []
+
+    def callback(phase, duration):
+        timing_lst.append(phase)
+
+    sciplot.add_timing_callback(callback)
+    sciplot.remove_timing_callback(callback)
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        pass
+    assert timing_lst == []
+
+
+def test_set_legend_auto_columns():
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        fig, ax = plt.subplots(1, 1)
+        handle_lst = sciplot.get_legend_handle_lst(sciplot.get_color_lst(200, colorful=True))
+        lgnd = sciplot.set_legend(ax, tuple(handle_lst), tuple('Line ' + str(i) for i in range(200)), column_no='auto')
+        fig.canvas.draw()
+        assert sciplot._get_legend_column_no(ax, 200) > 1
+        assert lgnd.get_window_extent().height <= ax.get_window_extent().height
+        plt.close(fig)
+
+
+def test_set_legend_scatter_handles():
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        fig, ax = plt.subplots(1, 1)
+        plot_tpl = (ax.scatter([0, 1], [0, 1], s=50), ax.plot([0, 1], [1, 0])[0])
+        lgnd = sciplot.set_legend(ax, plot_tpl, ('Points', 'Line'), handle_scale_factor=7.)
+        lgnd_handle_lst = lgnd.legend_handles if hasattr(lgnd, 'legend_handles') else lgnd.legendHandles
+        assert list(lgnd_handle_lst[0].get_sizes()) == [7.]
+        plt.close(fig)
+
+
+def test_set_legend_incorrect_column_no():
+    fig, ax = plt.subplots(1, 1)
+    with pytest.raises(sciplot.SciplotException):
+        sciplot.set_legend(ax, tuple(ax.plot([0, 1], [0, 1])), ('Line',), column_no=0)
+    with pytest.raises(sciplot.SciplotException):
+        sciplot.get_legend_handle_lst(['#000000'], 'arrow')
+    plt.close(fig)
+
+
+def test_figure(tmp_path):
+    figure_no = len(plt.get_fignums())
+    memory_lst = []
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        sciplot.set_size_cm(10, 5)
+        with sciplot.figure(memory_callback=lambda peak, retained: memory_lst.append((peak, retained))) as fig:
+            ax = fig.subplots(1, 1)
+            ax.plot(np.arange(1000), np.arange(1000))
+            assert tuple(fig.get_size_inches()) == pytest.approx((10 / 2.54, 5 / 2.54))
+            plot_file_path = sciplot.save_time_stamped_figure('line', str(tmp_path))
+
+    assert Path(plot_file_path).is_file()
+    assert len(plt.get_fignums()) == figure_no
+    assert not fig.axes
+    assert sciplot._current_figure_var.get() is None
+    assert len(memory_lst) == 1 and memory_lst[0][0] > 0
+
+
+def test_figure_memory_callback_nested():
+    memory_lst = []
+    with sciplot.figure(memory_callback=lambda peak, retained: memory_lst.append(('outer', peak))):
+        buffer = bytearray(10 ** 7)
+        del buffer
+        with sciplot.figure(memory_callback=lambda peak, retained: memory_lst.append(('inner', peak))):
+            pass
+        assert tracemalloc.is_tracing()
+
+    assert not tracemalloc.is_tracing()
+    assert [name for name, _ in memory_lst] == ['inner', 'outer']
+    assert memory_lst[0][1] < 10 ** 7 <= memory_lst[1][1]
+
+
+def plot_line():
+    sciplot.set_size_cm(4)
+    fig, ax = plt.subplots(1, 1)
+    x = np.linspace(0, 1, 2)
+    ax.plot(x, x)
+    return fig
+
+
+def test_save_time_stamped_figure_with_figure(tmp_path):
+    fig = plot_line()
+    plot_file_path = sciplot.save_time_stamped_figure('line.png', str(tmp_path), fig=fig)
+    plt.close(fig)
+    assert Path(plot_file_path).is_file()
+    assert Path(plot_file_path).name.startswith('line_')
+
+
+def plot_labelled_line():
+    fig, ax = plt.subplots(1, 1)
+    ax.plot([0, 1], [0, 1])
+    ax.set_xlabel('Time / s')
+    return fig
+
+
+def test_save_time_stamped_figure_equals_savefig(tmp_path):
+    with sciplot.style('no-latex', locale_setting='C'):
+        sciplot.set_size_cm(8, 6)
+        fig = plot_labelled_line()
+        plot_file_path = sciplot.save_time_stamped_figure('line', str(tmp_path), fig=fig)
+        plt.close(fig)
+        fig = plot_labelled_line()
+        fig.savefig(str(tmp_path / 'baseline.png'), bbox_inches='tight', pad_inches=0.04)
+        plt.close(fig)
+
+    np.testing.assert_array_equal(plt.imread(plot_file_path), plt.imread(str(tmp_path / 'baseline.png')))
+
+
+def test_save_time_stamped_figure_multiple_formats_equals_single_format(tmp_path):
+    with sciplot.style('no-latex', locale_setting='C'):
+        sciplot.set_size_cm(8, 6)
+        fig = plot_labelled_line()
+        plot_file_path, _ = sciplot.save_time_stamped_figure('lines', str(tmp_path), ['png', 'pdf'], fig=fig)
+        plt.close(fig)
+        fig = plot_labelled_line()
+        single_plot_file_path = sciplot.save_time_stamped_figure('line', str(tmp_path), fig=fig)
+        plt.close(fig)
+
+    np.testing.assert_array_equal(plt.imread(plot_file_path), plt.imread(single_plot_file_path))
+
+
+def test_save_time_stamped_figure_multiple_formats(tmp_path):
+    fig = plot_line()
+    plot_file_path_lst = sciplot.save_time_stamped_figure('line.svg', str(tmp_path), ['png', 'pdf', 'svg'], fig=fig)
+    plt.close(fig)
+
+    assert [Path(plot_file_path).suffix for plot_file_path in plot_file_path_lst] == ['.png', '.pdf', '.svg']
+    assert len(set(Path(plot_file_path).stem for plot_file_path in plot_file_path_lst)) == 1
+    assert Path(plot_file_path_lst[0]).stem.startswith('line_')
+    for plot_file_path in plot_file_path_lst:
+        assert Path(plot_file_path).stat().st_size > 0
+
+
 def test_get_available_locals():
-    sciplot.get_available_locals()
+    locale_entry_lst = sciplot.get_available_locals()
+    assert locale_entry_lst[0] == sciplot.LocaleEntry('C', 'US-ASCII', 'C,POSIX', '.')
+    assert sciplot.LocaleEntry('sv_SE.UTF-8', 'UTF-8', 'Swedish,Sweden', ',') in locale_entry_lst
+
+
+def test_get_available_locals_verbose(capsys):
+    sciplot.get_available_locals(verbose=True)
+    assert 'sv_SE.UTF-8' in capsys.readouterr().out
+
+
+def test_get_locale_entry():
+    assert sciplot.get_locale_entry('sv_SE').name == 'sv_SE.UTF-8'
+    assert sciplot.get_locale_entry('en_us.utf8').name == 'en_US.UTF-8'
+    assert sciplot.get_locale_entry('C.UTF-8').name == 'C'
+    assert sciplot.get_locale_entry('de_CH').decimal_separator == '.'
+    assert sciplot.get_locale_entry('de_DE').decimal_separator == ','
+
+
+def test_get_locale_entry_system_locale(monkeypatch):
+    setlocale = locale.setlocale
+    localeconv = locale.localeconv
+    locale_setting_lst = []
+
+    # Locale that the system has, but that is missing from the catalog
+    def setlocale_with_en_dk(category, locale_setting=None):
+        if locale_setting == 'en_DK.UTF-8':
+            locale_setting_lst.append(locale_setting)
+            return locale_setting
+        return setlocale(category, locale_setting)
+
+    def localeconv_with_en_dk():
+        return dict(localeconv(), decimal_point=',' if locale_setting_lst else '.')
+
+    monkeypatch.setattr(locale, 'setlocale', setlocale_with_en_dk)
+    monkeypatch.setattr(locale, 'localeconv', localeconv_with_en_dk)
+    sciplot.get_locale_entry.cache_clear()
+    try:
+        locale_entry = sciplot.get_locale_entry('en_DK.UTF-8')
+    finally:
+        sciplot.get_locale_entry.cache_clear()
+    assert locale_entry.name == 'en_DK.UTF-8'
+    assert locale_entry.code_set == 'UTF-8'
+    assert locale_entry.decimal_separator == ','
+
+
+def test_style_locale_incorrect_does_not_change_state():
+    plt.rcParams['font.size'] = 11
+    try:
+        with pytest.raises(locale.Error):
+            with sciplot.style('no-latex', locale_setting='Undefined_local'):
+                pass
+        assert plt.rcParams['font.size'] == 11
+    finally:
+        plt.style.use('default')
+
+
+def test_style_locale_restored():
+    previous_locale_setting = locale.setlocale(locale.LC_NUMERIC)
+    with sciplot.style('no-latex', locale_setting='C'):
+        assert locale.setlocale(locale.LC_NUMERIC) == 'C'
+    assert locale.setlocale(locale.LC_NUMERIC) == previous_locale_setting
+
+
+def test_style_locale_formatter():
+    previous_locale_setting = locale.setlocale(locale.LC_NUMERIC)
+    with sciplot.style('no-latex', locale_setting='sv_SE', locale_mode='formatter'):
+        assert locale.setlocale(locale.LC_NUMERIC) == previous_locale_setting
+        fig, ax = plt.subplots(1, 1)
+        ax.plot([0, 1], [0, 1])
+        fig.canvas.draw()
+        tick_label_lst = [tick_label.get_text() for tick_label in ax.get_xticklabels()]
+        plt.close(fig)
+
+    assert '0,4' in tick_label_lst
+    assert not any('.' in tick_label for tick_label in tick_label_lst)
 
 
 @pytest.mark.mpl_image_compare
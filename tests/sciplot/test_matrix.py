@@ -0,0 +1,46 @@
+import csv
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot.matrix as matrix  # noqa: E402
+
+
+def test_get_theme_combination_lst():
+    theme_combination_lst = matrix.get_theme_combination_lst()
+    assert theme_combination_lst[0] == []
+    assert ['no-latex', 'serif', 'dark'] in theme_combination_lst
+
+    # Themes that add no parameters, e.g. the empty size themes or sans-serif on top of the default theme, are removed
+    assert ['alpha'] not in theme_combination_lst
+    assert ['sans-serif', 'dark'] not in theme_combination_lst
+    assert len(theme_combination_lst) == len(set(map(tuple, theme_combination_lst)))
+
+    # Themes are ordered like get_theme_priority_lst()
+    for theme_lst in theme_combination_lst:
+        assert theme_lst == sorted(theme_lst, key=matrix.get_theme_priority_lst().index)
+
+
+def test_get_parameter_source_key():
+    assert matrix._get_parameter_source_key(['sans-serif']) == matrix._get_parameter_source_key([])
+    assert matrix._get_parameter_source_key(['gamma', 'dark']) == matrix._get_parameter_source_key(['dark'])
+    assert matrix._get_parameter_source_key(['serif']) != matrix._get_parameter_source_key([])
+    assert matrix._get_parameter_source_key(['dark'])[1]
+
+
+def test_main(tmp_path, capsys):
+    exit_code = matrix.main([
+        str(tmp_path), '--plot', 'Line_plot', '--locale', 'en_US.UTF-8', '--latex', 'off', '--workers', '1'
+    ])
+    assert exit_code == 0
+
+    theme_name_lst = [matrix.get_theme_combination_name(theme_lst) for theme_lst in matrix.get_theme_combination_lst()]
+    for theme_name in theme_name_lst:
+        assert len(list((tmp_path / theme_name).glob('Line_plot_*.png'))) == 1
+    assert len(list(tmp_path.glob('Contact_sheet_*.png'))) == 1
+
+    with open(tmp_path / 'timings.csv', newline='', encoding='utf-8') as report_file:
+        row_lst = list(csv.DictReader(report_file))
+    assert sorted(row['theme'] for row in row_lst) == sorted(theme_name_lst)
+    assert all(float(row['total_s']) > 0 and not row['error'] for row in row_lst)
+    assert 'Contact sheet: ' in capsys.readouterr().out
@@ -0,0 +1,49 @@
+import sys
+import pytest
+import matplotlib
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot.main as sciplot  # noqa: E402
+import sciplot.palettes as palettes  # noqa: E402
+
+
+@pytest.mark.parametrize('palette_name', [
+    'cubehelix', 'cubehelix_r', 'rocket', 'mako', 'flare', 'crest', 'vlag', 'icefire_r', 'viridis', 'tab10', 'deep'
+])
+def test_get_palette_equals_seaborn(palette_name):
+    sns = pytest.importorskip('seaborn')
+    for color_no in [1, 2, 3, 5, 8, 13, 64, 300]:
+        assert palettes.get_palette(palette_name, color_no) == sns.color_palette(palette_name, color_no).as_hex()
+
+
+def test_get_palette_invalid_name():
+    with pytest.raises(ValueError):
+        palettes.get_palette('invalid_palette', 3)
+
+
+def test_color_lst_cubehelix():
+    color_lst = ['#000000', '#163d4e', '#54792f', '#d07e93']
+    assert sciplot.get_color_lst(4) == color_lst
+
+
+def test_color_lst_rocket_dark_mode():
+    color_lst = ['#4c1d4b', '#a11a5b', '#e83f3f', '#FFFFFF']
+    with sciplot.style(['dark', 'no-latex'], locale_setting='C', isolated=True):
+        assert sciplot.get_color_lst(4, seaborn_color_map='rocket') == color_lst
+
+
+def test_color_lst_is_memoized():
+    color_lst = sciplot.get_color_lst(6, seaborn_color_map='mako', colorful=True)
+    color_lst.append('#FFFFFF')
+    assert len(sciplot.get_color_lst(6, seaborn_color_map='mako', colorful=True)) == 6
+
+
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_get_colormap_without_colormap_registry(monkeypatch):
+    # Matplotlib < 3.5 has no matplotlib.colormaps
+    hex_lst = palettes._get_colormap_hex_lst('viridis', 3)
+    monkeypatch.delattr(matplotlib, 'colormaps')
+    assert palettes._get_colormap_hex_lst('viridis', 3) == hex_lst
+    with pytest.raises((KeyError, ValueError)):
+        palettes._get_colormap('no_such_colormap')
@@ -0,0 +1,25 @@
+import sys
+import matplotlib.pyplot as plt
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot  # noqa: E402
+import sciplot.samples  # noqa: E402
+
+
+def test_line_plot():
+    with sciplot.style('default', 'C', latex='off'):
+        fig = sciplot.samples.line_plot()
+        fig.canvas.draw()
+        assert len(fig.axes[0].get_lines()) == 4
+        assert len(fig.axes[0].get_legend().get_texts()) == 4
+        plt.close(fig)
+
+
+def test_histogram_plot(tmp_path):
+    with sciplot.style('default', 'C', latex='off'):
+        fig = sciplot.samples.histogram_plot(sample_no=100)
+        plot_file_path = sciplot.save_time_stamped_figure('histogram', str(tmp_path), fig=fig)
+        plt.close(fig)
+
+    assert Path(plot_file_path).stat().st_size > 0
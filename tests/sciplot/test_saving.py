@@ -0,0 +1,106 @@
+import asyncio
+import re
+import sys
+import threading
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot  # noqa: E402
+
+
+def get_figure():
+    fig = Figure(figsize=(2, 2), dpi=50)
+    ax = fig.subplots(1, 1)
+    x = np.linspace(0, 1, 2)
+    ax.plot(x, 2 * x)
+    return fig
+
+
+def test_figure_writer(tmp_path):
+    with sciplot.FigureWriter(max_queue_size=2, workers=2) as writer:
+        future_lst = [writer.submit(get_figure(), 'line_' + str(i), str(tmp_path)) for i in range(5)]
+        plot_file_path_lst = [future.result() for future in future_lst]
+
+    for i, plot_file_path in enumerate(plot_file_path_lst):
+        assert Path(plot_file_path).name.startswith('line_' + str(i) + '_')
+        assert Path(plot_file_path).read_bytes().startswith(b'\x89PNG')
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_figure_writer_with_processes(tmp_path):
+    with sciplot.FigureWriter(workers=1, use_processes=True) as writer:
+        fig, ax = plt.subplots(1, 1)
+        ax.plot([0, 1], [0, 1])
+        plot_file_path = writer.submit(fig, 'line.pdf', str(tmp_path), file_type='pdf').result()
+        plt.close(fig)
+
+    assert Path(plot_file_path).read_bytes().startswith(b'%PDF')
+
+
+def test_save_time_stamped_figure_background(tmp_path):
+    plot_file_path = sciplot.save_time_stamped_figure_background(get_figure(), 'line', str(tmp_path)).result()
+    assert Path(plot_file_path).is_file()
+
+
+def test_save_time_stamped_figure_async(tmp_path):
+    async def save():
+        return await asyncio.gather(*[
+            sciplot.save_time_stamped_figure_async(get_figure(), 'line_' + str(i), str(tmp_path), file_type='svg')
+            for i in range(3)
+        ])
+
+    for plot_file_path in asyncio.run(save()):
+        assert Path(plot_file_path).suffix == '.svg'
+        assert Path(plot_file_path).is_file()
+
+
+def test_figure_writer_keeps_style_context(tmp_path):
+    for use_processes in (False, True):
+        with sciplot.style('no-latex', locale_setting='sv_SE', locale_mode='formatter'):
+            with plt.rc_context({'svg.fonttype': 'none'}):
+                fig = get_figure()
+                with sciplot.FigureWriter(workers=1, use_processes=use_processes) as writer:
+                    plot_file_path = writer.submit(fig, 'line', str(tmp_path), file_type='svg').result()
+
+        svg = Path(plot_file_path).read_text(encoding='utf-8')
+        assert '>0,5<' in svg
+        assert '>0.5<' not in svg
+
+
+def get_svg_width(plot_file_path):
+    return re.search(r'<svg[^>]* width="([0-9.]+pt)"', Path(plot_file_path).read_text(encoding='utf-8')).group(1)
+
+
+def test_figure_writer_encodes_after_style_context(tmp_path):
+    for use_processes in (False, True):
+        encode_event = threading.Event()
+        with sciplot.FigureWriter(workers=1, use_processes=use_processes) as writer:
+            with sciplot.style('no-latex', locale_setting='sv_SE', locale_mode='formatter'):
+                with plt.rc_context({'svg.fonttype': 'none'}):
+                    sync_plot_file_path = sciplot.save_time_stamped_figure(
+                        'sync', str(tmp_path), 'svg', fig=get_figure())
+                    if not use_processes:
+                        # The figure is only encoded after the style context has exited
+                        writer._executor.submit(encode_event.wait)
+                    future = writer.submit(get_figure(), 'line', str(tmp_path), file_type='svg')
+            encode_event.set()
+            plot_file_path = future.result()
+
+        assert '>0,5<' in Path(plot_file_path).read_text(encoding='utf-8')
+        assert get_svg_width(plot_file_path) == get_svg_width(sync_plot_file_path)
+
+
+def test_save_time_stamped_figure_async_keeps_style_context(tmp_path):
+    async def save():
+        with sciplot.style('no-latex', locale_setting='sv_SE', locale_mode='formatter'):
+            with plt.rc_context({'svg.fonttype': 'none'}):
+                with sciplot.FigureWriter(workers=1) as writer:
+                    return await sciplot.save_time_stamped_figure_async(
+                        get_figure(), 'line', str(tmp_path), file_type='svg', writer=writer)
+
+    svg = Path(asyncio.run(save())).read_text(encoding='utf-8')
+    assert '>0,5<' in svg
+    assert '>0.5<' not in svg
@@ -0,0 +1,92 @@
+import sys
+import numpy as np
+import matplotlib.pyplot as plt
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot  # noqa: E402
+
+
+def build_line_plot(fig):
+    ax = fig.subplots(1, 1)
+    ax.set_xlim(0, 9)
+    ax.set_ylim(-10, 10)
+    ax.set_xlabel('Time')
+    line, = ax.plot([], [], color=sciplot.get_color_lst(1)[0])
+    sciplot.set_legend(ax, (line,), ('Signal',), loc='upper left')
+    return line,
+
+
+def get_template():
+    return sciplot.FigureTemplate(build_line_plot, theme='no-latex', locale_setting='C', size=(8, 6))
+
+
+def test_figure_template_blits_within_limits():
+    template = get_template()
+    line, = template.artist_tpl
+    for i in range(3):
+        line.set_data(np.arange(10), i * np.sin(np.arange(10)))
+        frame = template.render()
+    assert template._full_draw_no == 1
+    assert frame.shape[2] == 4
+
+    # Changed limits redraw the background
+    template.fig.axes[0].set_ylim(-20, 20)
+    template.render()
+    assert template._full_draw_no == 2
+    template.close()
+
+
+def build_autoscaled_line_plot(fig):
+    ax = fig.subplots(1, 1)
+    return tuple(ax.plot([], []))
+
+
+def test_figure_template_autoscale():
+    template = sciplot.FigureTemplate(build_autoscaled_line_plot, theme='no-latex', locale_setting='C', autoscale=True)
+    line, = template.artist_tpl
+    line.set_data(np.arange(10), 100 * np.arange(10))
+    template.render()
+    assert template.fig.axes[0].get_ylim()[1] >= 900
+    template.close()
+
+
+def test_figure_template_blitted_frame_matches_full_draw():
+    template = get_template()
+    line, = template.artist_tpl
+    line.set_data(np.arange(10), np.arange(10))
+    template.render()
+    line.set_data(np.arange(10), -np.arange(10))
+    blitted_frame = template.render().copy()
+
+    template._background = None
+    assert np.array_equal(blitted_frame, template.render())
+    template.close()
+
+
+def test_figure_template_save(tmp_path):
+    template = get_template()
+    line, = template.artist_tpl
+    line.set_data(np.arange(10), np.arange(10))
+    plot_file_path = template.save('line', str(tmp_path))
+    pdf_file_path = template.save('line', str(tmp_path), 'pdf')
+
+    # Same size as a figure saved with a tight bounding box
+    artist_tpl = (line, template.fig.axes[0].get_legend())
+    with template.styled():
+        for artist in artist_tpl:
+            artist.set_animated(False)
+        reference_file_path = sciplot.save_time_stamped_figure('reference', str(tmp_path), fig=template.fig)
+        for artist in artist_tpl:
+            artist.set_animated(True)
+
+    image = plt.imread(plot_file_path)
+    reference_image = plt.imread(reference_file_path)
+    assert abs(image.shape[0] - reference_image.shape[0]) <= 2
+    assert abs(image.shape[1] - reference_image.shape[1]) <= 2
+    # The same amount of ink, since the images may be offset by a pixel
+    ink = np.mean(1 - image[:, :, :3])
+    reference_ink = np.mean(1 - reference_image[:, :, :3])
+    assert abs(ink - reference_ink) < 0.1 * reference_ink
+    assert Path(pdf_file_path).stat().st_size > 0
+    template.close()
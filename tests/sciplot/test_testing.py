@@ -0,0 +1,138 @@
+import itertools
+import json
+import sys
+import numpy as np
+import matplotlib.pyplot as plt
+import pytest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot.main as sciplot  # noqa: E402
+import sciplot.testing as testing  # noqa: E402
+
+
+def plot_lines(line_no=3, offset=0.):
+    fig, ax = plt.subplots(1, 1)
+    for i in range(line_no):
+        ax.plot([0, 1, 2], [offset, i, 2 * i])
+    ax.set_xlabel('Time / s')
+    return fig
+
+
+def get_theme_matrix_job_lst():
+    theme_matrix = itertools.product([[], ['gamma']], [[], ['serif'], ['sans-serif']], [[], ['dark']])
+    job_lst = []
+    for theme_tpl in theme_matrix:
+        theme_lst = ['no-latex'] + [theme for theme_lst in theme_tpl for theme in theme_lst]
+        job_lst.append(testing.ImageJob('plot_lines_' + '_'.join(theme_lst), plot_lines, theme_lst))
+    return job_lst
+
+
+def test_get_image_hashes():
+    image_ar = np.zeros((40, 60, 4), dtype=np.uint8)
+    image_ar[:, 30:] = 255
+    hashes = testing.get_image_hashes(image_ar)
+    assert hashes == testing.get_image_hashes(image_ar.copy())
+    assert len(hashes.perceptual) == testing._HASH_SIZE ** 2 // 4
+
+    # A single changed pixel changes the exact hash but not the perceptual hash
+    changed_image_ar = image_ar.copy()
+    changed_image_ar[0, 0] = 1
+    changed_hashes = testing.get_image_hashes(changed_image_ar)
+    assert changed_hashes.exact != hashes.exact
+    assert testing.get_perceptual_distance(changed_hashes.perceptual, hashes.perceptual) == 0
+
+    # Mirrored images have different perceptual hashes
+    mirrored_hashes = testing.get_image_hashes(image_ar[:, ::-1])
+    assert testing.get_perceptual_distance(mirrored_hashes.perceptual, hashes.perceptual) > 0
+
+
+def test_hash_library_round_trip(tmp_path):
+    hash_library_path = tmp_path / 'hashes.json'
+    assert testing.load_hash_library(hash_library_path) == {}
+
+    hash_dict = {'b': testing.FigureHashes('1', '2'), 'a': testing.FigureHashes('3', '4')}
+    testing.save_hash_library(hash_library_path, hash_dict)
+    assert testing.load_hash_library(hash_library_path) == hash_dict
+    assert list(json.loads(hash_library_path.read_text())['hashes']) == ['a', 'b']
+
+    hash_library_path.write_text(json.dumps({'version': 0, 'hashes': {}}))
+    with pytest.raises(sciplot.SciplotException):
+        testing.load_hash_library(hash_library_path)
+
+
+def test_compare_image(tmp_path):
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        png_bytes = testing.get_figure_png(plot_lines())
+        changed_png_bytes = testing.get_figure_png(plot_lines(offset=0.01))
+        other_png_bytes = testing.get_figure_png(plot_lines(line_no=8, offset=-5.))
+        plt.close('all')
+
+    (tmp_path / 'plot_lines.png').write_bytes(png_bytes)
+    hash_dict = {'plot_lines': testing.get_image_hashes(testing._get_image_ar(png_bytes))}
+
+    assert testing.compare_image('plot_lines', png_bytes, hash_dict, tmp_path).status == 'exact'
+    assert testing.compare_image('other', png_bytes, hash_dict, tmp_path).status == 'missing'
+
+    # Small changes fall back to the pixel comparison with the baseline image
+    comparison = testing.compare_image('plot_lines', changed_png_bytes, hash_dict, tmp_path)
+    assert comparison.rms is not None
+    assert comparison.status == ('similar' if comparison.rms <= 2. else 'different')
+    comparison = testing.compare_image('plot_lines', changed_png_bytes, hash_dict, tmp_path, tolerance=0.)
+    assert comparison.status == 'different'
+    assert not comparison.passed
+
+    # Without a baseline image, figures that are not identical are not passed
+    comparison = testing.compare_image('plot_lines', other_png_bytes, hash_dict)
+    assert comparison.status == 'unverified'
+    assert not comparison.passed
+
+
+def test_compare_image_changed_label(tmp_path):
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        png_bytes = testing.get_figure_png(plot_lines())
+        fig = plot_lines()
+        fig.axes[0].set_xlabel('Time / ms')
+        changed_png_bytes = testing.get_figure_png(fig)
+        plt.close('all')
+
+    hash_dict = {'plot_lines': testing.get_image_hashes(testing._get_image_ar(png_bytes))}
+    assert not testing.compare_image('plot_lines', changed_png_bytes, hash_dict).passed
+
+    (tmp_path / 'plot_lines.png').write_bytes(png_bytes)
+    comparison = testing.compare_image('plot_lines', changed_png_bytes, hash_dict, tmp_path)
+    assert comparison.status == 'different'
+    assert comparison.rms > 2.
+
+
+def test_compare_figures_theme_matrix(tmp_path):
+    hash_library_path = tmp_path / 'hashes.json'
+    baseline_dir = tmp_path / 'baseline'
+    job_lst = get_theme_matrix_job_lst()
+
+    comparison_lst = testing.compare_figures(
+        job_lst, hash_library_path, baseline_dir, locale_setting='en_US.UTF-8', workers=2, generate=True)
+    assert [comparison.name for comparison in comparison_lst] == [job.name for job in job_lst]
+    assert all(comparison.status == 'generated' for comparison in comparison_lst)
+    assert len(testing.load_hash_library(hash_library_path)) == len(job_lst)
+    assert len(list(baseline_dir.glob('*.png'))) == len(job_lst)
+
+    # Figures rendered in other processes are identical, so no pixels are compared
+    comparison_lst = testing.compare_figures(
+        job_lst, hash_library_path, baseline_dir, locale_setting='en_US.UTF-8', workers=2)
+    assert all(comparison.status == 'exact' for comparison in comparison_lst)
+
+    # Light and dark themes are far apart
+    hash_dict = testing.load_hash_library(hash_library_path)
+    light_hashes = hash_dict['plot_lines_no-latex']
+    dark_hashes = hash_dict['plot_lines_no-latex_dark']
+    assert testing.get_perceptual_distance(light_hashes.perceptual, dark_hashes.perceptual) > 10
+
+
+def test_compare_figures_in_process(tmp_path):
+    job_lst = [('plot_lines', plot_lines, 'no-latex', (2,))]
+    hash_library_path = tmp_path / 'hashes.json'
+    testing.compare_figures(job_lst, hash_library_path, locale_setting='en_US.UTF-8', workers=1, generate=True)
+    comparison, = testing.compare_figures(job_lst, hash_library_path, locale_setting='en_US.UTF-8', workers=1)
+    assert comparison.passed
+    assert comparison.status == 'exact'
@@ -0,0 +1,52 @@
+import shutil
+import sys
+import pytest
+import matplotlib
+from matplotlib.texmanager import TexManager
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot.main  # noqa: E402
+import sciplot.tex as tex  # noqa: E402
+
+
+def get_tex_manager_cache_dir():
+    return getattr(TexManager, '_texcache', getattr(TexManager, 'texcache', None))
+
+
+def test_get_tex_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv('SCIPLOT_CACHE_DIR', str(tmp_path))
+    assert tex.get_tex_cache_dir() == str(tmp_path / 'tex.cache')
+
+
+def test_use_tex_cache(tmp_path):
+    tex_cache_dir_old = get_tex_manager_cache_dir()
+    try:
+        assert tex.use_tex_cache(str(tmp_path / 'tex')) == str(tmp_path / 'tex')
+        assert get_tex_manager_cache_dir() == str(tmp_path / 'tex')
+        assert (tmp_path / 'tex').is_dir()
+    finally:
+        tex.use_tex_cache(tex_cache_dir_old)
+
+
+def test_get_font_size_lst():
+    rc_params = dict(matplotlib.rcParams)
+    rc_params.update(matplotlib.RcParams(sciplot.main.compile_theme()))
+    assert tex._get_font_size_lst(rc_params) == [6., 7., 9., 10.]
+
+
+def test_warm_tex_cache_without_usetex(tmp_path):
+    assert tex.warm_tex_cache(['$x$'], theme='no-latex', tex_cache_dir=str(tmp_path)) == []
+    assert not list((tmp_path).iterdir())
+
+
+@pytest.mark.skipif(shutil.which('latex') is None or shutil.which('dvipng') is None, reason='requires LaTeX')
+def test_warm_tex_cache(tmp_path):
+    tex_cache_dir_old = get_tex_manager_cache_dir()
+    try:
+        label_lst = [r'Velocity (\si{\metre\per\second})', r'$\alpha=1$']
+        assert tex.warm_tex_cache(label_lst, tex_cache_dir=str(tmp_path), workers=2) == []
+        assert list(tmp_path.rglob('*.dvi'))
+        assert list(tmp_path.rglob('*.png'))
+    finally:
+        tex.use_tex_cache(tex_cache_dir_old)
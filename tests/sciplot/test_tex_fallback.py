@@ -0,0 +1,74 @@
+import sys
+import pytest
+import numpy as np
+import matplotlib.pyplot as plt
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot.main as sciplot  # noqa: E402
+import sciplot.tex_fallback as tex_fallback  # noqa: E402
+
+
+@pytest.mark.parametrize('tex, mathtext', [
+    (r'Velocity (\si{\metre\per\second})', r'Velocity ($\mathrm{m}/\mathrm{s}$)'),
+    (r'Histogram with \SI{10000}{} samples', r'Histogram with $10000$ samples'),
+    (r'\SI{9.81}{\metre\per\second\squared}', r'$9.81\,\mathrm{m}/\mathrm{s}^{2}$'),
+    (r'\SI{3}{\micro\metre}', r'$3\,\mu\mathrm{m}$'),
+    (r'\SI{20}{\celsius}', r'$20^{\circ}\mathrm{C}$'),
+    (r'\SI{1.5e3}{\kilo\ohm}', r'$1.5 \times 10^{3}\,\mathrm{k}\Omega$'),
+    (r'\si{kg.m/s}', r'$\mathrm{kg}\,\mathrm{m/s}$'),
+    (r'$\dv{f}{x}$', r'$\frac{\mathrm{d} f}{\mathrm{d} x}$'),
+    (r'$\pdv[2]{u}{t}$', r'$\frac{\partial^{2} u}{\partial t^{2}}$'),
+    (r'$\pdv{f}{x}{y}$', r'$\frac{\partial^{2} f}{\partial x \partial y}$'),
+    (r'$\abs{x} + \norm{\vb{r}}$', r'$\left|x\right| + \left\Vert \mathbf{r}\right\Vert$'),
+    (r'$\dd x$', r'$\mathrm{d} x$'),
+    (r'$p(x \,|\, x_\mathrm{m})$', r'$p(x \,|\, x_\mathrm{m})$'),
+    (r'Costs \$5', r'Costs \$5'),
+])
+def test_translate_tex(tex, mathtext):
+    with plt.rc_context({'text.latex.preamble': ''}):
+        assert tex_fallback.translate_tex(tex) == mathtext
+
+
+def test_translate_tex_decimal_comma():
+    with sciplot.style(locale_setting='en_US.UTF-8', latex='off'):
+        assert tex_fallback.translate_tex(r'$\mu=\SI{4.5}{}$') == r'$\mu=4{,}5$'
+
+
+def test_style_latex_off():
+    with sciplot.style(locale_setting='en_US.UTF-8', latex='off'):
+        assert not plt.rcParams['text.usetex']
+        fig, ax = plt.subplots(1, 1)
+        x = np.linspace(0, 1, 2)
+        ax.plot(x, 2 * x)
+        ax.set_xlabel(r'Velocity (\si{\metre\per\second})')
+        fig.suptitle(r'Histogram with \SI{10000}{} samples')
+        fig.canvas.draw()
+        plt.close(fig)
+    assert ax.get_xlabel() == r'Velocity ($\mathrm{m}/\mathrm{s}$)'
+
+    # Text outside of the style context is not translated
+    fig, ax = plt.subplots(1, 1)
+    ax.set_xlabel(r'\si{\metre}')
+    assert ax.get_xlabel() == r'\si{\metre}'
+    plt.close(fig)
+
+
+def test_style_latex_auto(monkeypatch):
+    monkeypatch.setattr(tex_fallback, '_is_tex_available', lambda: False)
+    with sciplot.style(locale_setting='en_US.UTF-8', latex='auto'):
+        assert not plt.rcParams['text.usetex']
+
+
+def test_style_no_latex_theme_translates():
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8', latex='on'):
+        fig, ax = plt.subplots(1, 1)
+        ax.set_xlabel(r'Velocity (\si{\metre\per\second})')
+        plt.close(fig)
+    assert ax.get_xlabel() == r'Velocity ($\mathrm{m}/\mathrm{s}$)'
+
+
+def test_style_latex_invalid():
+    with pytest.raises(sciplot.SciplotException):
+        with sciplot.style(locale_setting='en_US.UTF-8', latex='maybe'):
+            pass
@@ -0,0 +1,96 @@
+import io
+import sys
+import numpy as np
+import matplotlib.pyplot as plt
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / '..' / '..'))
+import sciplot.main as sciplot  # noqa: E402
+import sciplot.text_cache as text_cache  # noqa: E402
+
+
+def render_legend_plot():
+    fig, ax = plt.subplots(1, 1)
+    for i in range(10):
+        ax.plot([0, 1], [0, i])
+    ax.set_xlabel(r'Time $t$ / s')
+    sciplot.set_legend(ax, tuple(ax.lines), tuple('Line ' + str(i) for i in range(10)))
+    plot_buffer = io.BytesIO()
+    fig.savefig(plot_buffer, format='png', bbox_inches='tight')
+    plt.close(fig)
+    return plot_buffer.getvalue()
+
+
+def test_text_extent_cache_shared_between_figures():
+    text_cache.clear_text_extent_cache()
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        plot_bytes = render_legend_plot()
+        miss_no = text_cache.get_text_extent_cache_info().misses
+        assert render_legend_plot() == plot_bytes
+
+    cache_info = text_cache.get_text_extent_cache_info()
+    assert cache_info.misses == miss_no
+    assert cache_info.hits > 0
+
+
+def test_text_extent_cache_same_output():
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        cached_plot_bytes = render_legend_plot()
+        token = text_cache._text_extent_cache_var.set(False)
+        try:
+            plot_bytes = render_legend_plot()
+        finally:
+            text_cache._text_extent_cache_var.reset(token)
+
+    assert cached_plot_bytes == plot_bytes
+
+
+def test_text_extent_cache_only_in_style_context():
+    text_cache.clear_text_extent_cache()
+    render_legend_plot()
+    assert text_cache.get_text_extent_cache_info().currsize == 0
+
+
+def test_text_extent_cache_rc_key():
+    with plt.rc_context({'mathtext.fontset': 'dejavusans'}):
+        rc_key = text_cache._get_rc_key(True)
+        assert text_cache._get_rc_key(False) == text_cache._get_rc_key(False)
+    with plt.rc_context({'mathtext.fontset': 'cm'}):
+        assert text_cache._get_rc_key(True) != rc_key
+    with plt.rc_context({'text.latex.preamble': r'\usepackage{siunitx}'}):
+        assert text_cache._get_rc_key('TeX') != text_cache._get_rc_key(True)
+
+
+def test_text_extent_cache_bounded(monkeypatch):
+    monkeypatch.setattr(text_cache, '_TEXT_EXTENT_CACHE_SIZE', 5)
+    text_cache.clear_text_extent_cache()
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        fig, ax = plt.subplots(1, 1)
+        ax.set_xticks(np.arange(20))
+        fig.canvas.draw()
+        plt.close(fig)
+
+    assert text_cache.get_text_extent_cache_info().currsize == 5
+
+
+def test_text_extent_cache_font_family_lst():
+    def get_text_width():
+        fig, ax = plt.subplots(1, 1)
+        text = ax.text(0, 0, 'Font family list', family='sans-serif')
+        fig.canvas.draw()
+        width = text.get_window_extent().width
+        plt.close(fig)
+        return width
+
+    with sciplot.style('no-latex', locale_setting='en_US.UTF-8'):
+        with plt.rc_context({'font.sans-serif': ['DejaVu Sans']}):
+            get_text_width()
+        with plt.rc_context({'font.sans-serif': ['DejaVu Sans Mono']}):
+            cached_width = get_text_width()
+            token = text_cache._text_extent_cache_var.set(False)
+            try:
+                width = get_text_width()
+            finally:
+                text_cache._text_extent_cache_var.reset(token)
+
+    assert cached_width == width